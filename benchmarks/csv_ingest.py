@@ -0,0 +1,56 @@
+"""
+Compares the two ways read_csv_table can read a CSV: with dtype=str (the default), and with a python
+converter for every cell (use_converters=True, how files used to be read).
+
+Large Episodes and Reviews files are made by repeating the rows of the files in tests/fake_data.
+Both readers are checked to give identical tables before they are timed.
+
+    python -m benchmarks.csv_ingest --rows 500000 --repeats 3
+"""
+import argparse
+from io import BytesIO
+from pathlib import Path
+from timeit import repeat
+
+import pandas as pd
+
+from lac_validator.ingress import read_csv_table
+
+FAKE_DATA = Path(__file__).parent.parent / "tests" / "fake_data"
+
+
+def make_csv(file_name: str, rows: int) -> bytes:
+    """Repeats the rows of a fake data file until it has the given number of rows."""
+    header, *lines = (FAKE_DATA / file_name).read_bytes().splitlines()
+    lines = (lines * (rows // len(lines) + 1))[:rows]
+    return b"\n".join([header] + lines) + b"\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for file_name in ["episodes.csv", "reviews.csv"]:
+        content = make_csv(file_name, args.rows)
+        pd.testing.assert_frame_equal(
+            read_csv_table(BytesIO(content)),
+            read_csv_table(BytesIO(content), use_converters=True),
+        )
+        for use_converters in [True, False]:
+            seconds = min(
+                repeat(
+                    lambda: read_csv_table(
+                        BytesIO(content), use_converters=use_converters
+                    ),
+                    number=1,
+                    repeat=args.repeats,
+                )
+            )
+            reader = "converters" if use_converters else "dtype=str"
+            print(f"{file_name} ({args.rows} rows), {reader}: {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
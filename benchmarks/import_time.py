@@ -0,0 +1,46 @@
+"""
+Times the cold start of the command line: importing lac_validator.__main__ in a fresh interpreter, as every
+command does before it runs. Also checks that the import leaves the reference data (authorities and postcodes)
+unloaded, as only the commands that validate need it.
+
+Exits with an error if the fastest import takes longer than --max-seconds, so it can guard start up time.
+
+    python -m benchmarks.import_time --repeats 5 --max-seconds 2
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+IMPORT_CHECK = """
+import sys
+import lac_validator.__main__
+import lac_validator.datastore as datastore
+
+assert datastore._la_df is None, "authorities were loaded on import"
+assert datastore._postcodes is None, "postcodes were initialised on import"
+assert "qlacref_postcodes" not in sys.modules, "qlacref_postcodes was imported"
+"""
+
+
+def import_seconds() -> float:
+    """Imports the command line in a new interpreter, and returns how long the interpreter took."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", IMPORT_CHECK], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    seconds = min(import_seconds() for _ in range(args.repeats))
+    print(f"import lac_validator.__main__: {seconds:.3f}s")
+    if args.max_seconds is not None and seconds > args.max_seconds:
+        sys.exit(f"Cold start took {seconds:.3f}s, more than {args.max_seconds}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Times each stage of a validation on synthetic returns (see benchmarks/synthetic.py), and saves the timings as
+JSON so they can be compared between commits.
+
+The stages are reading the uploads (ingest), create_datastore, the full validation with each registry, building
+the Report from its results, and create_issue_df. A validation is timed from its LacValidator being created,
+so it includes reading the uploads again; rules is the time spent in the rules themselves, from rule_profile.
+
+    python -m benchmarks.pipeline --children 1000 10000 --output before.json
+    python -m benchmarks.pipeline --children 1000 10000 --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_return, to_csv_uploads, to_xml
+from lac_validator.datastore import create_datastore
+from lac_validator.ingress import read_from_text
+from lac_validator.lac_validator import LacValidator, create_issue_df
+from lac_validator.report import Report
+from lac_validator.rules.ruleset_utils import get_ruleset
+
+RULESETS = ["lac2022_23", "lac2023_24", "lac2024_25"]
+
+
+def timed(function: Callable[[], Any]) -> tuple[Any, float]:
+    """Calls function, and returns its result and the seconds it took."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def benchmark(
+    children: int,
+    rulesets: List[str],
+    file_format: str = "csv",
+    seed: int = 0,
+    collection_year: int = 2023,
+) -> List[Dict[str, Any]]:
+    """
+    Times the stages of validating one synthetic return.
+
+    :param int children: the number of children in the return.
+    :param list rulesets: the rulesets to validate with, e.g. ['lac2022_23'].
+    :param str file_format: 'csv', to upload this year's and last year's tables as CSVs, or 'xml', to
+        upload this year's as XML.
+    :param int seed: seed for the synthetic data.
+    :param int collection_year: the year the collection ends in.
+    :return: one result per stage, with the stage, the ruleset it used (if any) and the seconds it took.
+    """
+    tables = generate_return(children, seed, collection_year)
+    if file_format == "xml":
+        uploads = [
+            {
+                "name": "return.xml",
+                "file_content": to_xml(tables),
+                "description": "This year",
+            }
+        ]
+    else:
+        uploads = to_csv_uploads(tables)
+    metadata = {"collectionYear": str(collection_year), "localAuthority": "E09000027"}
+
+    results = []
+
+    def record(stage: str, seconds: float, ruleset: Optional[str] = None):
+        results.append({"stage": stage, "ruleset": ruleset, "seconds": seconds})
+        print(f"{children} children, {stage} {ruleset or ''}: {seconds:.3f}s")
+
+    (dfs, metadata_extras), seconds = timed(lambda: read_from_text(uploads))
+    record("ingest", seconds)
+    _, seconds = timed(lambda: create_datastore(dfs, {**metadata, **metadata_extras}))
+    record("create_datastore", seconds)
+
+    for ruleset in rulesets:
+        registry = get_ruleset(ruleset)
+        validator, seconds = timed(
+            lambda: LacValidator(
+                metadata=dict(metadata), files=uploads, registry=registry
+            )
+        )
+        record("validate", seconds, ruleset)
+        record("rules", float(validator.rule_profile["WallTime"].sum()), ruleset)
+        report, seconds = timed(lambda: Report(validator.ds_results, registry))
+        record("report", seconds, ruleset)
+        _, seconds = timed(lambda: create_issue_df(report.report, report.error_report))
+        record("create_issue_df", seconds, ruleset)
+    return results
+
+
+def git_commit() -> Optional[str]:
+    """The commit being benchmarked, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path):
+    """Prints each timing next to the same timing from an earlier run."""
+    baseline = json.loads(baseline_path.read_text())
+    keys = ["children", "format", "stage", "ruleset"]
+    merged = pd.DataFrame(results).merge(
+        pd.DataFrame(baseline["results"]),
+        on=keys,
+        how="left",
+        suffixes=("", "_baseline"),
+    )
+    merged["ratio"] = merged["seconds"] / merged["seconds_baseline"]
+    print(f"Compared with {baseline.get('commit')} ({baseline_path}):")
+    print(merged.to_string(index=False, float_format="{:.3f}".format))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--children", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--rulesets", nargs="+", default=RULESETS)
+    parser.add_argument("--format", choices=["csv", "xml"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = []
+    for children in args.children:
+        for result in benchmark(children, args.rulesets, args.format, args.seed):
+            results.append({"children": children, "format": args.format, **result})
+
+    if args.output is not None:
+        run = {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "seed": args.seed,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(run, indent=2))
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
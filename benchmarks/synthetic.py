@@ -0,0 +1,438 @@
+"""
+Generates synthetic SSDA903 returns, with every table in config.column_names, for benchmarking.
+
+The data is random but seeded, so the same arguments always give the same files. Values are drawn from the
+codes the validation rules expect, with dates around the collection year, so most rules have work to do and
+some of them find errors. Each child has one to four episodes, and some children appear in each of the other
+tables. The previous year's return (the _last tables) is generated for an overlapping set of children.
+
+Write the CSVs, and this year's return as XML, for 10,000 children with:
+
+    python -m benchmarks.synthetic --children 10000 --out synthetic_data --xml
+"""
+import argparse
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from lac_validator.config import code_columns, column_names
+from lac_validator.types import UploadedFile
+
+# the CSV file each table is written to, as in tests/fake_data.
+FILE_NAMES = {
+    "Header": "header.csv",
+    "Episodes": "episodes.csv",
+    "Reviews": "reviews.csv",
+    "UASC": "uasc.csv",
+    "OC2": "oc2.csv",
+    "OC3": "oc3.csv",
+    "AD1": "ad1.csv",
+    "PlacedAdoption": "placed_for_adoption.csv",
+    "PrevPerm": "previous_permanence.csv",
+    "Missing": "missing.csv",
+    "SWEpisodes": "sw_episodes.csv",
+}
+
+# postcode areas to build postcodes from; many of the postcodes are real, the rest aren't found.
+POSTCODE_AREAS = ["B", "BS", "CF", "E", "G", "L", "LS", "M", "N", "NE", "S", "SW"]
+POSTCODE_LETTERS = list("ABDEFGHJLNPQRSTUWXYZ")
+
+OC3_ACCOM = ["B1", "B2", "C1", "C2", "D1", "D2", "E1", "E2", "G1", "G2", "H1", "H2"]
+OC3_ACCOM += ["K1", "K2", "R1", "R2", "S2", "T1", "T2", "U1", "U2", "V1", "V2"]
+OC3_ACCOM += ["W1", "W2", "X2", "Y1", "Y2", "Z1", "Z2", "0"]
+
+
+class _Draw:
+    """
+    Draws the values of one year's return, as object arrays of strings with NaN for blanks.
+
+    :param Generator rng: the random generator to draw from.
+    :param int collection_year: the year the collection ends in, e.g. 2023 for 2022/23.
+    """
+
+    def __init__(self, rng: np.random.Generator, collection_year: int):
+        self.rng = rng
+        # dates are drawn as days since epoch, and formatted by looking them up in day_strings.
+        self.epoch = date(collection_year - 30, 1, 1)
+        days = (date(collection_year + 30, 1, 1) - self.epoch).days
+        self.day_strings = np.array(
+            [
+                (self.epoch + timedelta(days=day)).strftime("%d/%m/%Y")
+                for day in range(days)
+            ],
+            dtype=object,
+        )
+        self.start = self.day(date(collection_year - 1, 4, 1))
+        self.end = self.day(date(collection_year, 3, 31))
+
+    def day(self, when: date) -> int:
+        return (when - self.epoch).days
+
+    def dates(self, days: np.ndarray) -> np.ndarray:
+        return self.day_strings[np.clip(days, 0, len(self.day_strings) - 1)]
+
+    def codes(self, codes: List[str], size: int, blank: float = 0.0) -> np.ndarray:
+        """Draws size codes, leaving a share of them, blank, as NaN."""
+        return self.blank(self.rng.choice(np.array(codes, dtype=object), size), blank)
+
+    def blank(self, values: np.ndarray, share: float) -> np.ndarray:
+        values = values.astype(object)
+        if share > 0:
+            values[self.rng.random(len(values)) < share] = np.nan
+        return values
+
+    def digits(self, prefix: str, size: int, width: int) -> np.ndarray:
+        numbers = np.char.zfill(
+            self.rng.integers(0, 10**width, size).astype(str), width
+        )
+        return prefix + numbers.astype(object)
+
+    def postcodes(self, size: int) -> np.ndarray:
+        letters = np.array(POSTCODE_LETTERS, dtype=object)
+        return (
+            self.rng.choice(np.array(POSTCODE_AREAS, dtype=object), size)
+            + self.rng.integers(1, 30, size).astype(str).astype(object)
+            + " "
+            + self.rng.integers(0, 10, size).astype(str).astype(object)
+            + self.rng.choice(letters, size)
+            + self.rng.choice(letters, size)
+        )
+
+
+def _where(condition: np.ndarray, values) -> np.ndarray:
+    """values where condition is True, and NaN elsewhere, as an object array."""
+    out = np.full(len(condition), np.nan, dtype=object)
+    out[condition] = np.broadcast_to(np.asarray(values, dtype=object), len(condition))[
+        condition
+    ]
+    return out
+
+
+def _rows_per_child(rng: np.random.Generator, n: int, low: int, high: int):
+    """
+    Gives each of n children between low and high - 1 rows.
+
+    :return: the child (position) of each row, and each row's number within its child.
+    """
+    counts = rng.integers(low, high, n)
+    child = np.repeat(np.arange(n), counts)
+    first_row = np.repeat(np.cumsum(counts) - counts, counts)
+    return child, np.arange(len(child)) - first_row
+
+
+def generate_year(
+    children: np.ndarray, rng: np.random.Generator, collection_year: int
+) -> Dict[str, DataFrame]:
+    """
+    Generates one year's return for the given children.
+
+    :param ndarray children: the CHILD ids to generate, as strings.
+    :param Generator rng: the random generator to draw from.
+    :param int collection_year: the year the collection ends in, e.g. 2023 for 2022/23.
+    :return: a DataFrame of strings, with NaN for blanks, for each table in config.column_names.
+    """
+    draw = _Draw(rng, collection_year)
+    n = len(children)
+    dob = draw.end - rng.integers(30, 18 * 365, n)
+    dob_strings = draw.dates(dob)
+    sex = draw.codes(["1", "2"], n)
+
+    tables = {}
+    tables["Header"] = {
+        "CHILD": children,
+        "SEX": sex,
+        "DOB": dob_strings,
+        "ETHNIC": draw.codes(code_columns["Header"]["ETHNIC"], n),
+        "UPN": draw.blank(draw.digits("A", n, 12), 0.05),
+        "MOTHER": _where(
+            (sex == "2") & (draw.end - dob > 12 * 365), draw.codes(["0", "1"], n)
+        ),
+        "MC_DOB": np.full(n, np.nan, dtype=object),
+    }
+
+    # one to four episodes per child, each starting when the one before it ended.
+    child, number = _rows_per_child(rng, n, 1, 5)
+    m = len(child)
+    lengths = rng.integers(30, 400, m)
+    care_start = np.maximum(dob, draw.start - rng.integers(0, 4 * 365, n))
+    ends = np.cumsum(lengths)
+    dec = care_start[child] + ends - (ends - lengths)[number == 0][child]
+    decom = dec - lengths
+    is_last = np.append(number[1:] == 0, True)
+    # a child's last episode is usually still open at the end of the year.
+    is_open = is_last & ((dec > draw.end) | (rng.random(m) < 0.6))
+    tables["Episodes"] = {
+        "CHILD": children[child],
+        "DECOM": draw.dates(decom),
+        "RNE": np.where(number == 0, "S", draw.codes(["P", "L", "T", "U", "B"], m)),
+        "LS": draw.codes(code_columns["Episodes"]["LS"], m),
+        "CIN": draw.codes(code_columns["Episodes"]["CIN"], m),
+        "PLACE": draw.codes(code_columns["Episodes"]["PLACE"], m),
+        "PLACE_PROVIDER": draw.codes(["PR0", "PR1", "PR2", "PR3", "PR4", "PR5"], m),
+        "DEC": _where(~is_open, draw.dates(dec)),
+        "REC": _where(
+            ~is_open,
+            np.where(is_last, draw.codes(code_columns["Episodes"]["REC"], m), "X1"),
+        ),
+        "REASON_PLACE_CHANGE": _where(
+            ~is_last,
+            draw.codes(code_columns["Episodes"]["REASON_PLACE_CHANGE"], m),
+        ),
+        "HOME_POST": draw.blank(draw.postcodes(m), 0.1),
+        "PL_POST": draw.blank(draw.postcodes(m), 0.1),
+        "URN": draw.blank(draw.digits("", m, 7), 0.3),
+    }
+
+    child, _ = _rows_per_child(rng, n, 0, 4)
+    k = len(child)
+    tables["Reviews"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "REVIEW": draw.dates(draw.start + rng.integers(0, 365, k)),
+        "REVIEW_CODE": draw.codes([f"PN{i}" for i in range(8)], k),
+    }
+
+    child = np.flatnonzero(rng.random(n) < 0.05)
+    tables["UASC"] = {
+        "CHILD": children[child],
+        "SEX": sex[child],
+        "DOB": dob_strings[child],
+        "DUC": draw.dates(dob[child] + 18 * 365),
+    }
+
+    child = np.flatnonzero(rng.random(n) < 0.4)
+    k = len(child)
+    scored = rng.random(k) < 0.7
+    tables["OC2"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "SDQ_SCORE": _where(scored, rng.integers(0, 41, k).astype(str)),
+        "SDQ_REASON": _where(~scored, draw.codes([f"SDQ{i}" for i in range(1, 6)], k)),
+        **{column: draw.codes(["0", "1"], k) for column in column_names["OC2"][4:]},
+    }
+
+    child = np.flatnonzero(rng.random(n) < 0.05)
+    k = len(child)
+    tables["OC3"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "IN_TOUCH": draw.codes(["YES", "NO", "DIED", "REFU", "NREQ", "RHOM"], k),
+        "ACTIV": draw.codes(
+            ["F1", "P1", "F2", "P2", "F4", "P4", "F5", "P5", "G4", "G5", "G6"],
+            k,
+            blank=0.1,
+        ),
+        "ACCOM": draw.codes(OC3_ACCOM, k, blank=0.1),
+    }
+
+    child = np.flatnonzero(rng.random(n) < 0.02)
+    k = len(child)
+    date_int = draw.start + rng.integers(-365, 300, k)
+    tables["AD1"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "DATE_INT": draw.dates(date_int),
+        "DATE_MATCH": draw.dates(date_int + rng.integers(0, 60, k)),
+        "FOSTER_CARE": draw.codes(["0", "1"], k),
+        "NB_ADOPTR": draw.codes(["1", "2"], k),
+        "SEX_ADOPTR": draw.codes(["M1", "F1", "MM", "FF", "MF"], k),
+        "LS_ADOPTR": draw.codes(["L0", "L11", "L12", "L2", "L3", "L4"], k),
+    }
+    ceased = rng.random(k) < 0.3
+    tables["PlacedAdoption"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "DATE_PLACED": draw.dates(date_int - rng.integers(0, 200, k)),
+        "DATE_PLACED_CEASED": _where(ceased, draw.dates(date_int + 60)),
+        "REASON_PLACED_CEASED": _where(
+            ceased, draw.codes(["RD1", "RD2", "RD3", "RD4"], k)
+        ),
+    }
+
+    permanent = rng.random(n) < 0.1
+    tables["PrevPerm"] = {
+        "CHILD": children,
+        "DOB": dob_strings,
+        "PREV_PERM": np.where(permanent, draw.codes(["P1", "P2", "P3", "P4"], n), "Z1"),
+        "LA_PERM": np.full(n, np.nan, dtype=object),
+        "DATE_PERM": _where(permanent, draw.dates(dob + rng.integers(0, 3 * 365, n))),
+    }
+
+    went_missing = np.flatnonzero(rng.random(n) < 0.03)
+    child, _ = _rows_per_child(rng, len(went_missing), 1, 4)
+    child = went_missing[child]
+    k = len(child)
+    mis_start = draw.start + rng.integers(0, 365, k)
+    tables["Missing"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "MISSING": draw.codes(["M", "A"], k),
+        "MIS_START": draw.dates(mis_start),
+        "MIS_END": draw.blank(draw.dates(mis_start + rng.integers(0, 30, k)), 0.1),
+    }
+
+    child, _ = _rows_per_child(rng, n, 1, 3)
+    k = len(child)
+    sw_decom = draw.start + rng.integers(-365, 300, k)
+    tables["SWEpisodes"] = {
+        "CHILD": children[child],
+        "DOB": dob_strings[child],
+        "SW_ID": draw.digits("SW", k, 6),
+        "SW_DECOM": draw.dates(sw_decom),
+        "SW_DEC": draw.blank(draw.dates(sw_decom + rng.integers(30, 365, k)), 0.5),
+        "SW_REASON": draw.codes(
+            ["MGRJO", "MGRROLE", "MGRDEP", "UNREL", "LAPROC", "PROCPER", "OTHER"],
+            k,
+            blank=0.5,
+        ),
+    }
+
+    return {
+        table_name: DataFrame(columns, dtype=object)[column_names[table_name]]
+        for table_name, columns in tables.items()
+    }
+
+
+def generate_return(
+    children: int, seed: int = 0, collection_year: int = 2023
+) -> Dict[str, DataFrame]:
+    """
+    Generates a return and the previous year's return, for an overlapping set of children.
+
+    :param int children: the number of children in each year.
+    :param int seed: seed for the random generator. The same arguments always give the same tables.
+    :param int collection_year: the year the collection ends in, e.g. 2023 for 2022/23.
+    :return: every table in config.column_names, and the same again for the previous year, with the
+        suffix '_last'.
+    """
+    rng = np.random.default_rng(seed)
+    ids = (rng.permutation(children * 2) + 100000).astype(str).astype(object)
+    # a fifth of this year's children are new, and a fifth of last year's have left.
+    this_year = generate_year(ids[:children], rng, collection_year)
+    last_year = generate_year(
+        ids[children // 5 : children + children // 5], rng, collection_year - 1
+    )
+    return {
+        **this_year,
+        **{f"{table_name}_last": df for table_name, df in last_year.items()},
+    }
+
+
+def to_csv_uploads(tables: Dict[str, DataFrame]) -> List[UploadedFile]:
+    """
+    The tables as CSV uploads, as read_from_text receives them, named as in tests/fake_data. Tables with the
+    suffix '_last' are uploaded as the previous year's.
+    """
+    uploads = []
+    for table_name, df in tables.items():
+        base_name = table_name.removesuffix("_last")
+        uploads.append(
+            {
+                "name": FILE_NAMES[base_name],
+                "file_content": df.to_csv(index=False).encode("utf-8"),
+                "description": "Prev year"
+                if table_name.endswith("_last")
+                else "This year",
+            }
+        )
+    return uploads
+
+
+def to_xml(tables: Dict[str, DataFrame]) -> bytes:
+    """
+    This year's tables as an SSDA903 XML return, in the form read by ingress.read_xml_from_text. The XML
+    has no social worker episodes, so SWEpisodes isn't included.
+    """
+
+    def elements(values: dict) -> str:
+        return "".join(
+            f"<{tag} />" if pd.isna(value) else f"<{tag}>{value}</{tag}>"
+            for tag, value in values.items()
+        )
+
+    def rows_by_child(table_name: str, tag: str, conversions=None) -> Dict[str, list]:
+        df = tables[table_name]
+        columns = [c for c in df.columns if c not in ("CHILD", "DOB")]
+        tags = [(conversions or {}).get(c, c) for c in columns]
+        rows = {}
+        for child, *values in df[["CHILD"] + columns].itertuples(index=False):
+            rows.setdefault(child, []).append(
+                f"<{tag}>{elements(dict(zip(tags, values)))}</{tag}>"
+            )
+        return rows
+
+    def fields_by_child(table_name: str) -> Dict[str, dict]:
+        df = tables[table_name]
+        columns = [c for c in df.columns if c not in ("CHILD", "DOB", "SEX")]
+        return {
+            child: dict(zip(columns, values))
+            for child, *values in df[["CHILD"] + columns].itertuples(index=False)
+        }
+
+    episodes = rows_by_child("Episodes", "EPISODE", {"PLACE": "PL"})
+    nested = [
+        rows_by_child("Reviews", "AREVIEW"),
+        rows_by_child("Missing", "AMISSING"),
+        rows_by_child("OC2", "OC2"),
+        rows_by_child("PrevPerm", "PERMANENCE"),
+        rows_by_child("PlacedAdoption", "AD_PLACED"),
+    ]
+    uasc = fields_by_child("UASC")
+    flat = [fields_by_child("OC3"), fields_by_child("AD1")]
+
+    parts = ["<?xml version='1.0' encoding='utf-8'?><EXPSSDA903>"]
+    header = tables["Header"]
+    for child, sex, dob, ethnic, upn, mother, mc_dob in header[
+        ["CHILD", "SEX", "DOB", "ETHNIC", "UPN", "MOTHER", "MC_DOB"]
+    ].itertuples(index=False):
+        fields = {
+            "CHILDID": child,
+            "UPN": upn,
+            "SEX": sex,
+            "DOB": dob,
+            "ETHNIC": ethnic,
+            "UASC": "1" if child in uasc else np.nan,
+            "MOTHER": mother,
+            "MC_DOB": mc_dob,
+            **uasc.get(child, {}),
+        }
+        for table in flat:
+            fields.update(table.get(child, {}))
+        parts.append(f"<CHILD><HEADER>{elements(fields)}")
+        for table in nested:
+            parts.extend(table.get(child, []))
+        parts.append("</HEADER>")
+        parts.extend(episodes.get(child, []))
+        parts.append("</CHILD>")
+    parts.append("</EXPSSDA903>")
+    return "".join(parts).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--children", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--year", type=int, default=2023)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--xml", action="store_true", help="also write return.xml")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tables = generate_return(args.children, args.seed, args.year)
+    for upload in to_csv_uploads(tables):
+        directory = args.out / upload["description"].lower().replace(" ", "_")
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / upload["name"]).write_bytes(upload["file_content"])
+    if args.xml:
+        (args.out / "return.xml").write_bytes(to_xml(tables))
+    rows = sum(len(df) for df in tables.values())
+    print(f"Wrote {rows} rows to {args.out} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
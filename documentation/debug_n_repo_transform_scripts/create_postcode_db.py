@@ -2,6 +2,8 @@ from zipfile import ZIP_BZIP2, ZIP_LZMA, ZipFile
 
 import pandas as pd
 
+from lac_validator.postcode_store import write_postcode_store
+
 print("Reading LA Name <> LA ID mapping...")
 la_df = pd.read_csv(
     "scripts/Lower_Tier_Local_Authority_to_Upper_Tier_Local_Authority_(April_2021)_Lookup_in_England_and_Wales.csv",
@@ -19,6 +21,12 @@ df = pd.read_csv(
     usecols=["pcd", "oseast1m", "osnrth1m", "laua"],
     low_memory=True,
 )
+
+print("Writing memory-mapped postcode store...")
+# read by the validator when LAC_VALIDATOR_POSTCODE_STORE is set to this directory
+write_postcode_store(df, "scripts/postcode_store")
+print("\tCreated postcode store.")
+
 df["pcd"] = df.pop("pcd").astype("string").str.replace(" ", "")
 df["laua"] = df["laua"].astype("category")
 
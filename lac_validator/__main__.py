@@ -5,11 +5,11 @@ import pandas as pd
 
 
 import click
-import pytest
 
 from lac_validator import lac_validator
 from lac_validator.ingress import read_from_text
 from lac_validator.report import Report
+from lac_validator.rules.ruleset_utils import get_ruleset, write_manifest
 from lac_validator.utils import process_uploaded_files
 from lac_validator.config import column_names
 
@@ -33,8 +33,7 @@ def list_cmd(ruleset):
 
     :return cli output: list of rules in validation year.
     """
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
     for _, rule in ruleset_registry.items():
         click.echo(f"{rule.code}\t{rule.message}")
 
@@ -54,8 +53,7 @@ def rule_info_cmd(ruleset):
     :return cli output: tables of rules to be run in a year with message, affected fields,
                         affected tables, and CSV download of info.
     """
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
     rules_list = []
     for _, rule in ruleset_registry.items():
         rules_list.append(
@@ -76,6 +74,44 @@ def rule_info_cmd(ruleset):
     rule_info.to_csv(f"output_data/903_{ruleset[3:]}_rule_info.csv", index=False)
 
 
+# Regenerate the manifest served by list, rule-info and the frontend
+@cli.command(name="manifest")
+@click.option(
+    "--ruleset",
+    "-r",
+    default="lac2024_25",
+    help="validation year, e.g lac2024_25",
+)
+def manifest_cmd(ruleset):
+    """
+    Imports every rule in the ruleset and saves their codes, messages, fields, tables and modules to
+    lac_validator/rules/manifests. Run this after adding, changing or deleting rules.
+
+    :param str ruleset: validation year whose manifest should be regenerated.
+    """
+    manifest_path = write_manifest(ruleset)
+    click.echo(f"Saved {manifest_path}")
+
+
+# Build the memory-mapped postcode store read when LAC_VALIDATOR_POSTCODE_STORE is set
+@cli.command(name="postcode-store")
+@click.argument("directory", type=click.Path(file_okay=False))
+def postcode_store_cmd(directory):
+    """
+    Loads every postcode in the reference data and saves them as a postcode store in DIRECTORY. Set
+    LAC_VALIDATOR_POSTCODE_STORE to DIRECTORY to have the validator look postcodes up in it.
+
+    :param str directory: directory to save the store to.
+    """
+    from lac_validator.datastore import get_postcodes
+    from lac_validator.postcode_store import write_postcode_store
+
+    postcodes = get_postcodes()
+    postcodes.load_postcodes("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    write_postcode_store(postcodes.dataframe, directory)
+    click.echo(f"Saved {len(postcodes.dataframe)} postcodes to {directory}")
+
+
 # TEST
 @cli.command(name="test")
 @click.option(
@@ -90,6 +126,8 @@ def test_cmd(ruleset):
     :param str ruleset: validation year whose rules should be run
     :return: classic pytest output
     """
+    import pytest
+
     module = importlib.import_module(f"lac_validator.rules.{ruleset}")
     module_folder = Path(module.__file__).parent
     # May 2023. There are 288 rule files.
@@ -114,6 +152,8 @@ def test_one_rule(code, ruleset):
     :param str ruleset: validation year whose rules should be run
     :return: classic pytest output
     """
+    import pytest
+
     module = importlib.import_module(f"lac_validator.rules.{ruleset}")
     module_folder = Path(module.__file__).parent
 
@@ -122,6 +162,16 @@ def test_one_rule(code, ruleset):
     pytest.main([file_path])
 
 
+def echo_slowest_rules(validator: lac_validator.LacValidator, count: int = 20):
+    """
+    Prints the rules that took longest to run, from the validator's rule_profile.
+    """
+    profile = validator.rule_profile.sort_values("WallTime", ascending=False)
+    total = profile["WallTime"].sum()
+    click.echo(f"Slowest {count} of {len(profile)} rules, {total:.2f}s in total:")
+    click.echo(profile.head(count).to_string(index=False))
+
+
 # RUN
 @cli.command(name="run")
 @click.argument("p4a_path", type=click.File("rt"), required=True)
@@ -133,7 +183,12 @@ def test_one_rule(code, ruleset):
     help="validation year e.g lac2022_23",
 )
 @click.option("--select", "-s", default=None)
-def run_all(p4a_path, ad1_path, ruleset, select):
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="print the slowest rules, with the time and memory they used",
+)
+def run_all(p4a_path, ad1_path, ruleset, select, profile):
     """
     created with code from offlinedebug.py
 
@@ -142,6 +197,7 @@ def run_all(p4a_path, ad1_path, ruleset, select):
 
     :param str ruleset: validation year.
     :param str select: code of specific rule that should be run.
+    :param bool profile: whether to print the slowest rules.
     """
     # p4a_path = "tests\\fake_data\placed_for_adoption_errors.csv"
     # ad1_path = "tests\\fake_data\\ad1.csv"
@@ -152,20 +208,22 @@ def run_all(p4a_path, ad1_path, ruleset, select):
 
     # the rest of the metadata is added in read_from_text() when instantiating Validator
     metadata = {"collectionYear": "2022", "localAuthority": "E09000027"}
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
 
     v = lac_validator.LacValidator(
         metadata=metadata,
         files=files_list,
         registry=ruleset_registry,
         selected_rules=None,
+        profile_memory=profile,
     )
     results = v.ds_results
 
     click.echo(v.ds_results)
     click.echo(f"skipped {v.skips}")
     click.echo(f"done: {v.dones}")
+    if profile:
+        echo_slowest_rules(v)
 
     r = Report(results, ruleset_registry)
     # click.echo(f"*****************Error report******************")
@@ -187,7 +245,12 @@ def run_all(p4a_path, ad1_path, ruleset, select):
     help="validation year e.g lac2023_24",
 )
 @click.option("--select", "-s", default=None)
-def run_all(filename: str, ruleset, select):
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="print the slowest rules, with the time and memory they used",
+)
+def run_all(filename: str, ruleset, select, profile):
     """
     CLI command to run the validator offline, primarily to test ingress
 
@@ -196,6 +259,7 @@ def run_all(filename: str, ruleset, select):
 
     :param str ruleset: validation year.
     :param str select: code of specific rule that should be run.
+    :param bool profile: whether to print the slowest rules.
     """
     ad1 = f"{filename}/ad1.csv"
     episodes = f"{filename}/episodes.csv"
@@ -228,14 +292,14 @@ def run_all(filename: str, ruleset, select):
 
     # the rest of the metadata is added in read_from_text() when instantiating Validator
     metadata = {"collectionYear": "2023", "localAuthority": "E09000027"}
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    ruleset_registry = getattr(module, "registry")
+    ruleset_registry = get_ruleset(ruleset)
 
     v = lac_validator.LacValidator(
         metadata=metadata,
         files=files_list,
         registry=ruleset_registry,
         selected_rules=None,
+        profile_memory=profile,
     )
 
     click.echo(v.dfs)
@@ -245,6 +309,8 @@ def run_all(filename: str, ruleset, select):
     r = Report(results, ruleset_registry)
     full_issue_df = lac_validator.create_issue_df(r.report, r.error_report)
     click.echo(full_issue_df)
+    if profile:
+        echo_slowest_rules(v)
 
 
 # XML to tables
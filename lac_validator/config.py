@@ -62,3 +62,135 @@ column_names = {
     "Missing": ["CHILD", "DOB", "MISSING", "MIS_START", "MIS_END"],
     "SWEpisodes": ["CHILD", "DOB", "SW_ID", "SW_DECOM", "SW_DEC", "SW_REASON"],
 }
+
+# Date fields for each 903 file, all in the form dd/mm/YYYY.
+# These are parsed once when the datastore is created so rules don't have to.
+date_columns = {
+    "Header": ["DOB", "MC_DOB"],
+    "Episodes": ["DECOM", "DEC"],
+    "Reviews": ["DOB", "REVIEW"],
+    "UASC": ["DOB", "DUC"],
+    "OC2": ["DOB"],
+    "OC3": ["DOB"],
+    "AD1": ["DOB", "DATE_INT", "DATE_MATCH"],
+    "PlacedAdoption": ["DOB", "DATE_PLACED", "DATE_PLACED_CEASED"],
+    "PrevPerm": ["DOB", "DATE_PERM"],
+    "Missing": ["DOB", "MIS_START", "MIS_END"],
+    "SWEpisodes": ["DOB", "SW_DECOM", "SW_DEC"],
+}
+
+# Coded fields, with the codes they take in any collection year. The synthetic returns in benchmarks draw
+# their codes from these.
+code_columns = {
+    "Header": {
+        "SEX": ["1", "2", "M", "F", "U"],
+        "ETHNIC": [
+            "WBRI",
+            "WIRI",
+            "WOTH",
+            "WIRT",
+            "WROM",
+            "MWBC",
+            "MWBA",
+            "MWAS",
+            "MOTH",
+            "AIND",
+            "APKN",
+            "ABAN",
+            "AOTH",
+            "BCRB",
+            "BAFR",
+            "BOTH",
+            "CHNE",
+            "OOTH",
+            "REFU",
+            "NOBT",
+        ],
+    },
+    "Episodes": {
+        "RNE": ["S", "P", "L", "T", "U", "B"],
+        "LS": [
+            "C1",
+            "C2",
+            "D1",
+            "E1",
+            "V2",
+            "V3",
+            "V4",
+            "J1",
+            "J2",
+            "J3",
+            "L1",
+            "L2",
+            "L3",
+        ],
+        "CIN": ["N1", "N2", "N3", "N4", "N5", "N6", "N7", "N8"],
+        "PLACE": [
+            "A3",
+            "A4",
+            "A5",
+            "A6",
+            "H5",
+            "K1",
+            "K2",
+            "P1",
+            "P2",
+            "P3",
+            "R1",
+            "R2",
+            "R3",
+            "R5",
+            "S1",
+            "T0",
+            "T1",
+            "T2",
+            "T3",
+            "T4",
+            "U1",
+            "U2",
+            "U3",
+            "U4",
+            "U5",
+            "U6",
+            "Z1",
+        ],
+        "REC": [
+            "E11",
+            "E12",
+            "E2",
+            "E3",
+            "E4A",
+            "E4B",
+            "E13",
+            "E41",
+            "E45",
+            "E46",
+            "E47",
+            "E48",
+            "E5",
+            "E6",
+            "E7",
+            "E8",
+            "E9",
+            "E14",
+            "E15",
+            "E16",
+            "E17",
+            "X1",
+        ],
+        "REASON_PLACE_CHANGE": [
+            "CARPL",
+            "CLOSE",
+            "ALLEG",
+            "STAND",
+            "APPRR",
+            "CREQB",
+            "CREQO",
+            "CHILD",
+            "LAREQ",
+            "PLACE",
+            "CUSTOD",
+            "OTHER",
+        ],
+    },
+}
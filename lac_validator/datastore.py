@@ -1,35 +1,132 @@
 import logging
 import os
+import threading
+from collections.abc import MutableMapping
 from copy import copy
 from pathlib import Path
-from typing import Any, Dict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
-import qlacref_authorities
 from pandas import DataFrame
-from qlacref_postcodes import Postcodes
+
+from lac_validator.config import date_columns
+from lac_validator.postcode_store import PostcodeStore
+
+if TYPE_CHECKING:
+    from qlacref_postcodes import Postcodes
 
 logger = logging.getLogger(__name__)
 
-# TODO security point. remove this line.
-os.environ["QLACREF_PC_INSECURE"] = "True"
+# The reference data is loaded on first use, not on import, so commands that only list rules start quickly.
+# Use get_la_df and get_postcodes to read it, or warm_up to load it ahead of time.
+_reference_lock = threading.Lock()
+_la_df: Optional[DataFrame] = None
+_postcodes: Optional["Postcodes"] = None
+_laua_upper_tiers: Optional[pd.Series] = None
 
-la_df = pd.DataFrame.from_records(qlacref_authorities.records)
-logger.info("Loaded authorities")
 
-# A bit of a hack, but will keep things working
-if os.getenv("QLACREF_PC_KEY") is None:
-    key_file = Path(__file__).parent.parent / ".qlacref/id_rsa.pub"
-    if key_file.is_file():
-        logger.warning(
-            "Using repository key for pickle signature. "
-            "To stay safe from tampering, set the key path in 'QLACREF_PC_KEY'"
-        )
-        os.environ["QLACREF_PC_KEY"] = str(key_file.absolute())
+def get_la_df() -> DataFrame:
+    """
+    The local authorities from qlacref_authorities, loaded on the first call.
+    """
+    global _la_df
+    with _reference_lock:
+        if _la_df is None:
+            import qlacref_authorities
+
+            _la_df = pd.DataFrame.from_records(qlacref_authorities.records)
+            logger.info("Loaded authorities")
+        return _la_df
+
+
+def get_postcodes() -> "Postcodes":
+    """
+    The qlacref_postcodes Postcodes, initialised on the first call. Postcodes are loaded into it by first letter
+    as they're needed, by postcode_index.
+    """
+    global _postcodes
+    with _reference_lock:
+        if _postcodes is None:
+            from qlacref_postcodes import Postcodes
+
+            # TODO security point. remove this line.
+            os.environ["QLACREF_PC_INSECURE"] = "True"
+
+            # A bit of a hack, but will keep things working
+            if os.getenv("QLACREF_PC_KEY") is None:
+                key_file = Path(__file__).parent.parent / ".qlacref/id_rsa.pub"
+                if key_file.is_file():
+                    logger.warning(
+                        "Using repository key for pickle signature. "
+                        "To stay safe from tampering, set the key path in 'QLACREF_PC_KEY'"
+                    )
+                    os.environ["QLACREF_PC_KEY"] = str(key_file.absolute())
+
+            _postcodes = Postcodes()
+            logger.info("Initialised Postcodes")
+        return _postcodes
+
+
+def get_laua_upper_tiers() -> pd.Series:
+    """
+    The upper tier LA code (UTLA21CD) of each lower tier LA code (LTLA21CD), built from get_la_df() on the first
+    call.
+    """
+    global _laua_upper_tiers
+    la_df = get_la_df()
+    with _reference_lock:
+        if _laua_upper_tiers is None:
+            _laua_upper_tiers = la_df.drop_duplicates("LTLA21CD").set_index("LTLA21CD")[
+                "UTLA21CD"
+            ]
+        return _laua_upper_tiers
+
+
+def warm_up(postcode_letters: str = ""):
+    """
+    Loads the reference data now rather than on first use, for servers that would rather pay for it at start up
+    than on their first request.
+
+    :param str postcode_letters: first letters of the postcodes to load into postcode_index as well, e.g.
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for all of them. If postcode_index uses a postcode store, the store is
+        opened instead.
+    """
+    get_la_df()
+    postcode_index.load(postcode_letters)
+
+
+def __getattr__(name: str):
+    # la_df and postcodes used to be created on import; keep them importable, but load them on first access.
+    if name == "la_df":
+        return get_la_df()
+    if name == "postcodes":
+        return get_postcodes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-postcodes = Postcodes()
-logger.info("Initialised Postcodes")
+
+DATE_FORMAT = "%d/%m/%Y"
+
+
+class ParsedDates(NamedTuple):
+    """
+    The date columns of a table, parsed once when the datastore is created.
+
+    :param DataFrame source: the table the dates were parsed from.
+    :param DataFrame dates: the parsed datetime columns, with the same index as the source table.
+    """
+
+    source: DataFrame
+    dates: DataFrame
 
 
 def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
@@ -41,6 +138,10 @@ def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
       - 'postcodes' - a postcodes csv, with columns "laua" (LA code), "oseast1m", "osnrth1m" (coordinates) and "pcd" (the postcode)
       - 'localAuthority' - the code of the local authority (long form)
       - 'collectionYear' - the collection year string (e.g. '2019/20)
+      - 'parsed_dates' - the date fields from config.py of every table, already parsed to datetimes.
+        Rules should read these through get_date_column rather than directly.
+      - 'derived' - a DerivedCache of values derived from the tables, shared by every rule.
+        Rules should read these through get_derived rather than directly.
 
     :param data: Dict of raw DataFrames by name (from config.py) together with the '_last' data.
     :param metadata:
@@ -64,6 +165,11 @@ def create_datastore(data: Dict[str, Any], metadata: Dict[str, Any]):
                 columns={"_14", "_15", "_16", "_17"} & set(data[table_name].columns)
             )
 
+    data["metadata"]["parsed_dates"] = _parse_date_columns(data)
+    data["metadata"]["derived"] = DerivedCache(
+        {k: v for k, v in data.items() if k != "metadata"}
+    )
+
     names_and_lengths = ", ".join(f"{t}: {len(data[t])} rows" for t in data)
     logger.info(f"Datastore created -- {names_and_lengths}")
     return data
@@ -76,65 +182,406 @@ def _process_metadata(metadata):
     return metadata
 
 
-def merge_postcodes(df: DataFrame, postcode_field: str) -> DataFrame:
-    df[postcode_field] = df[postcode_field].str.upper()
+def _parse_date_columns(data: Dict[str, Any]) -> Dict[str, ParsedDates]:
+    """
+    Parses the date fields of every table once, so that rules don't each have to call pd.to_datetime
+    on the same columns. Unparseable dates become NaT, as with errors="coerce".
 
-    key_field = f"__{postcode_field}__first_letter"
-    df[key_field] = df[postcode_field].str[0]
-    pcs = df[key_field].dropna().unique()
+    :param data: the datastore, keyed by table name.
+    :return: the parsed dates of each table, keyed by table name.
+    """
+    parsed_dates = {}
+    for table_name, df in data.items():
+        expected_dates = date_columns.get(table_name.removesuffix("_last"))
+        if expected_dates is None:
+            continue
+        dates = DataFrame(
+            {
+                column: pd.to_datetime(df[column], format=DATE_FORMAT, errors="coerce")
+                for column in expected_dates
+                if column in df.columns
+            },
+            index=df.index,
+        )
+        parsed_dates[table_name] = ParsedDates(source=df, dates=dates)
+    return parsed_dates
+
+
+def get_date_column(dfs: Dict[str, Any], table_name: str, column: str) -> pd.Series:
+    """
+    Returns a date column of a table as datetimes, equivalent to
+    pd.to_datetime(dfs[table_name][column], format="%d/%m/%Y", errors="coerce").
+
+    The pre-parsed column from the datastore is used if the table still holds the column it was parsed
+    from, with the same index. Otherwise, for example when a rule has replaced the column or is tested on
+    plain DataFrames, the column is parsed here. A copy is always returned, so the shared parsed dates
+    can't be modified by a rule.
 
-    logger.info(f"Loading the following postcode letters: {pcs}")
-    postcodes.load_postcodes(pcs)
+    :param dfs: the datastore, or any dict of DataFrames, as passed to a rule.
+    :param table_name: name of the table, e.g. 'Episodes' or 'Episodes_last'.
+    :param column: name of the date column, e.g. 'DECOM'.
+    :return: Series of datetimes with the same index as the table.
+    """
+    df = dfs[table_name]
+    try:
+        parsed = dfs["metadata"]["parsed_dates"][table_name]
+    except (KeyError, TypeError):
+        parsed = None
+    if (
+        parsed is not None
+        and column in parsed.dates.columns
+        and _is_unchanged(df, parsed.source, [column])
+    ):
+        return parsed.dates[column].copy()
+    return pd.to_datetime(df[column], format=DATE_FORMAT, errors="coerce")
 
-    logger.info(f"Adding postcode abbreviations for {postcode_field}")
-    pc_abbr_field = f"__{postcode_field}__abbr"
-    df[pc_abbr_field] = df[postcode_field].str.replace(" ", "")
 
-    df_merged = df[[pc_abbr_field]].merge(
-        postcodes.dataframe, how="left", left_on=pc_abbr_field, right_on="pcd_abbr"
+def _is_unchanged(df: DataFrame, source: DataFrame, columns: list[str]) -> bool:
+    """
+    Checks whether df still holds the given columns of source, with the same index.
+    Shallow copies of the datastore share the original columns, so this is cheap to check.
+    """
+    return df.index.equals(source.index) and all(
+        column in df.columns
+        and np.may_share_memory(df[column].values, source[column].values)
+        for column in columns
     )
-    del df[key_field]
-    del df[pc_abbr_field]
 
-    return df_merged
 
+class DerivedCache:
+    """
+    Values derived from the tables of the datastore, such as the periods of care of each child, which several
+    rules would otherwise each compute. A value is computed the first time a rule asks for it, from the table
+    as it was when the datastore was created, and kept for the rest of the validation run.
 
-def _add_postcode_derived_fields(episodes_df, local_authority):
-    episodes_df = episodes_df.copy()
+    :param dict tables: the tables of the datastore, keyed by table name.
+    """
 
-    home_details = merge_postcodes(episodes_df, "HOME_POST")
-    pl_details = merge_postcodes(episodes_df, "PL_POST")
+    def __init__(self, tables: Dict[str, DataFrame]):
+        self._tables = tables
+        self._values: Dict[tuple, Any] = {}
 
-    # The indices remain the same post merge as the length of the dataframes doesn't change, so we can set directly.
-    pl_details = pl_details.merge(
-        la_df, how="left", left_on="laua", right_on="LTLA21CD"
+    def get(
+        self,
+        dfs: Dict[str, Any],
+        name: str,
+        table_name: str,
+        columns: list[str],
+        compute: Callable[[DataFrame], Any],
+    ) -> Any:
+        df = dfs[table_name]
+        source = self._tables.get(table_name)
+        if source is None or not _is_unchanged(df, source, columns):
+            # the rule has changed the table, so the cached value may not apply to it.
+            return compute(df)
+        key = (name, table_name)
+        if key not in self._values:
+            self._values[key] = compute(source)
+        return self._values[key].copy()
+
+
+def get_derived(
+    dfs: Dict[str, Any],
+    name: str,
+    table_name: str,
+    columns: list[str],
+    compute: Callable[[DataFrame], Any],
+) -> Any:
+    """
+    Returns a value derived from a table, computed once per validation run and then shared by every rule
+    that asks for it.
+
+    The cached value is used if the table still holds the columns it was derived from, with the same index.
+    Otherwise, for example when a rule has replaced one of the columns or is tested on plain DataFrames,
+    the value is computed here from the table as it is. A copy is always returned, so the shared value
+    can't be modified by a rule.
+
+    :param dfs: the datastore, or any dict of DataFrames, as passed to a rule.
+    :param name: name of the derived value, e.g. 'periods_of_care'.
+    :param table_name: name of the table it is derived from, e.g. 'Episodes' or 'Episodes_last'.
+    :param columns: the columns of the table it is derived from.
+    :param compute: function computing the value from the table.
+    :return: the derived value, usually a Series or DataFrame.
+    """
+    try:
+        cache = dfs["metadata"]["derived"]
+    except (KeyError, TypeError):
+        return compute(dfs[table_name])
+    return cache.get(dfs, name, table_name, columns, compute)
+
+
+def encode_strings(values: pd.Series) -> pd.Series:
+    """
+    Encodes a column as a categorical of its values as strings, as astype(str) would convert them, except that
+    blank values stay missing. Each distinct value is converted once, rather than every row.
+
+    :param Series values: the column.
+    :return: a categorical Series with the same index and name as values.
+    """
+    value_codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+    category_codes, categories = pd.factorize(
+        np.array([str(value) for value in uniques], dtype=object)
+    )
+    # blank values have the value code -1, which picks the -1 appended here.
+    value_codes = np.append(category_codes, -1)[value_codes]
+    return pd.Series(
+        pd.Categorical.from_codes(value_codes, categories=categories),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def get_string_column(dfs: Dict[str, Any], table_name: str, column: str) -> pd.Series:
+    """
+    Returns any column of a table as a categorical of its values as strings (see encode_strings), encoded once
+    per validation run and then shared by every rule that asks for it.
+
+    :param dfs: the datastore, or any dict of DataFrames, as passed to a rule.
+    :param table_name: name of the table, e.g. 'AD1'.
+    :param column: name of the column, e.g. 'SEX_ADOPTR'.
+    :return: categorical Series with the same index as the table.
+    """
+    return get_derived(
+        dfs,
+        f"strings_{column}",
+        table_name,
+        [column],
+        lambda df: encode_strings(df[column]),
+    )
+
+
+def isin_codes(values: pd.Series, codes: list) -> pd.Series:
+    """
+    Equivalent to values.isin(codes). If values is a categorical, such as from get_string_column, the codes
+    are found among its categories once, and each row is tested by its integer category code.
+
+    :param Series values: the column to test.
+    :param list codes: the codes to look for.
+    :return: boolean Series with the same index as values.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.isin(codes)
+    categories = values.cat.categories
+    wanted = categories.get_indexer([code for code in codes if not pd.isna(code)])
+    # one entry per category, then one for missing values, whose category code is -1.
+    is_wanted = np.zeros(len(categories) + 1, dtype=bool)
+    is_wanted[wanted[wanted >= 0]] = True
+    is_wanted[-1] = any(pd.isna(code) for code in codes)
+    return pd.Series(
+        is_wanted[values.cat.codes.to_numpy()], index=values.index, name=values.name
     )
-    episodes_df["PL_LA"] = pl_details["UTLA21CD"]
+
+
+class PostcodeIndex:
+    """
+    Postcodes sorted by their upper-case form without spaces, so a whole column of postcodes can be looked up
+    with a binary search. Postcodes are loaded on demand, by first letter, from a qlacref_postcodes Postcodes,
+    and the sorted arrays are rebuilt whenever new letters are loaded.
+
+    If a prebuilt postcode store is given (see lac_validator.postcode_store), it is memory-mapped and searched
+    instead, so processes share the postcode data rather than each loading their own copy.
+
+    A single index, postcode_index, is shared by the datastore, the rules and the provider info table.
+
+    :param Postcodes postcodes: the reference postcodes to index. Defaults to get_postcodes(), on first use.
+    :param store: directory of a postcode store to use instead of postcodes.
+    """
+
+    columns = ["pcd", "oseast1m", "osnrth1m", "laua", "pcd_abbr"]
+
+    def __init__(
+        self,
+        postcodes: Optional["Postcodes"] = None,
+        store: Union[str, Path, None] = None,
+    ):
+        self._postcodes = postcodes
+        self._store_path = store
+        self._store: Optional[PostcodeStore] = None
+        self._source: Optional[DataFrame] = None
+        self._keys = np.array([], dtype="U1")
+        self._values: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def _update(self, letters) -> tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Loads the postcodes starting with the given letters, and re-sorts the index if any were new.
+
+        :return: the sorted keys, and the columns in the same order.
+        """
+        with self._lock:
+            logger.info(f"Loading the following postcode letters: {letters}")
+            if self._postcodes is None:
+                self._postcodes = get_postcodes()
+            self._postcodes.load_postcodes(letters)
+            source = self._postcodes.dataframe
+            if source is not self._source:
+                keys = source["pcd_abbr"].to_numpy(dtype=str)
+                order = np.argsort(keys, kind="stable")
+                self._keys = keys[order]
+                self._values = {
+                    column: source[column].to_numpy()[order] for column in self.columns
+                }
+                self._source = source
+            return self._keys, self._values
+
+    def _open_store(self) -> PostcodeStore:
+        with self._lock:
+            if self._store is None:
+                logger.info(f"Opening postcode store {self._store_path}")
+                self._store = PostcodeStore(self._store_path)
+            return self._store
+
+    def load(self, letters: str):
+        """
+        Loads the postcodes starting with the given letters now, rather than when they're first looked up.
+        If the index uses a postcode store, the store is opened instead.
+        """
+        if self._store_path is not None:
+            self._open_store()
+        else:
+            self._update(letters)
+
+    def lookup(self, postcodes: pd.Series) -> DataFrame:
+        """
+        Finds the details of each postcode in a column. Postcodes are matched ignoring case and spaces.
+
+        :param Series postcodes: the postcodes to look up, which may include NaNs.
+        :return: the columns pcd, oseast1m, osnrth1m, laua and pcd_abbr of each postcode, with the same
+            index as postcodes. Rows are all NaN where the postcode is missing or not found.
+        """
+        abbreviations = postcodes.astype(object).str.upper().str.replace(" ", "")
+        provided = abbreviations.notna().to_numpy()
+        queries = abbreviations.to_numpy()[provided].astype(str)
+
+        if self._store_path is not None:
+            store = self._open_store()
+            keys = store.keys
+            # the store holds ASCII bytes; other characters can't match, so are replaced.
+            queries = np.char.encode(queries, "ascii", "replace")
+        else:
+            letters = np.unique(queries.astype("U1"))
+            keys, values = self._update(letters[letters != ""])
+
+        found = np.zeros(len(postcodes), dtype=bool)
+        rows = np.zeros(len(postcodes), dtype=np.intp)
+        if len(keys) > 0:
+            positions = np.searchsorted(keys, queries).clip(max=len(keys) - 1)
+            found[provided] = keys[positions] == queries
+            rows[provided] = positions
+        found_rows = rows[found]
+
+        if self._store_path is not None:
+            laua_codes = store.laua_codes[found_rows]
+            found_values = {
+                "pcd": np.char.decode(store.values["pcd"][found_rows], "ascii"),
+                "oseast1m": store.values["oseast1m"][found_rows],
+                "osnrth1m": store.values["osnrth1m"][found_rows],
+                "laua": np.where(
+                    laua_codes >= 0, store.laua_categories[laua_codes], np.nan
+                ),
+                "pcd_abbr": np.char.decode(keys[found_rows], "ascii"),
+            }
+        else:
+            found_values = {
+                column: sorted_values[found_rows]
+                for column, sorted_values in values.items()
+            }
+
+        details = {}
+        for column, column_found in found_values.items():
+            if column_found.dtype.kind == "f":
+                column_values = np.full(len(postcodes), np.nan)
+            else:
+                column_values = np.full(len(postcodes), np.nan, dtype=object)
+            column_values[found] = column_found
+            details[column] = column_values
+        return DataFrame(details, index=postcodes.index, columns=self.columns)
+
+
+postcode_index = PostcodeIndex(store=os.getenv("LAC_VALIDATOR_POSTCODE_STORE"))
+
+
+def lookup_postcodes(postcodes: pd.Series) -> DataFrame:
+    """
+    Looks up a column of postcodes in the shared postcode_index. See PostcodeIndex.lookup.
+    """
+    return postcode_index.lookup(postcodes)
+
+
+def merge_postcodes(df: DataFrame, postcode_field: str) -> DataFrame:
+    """
+    Looks up the postcodes in a column of df.
+
+    :return: the columns pcd, oseast1m, osnrth1m, laua and pcd_abbr for each row of df, in the same order but
+        with a default index.
+    """
+    return lookup_postcodes(df[postcode_field]).reset_index(drop=True)
+
+
+# Placements in these countries are given the country as their LA, by the first letter of their laua.
+COUNTRY_CODES = {"S": "SCO", "N": "NIR", "W": "WAL"}
+
+
+def _laua_locations(lauas: np.ndarray, local_authority: str):
+    """
+    Works out PL_LA and PL_LOCATION for each of a set of distinct lauas.
+
+    :return: arrays of PL_LA (the upper tier LA, or the country outside England) and of PL_LOCATION,
+        in the same order as lauas.
+    """
+    upper_tier = get_laua_upper_tiers().reindex(lauas).to_numpy(dtype=object)
+    countries = np.array(
+        [COUNTRY_CODES.get(str(laua)[:1].upper()) for laua in lauas], dtype=object
+    )
+    in_country = pd.notna(countries)
+    pl_la = np.where(in_country, countries, upper_tier)
+    pl_location = np.where(
+        ~in_country & (upper_tier == local_authority), "IN", "OUT"
+    ).astype(object)
+    return pl_la, pl_location
+
+
+def _add_postcode_derived_fields(episodes_df, local_authority):
+    """
+    Adds the placement LA (PL_LA), whether the placement is in the local authority (PL_LOCATION, IN or OUT)
+    and the distance from home to placement in miles (PL_DISTANCE) to the episodes.
+
+    Postcodes are looked up once per column. The LA fields are worked out for each distinct laua, and
+    taken for each row through its position in the distinct lauas.
+
+    :return: a copy of episodes_df, with the derived columns.
+    """
+    home_details = lookup_postcodes(episodes_df["HOME_POST"])
+    pl_details = lookup_postcodes(episodes_df["PL_POST"])
 
     logger.info(f"Adding IN/OUT")
-    episodes_df["PL_LOCATION"] = "IN"
-    episodes_df.loc[episodes_df["PL_LA"].ne(local_authority), "PL_LOCATION"] = "OUT"
-    episodes_df.loc[pl_details["laua"].isna(), "PL_LOCATION"] = pd.NA
-
-    # Add country codes for placements outside england
-    for letter, code in {"S": "SCO", "N": "NIR", "W": "WAL"}.items():
-        mask = (
-            pl_details["laua"].str.upper().str.startswith(letter)
-            & episodes_df["PL_POST"].notnull()
-        )
-        episodes_df.loc[mask, ["PL_LA", "PL_LOCATION"]] = [code, "OUT"]
+    laua_codes, lauas = pd.factorize(pl_details["laua"].to_numpy(dtype=object))
+    laua_la, laua_location = _laua_locations(lauas, local_authority)
+    # rows with no laua (the postcode is missing or unknown) have no LA or location.
+    found = laua_codes >= 0
+    pl_la = np.full(len(laua_codes), np.nan, dtype=object)
+    pl_la[found] = laua_la[laua_codes[found]]
+    pl_location = np.full(len(laua_codes), pd.NA, dtype=object)
+    pl_location[found] = laua_location[laua_codes[found]]
 
     logger.info(f"Calculating distances")
     # This formula is taken straight from the guidance, to get miles between two postcodes
-    episodes_df["PL_DISTANCE"] = (
-        np.sqrt(
-            (home_details["oseast1m"] - pl_details["oseast1m"]) ** 2
-            + (home_details["osnrth1m"] - pl_details["osnrth1m"]) ** 2
+    distance = (
+        np.hypot(
+            home_details["oseast1m"].to_numpy(dtype=float)
+            - pl_details["oseast1m"].to_numpy(dtype=float),
+            home_details["osnrth1m"].to_numpy(dtype=float)
+            - pl_details["osnrth1m"].to_numpy(dtype=float),
         )
         / 1000
         / 1.6093
     )
-    episodes_df["PL_DISTANCE"] = episodes_df["PL_DISTANCE"].round(decimals=1)
+
+    # a shallow copy: the new columns are added without copying the existing ones.
+    episodes_df = episodes_df.copy(deep=False)
+    episodes_df["PL_LA"] = pl_la
+    episodes_df["PL_LOCATION"] = pl_location
+    episodes_df["PL_DISTANCE"] = distance.round(decimals=1)
 
     logger.info(f"Completed postcode calculations")
     return episodes_df
@@ -147,3 +594,275 @@ def copy_datastore(data_store):
     return {
         k: v.copy(deep=False) if k != "metadata" else v for k, v in data_store.items()
     }
+
+
+class DatastoreView(MutableMapping):
+    """
+    A copy-on-access view of the datastore, passed to each validation rule in place of a full copy.
+
+    A table is shallow-copied the first time a rule reads it, so tables a rule never reads aren't
+    copied at all. Setting or deleting a table only changes the view, and the 'metadata' dictionary
+    is copied too, so neither leaks into the datastore. As with copy_datastore, the copies share
+    their columns with the datastore: writing into existing values in place (e.g. with .loc) still
+    changes the shared data. LacValidator(check_mutations=True) reports rules that do this.
+    """
+
+    def __init__(self, data_store: Dict[str, Any]):
+        self._data_store = data_store
+        self._tables: Dict[str, Any] = {}
+        self._deleted: set = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._deleted:
+            raise KeyError(key)
+        if key not in self._tables:
+            value = self._data_store[key]
+            self._tables[key] = (
+                copy(value) if key == "metadata" else value.copy(deep=False)
+            )
+        return self._tables[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._tables[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._tables.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        # checked without copying, as rules check for their tables before reading them
+        return key not in self._deleted and (
+            key in self._tables or key in self._data_store
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._data_store:
+            if key not in self._deleted:
+                yield key
+        for key in self._tables:
+            if key not in self._data_store:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def accessed(self) -> list[str]:
+        """The tables of the datastore that have been read through this view."""
+        return [key for key in self._data_store if key in self._tables]
+
+    @property
+    def rows_accessed(self) -> int:
+        """The number of rows in the tables of the datastore that have been read through this view."""
+        return sum(
+            len(self._data_store[key])
+            for key in self.accessed
+            if isinstance(self._data_store[key], DataFrame)
+        )
+
+
+def fingerprint_datastore(
+    data_store: Dict[str, Any], table_names: Optional[list[str]] = None
+) -> Dict[str, tuple]:
+    """
+    Hashes the tables of the datastore, including the DataFrames in its metadata, so that changes to
+    them can be detected by comparing fingerprints taken before and after running a rule.
+
+    :param data_store: the datastore to fingerprint.
+    :param table_names: the tables to fingerprint, defaults to all of them.
+    :return: a fingerprint for each table, keyed by table name. Metadata tables are keyed as 'metadata/<name>'.
+    """
+    tables = {}
+    for table_name in data_store if table_names is None else table_names:
+        if table_name == "metadata":
+            for key, value in data_store["metadata"].items():
+                if isinstance(value, DataFrame):
+                    tables[f"metadata/{key}"] = value
+        else:
+            tables[table_name] = data_store[table_name]
+    return {
+        table_name: (
+            tuple(df.columns),
+            tuple(df.dtypes.astype(str)),
+            pd.util.hash_pandas_object(df, index=True).values.tobytes(),
+        )
+        for table_name, df in tables.items()
+    }
+
+
+def fingerprint_children(data_store: Dict[str, Any]) -> Dict[str, pd.Series]:
+    """
+    Hashes the rows of each child in every table of the datastore, so that the children whose data changed
+    between two uploads can be found by comparing fingerprints.
+
+    :param data_store: the datastore to fingerprint.
+    :return: for each table, one hash per child, indexed by CHILD. A child's hash depends on the values of its
+        rows and their order, but not on their index labels, so a child whose rows have only moved within the
+        table keeps its hash.
+    """
+    fingerprints = {}
+    for table_name, df in data_store.items():
+        if table_name == "metadata":
+            continue
+        children = df["CHILD"].to_numpy()
+        rank = df.groupby(children, dropna=False, sort=False).cumcount()
+        hashes = pd.util.hash_pandas_object(
+            df.assign(__rank=rank.to_numpy()), index=False
+        )
+        # uint64 sums wrap around rather than overflow, so every row counts towards the hash.
+        fingerprints[table_name] = hashes.groupby(
+            children, dropna=False, sort=False
+        ).sum()
+    return fingerprints
+
+
+def changed_children(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    old_fingerprints: Optional[Dict[str, pd.Series]] = None,
+    new_fingerprints: Optional[Dict[str, pd.Series]] = None,
+) -> Optional[pd.Index]:
+    """
+    Finds the children whose rows differ between two datastores, in any table. Children only in one of them
+    count as changed, and so do rows without a CHILD, whenever there are any.
+
+    :param old: the datastore of the earlier upload.
+    :param new: the datastore of the later upload.
+    :param old_fingerprints: fingerprint_children of old, if already known.
+    :param new_fingerprints: fingerprint_children of new, if already known.
+    :return: the CHILD of every changed child, or None if the datastores can't be compared child by child,
+        because their tables or the columns of their tables differ.
+    """
+    tables = [table_name for table_name in new if table_name != "metadata"]
+    if set(tables) != {table_name for table_name in old if table_name != "metadata"}:
+        return None
+    for table_name in tables:
+        if "CHILD" not in new[table_name].columns or not new[table_name].dtypes.equals(
+            old[table_name].dtypes
+        ):
+            return None
+
+    if old_fingerprints is None:
+        old_fingerprints = fingerprint_children(old)
+    if new_fingerprints is None:
+        new_fingerprints = fingerprint_children(new)
+    changed = pd.Index([], dtype=object)
+    for table_name in tables:
+        before = old_fingerprints[table_name]
+        after = new_fingerprints[table_name]
+        children = before.index.union(after.index)
+        differs = before.reindex(children) != after.reindex(children)
+        changed = changed.union(children[differs.to_numpy() | children.isna()])
+    return changed
+
+
+def subset_datastore(data_store: Dict[str, Any], children: pd.Index) -> Dict[str, Any]:
+    """
+    Returns a datastore holding only the rows of the given children, with their index labels from the full
+    datastore, so that the errors a rule finds in it are the rows to flag in the full datastore too. The
+    metadata is shared, apart from the parsed dates and derived values, which are for the subset's rows.
+
+    :param data_store: the full datastore, from create_datastore.
+    :param children: the CHILD of every child to keep.
+    :return: the datastore of the children.
+    """
+    return _select_rows(
+        data_store,
+        {
+            table_name: df["CHILD"].isin(children).to_numpy()
+            for table_name, df in data_store.items()
+            if table_name != "metadata"
+        },
+    )
+
+
+def shard_datastore(
+    data_store: Dict[str, Any], shards: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Splits the datastore into shards by a hash of CHILD, so that all of a child's rows, in every table, are in
+    the same shard. Each shard is a datastore like those from subset_datastore, and is only made when it's
+    asked for.
+
+    :param data_store: the full datastore, from create_datastore.
+    :param shards: the number of shards.
+    :return: the datastore of each shard. Every child is in exactly one of them.
+    """
+    shard_numbers = {
+        table_name: pd.util.hash_array(df["CHILD"].to_numpy(dtype=object)) % shards
+        for table_name, df in data_store.items()
+        if table_name != "metadata"
+    }
+    for shard in range(shards):
+        yield _select_rows(
+            data_store,
+            {
+                table_name: numbers == shard
+                for table_name, numbers in shard_numbers.items()
+            },
+        )
+
+
+def rebuild_datastore(data_store: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuilds the text columns of an unpickled datastore from their values. With pandas 1.5, astype(str) on a
+    column of an unpickled DataFrame can write "nan" into the column itself, so a rule converting a column
+    would change it for the rules after it.
+
+    :param data_store: a datastore, from create_datastore, that has been pickled and unpickled.
+    :return: an equivalent datastore, with its own parsed dates and derived values.
+    """
+    rebuilt = {}
+    parsed_dates = {}
+    for table_name, df in data_store.items():
+        if table_name == "metadata":
+            continue
+        rebuilt[table_name] = pd.DataFrame(
+            {
+                column: np.array(values.tolist(), dtype=object)
+                if values.dtype == object
+                else values
+                for column, values in df.items()
+            },
+            index=df.index,
+        )
+        parsed = data_store["metadata"]["parsed_dates"].get(table_name)
+        if parsed is not None:
+            parsed_dates[table_name] = ParsedDates(
+                source=rebuilt[table_name], dates=parsed.dates
+            )
+
+    rebuilt["metadata"] = copy(data_store["metadata"])
+    rebuilt["metadata"]["parsed_dates"] = parsed_dates
+    rebuilt["metadata"]["derived"] = DerivedCache(
+        {k: v for k, v in rebuilt.items() if k != "metadata"}
+    )
+    return rebuilt
+
+
+def _select_rows(
+    data_store: Dict[str, Any], keep: Dict[str, np.ndarray]
+) -> Dict[str, Any]:
+    """
+    Returns a datastore with only the rows of each table where keep is True, with the parsed dates and derived
+    values of those rows.
+    """
+    selected = {}
+    parsed_dates = {}
+    for table_name, rows in keep.items():
+        selected[table_name] = data_store[table_name][rows]
+        parsed = data_store["metadata"]["parsed_dates"].get(table_name)
+        if parsed is not None:
+            parsed_dates[table_name] = ParsedDates(
+                source=selected[table_name], dates=parsed.dates[rows]
+            )
+
+    selected["metadata"] = copy(data_store["metadata"])
+    selected["metadata"]["parsed_dates"] = parsed_dates
+    selected["metadata"]["derived"] = DerivedCache(
+        {k: v for k, v in selected.items() if k != "metadata"}
+    )
+    return selected
@@ -1,17 +1,24 @@
 import collections.abc
+import hashlib
+import importlib.metadata
 import logging
+import os
+import threading
 import xml.etree.ElementTree as ET
-from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
 from pathlib import Path
 from time import perf_counter as now
-from typing import Dict, Iterator, List, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from numpy import nan
 from pandas import DataFrame
 
 from lac_validator.config import column_names
-from lac_validator.datastore import la_df, merge_postcodes
+from lac_validator.datastore import get_la_df, merge_postcodes
 from lac_validator.types import UploadedFile, UploadError
 
 logger = logging.getLogger(__name__)
@@ -40,6 +47,18 @@ class Timer:
 
 sc = Timer()
 
+# provider info tables most recently built from Ofsted lists, keyed by a hash of the lists.
+PROVIDER_INFO_CACHE_SIZE = 4
+# bump when the layout of the provider info tables, or of their files on disk, changes.
+PROVIDER_INFO_CACHE_VERSION = 2
+# the reference data the inferred local authorities of providers are looked up in.
+REFERENCE_DATA_PACKAGES = [
+    "quality-lac-data-ref-postcodes",
+    "quality-lac-data-ref-authorities",
+]
+_provider_info_cache: "OrderedDict[str, DataFrame]" = OrderedDict()
+_provider_info_lock = threading.Lock()
+
 
 class _BufferedUploadedFile(collections.abc.Mapping):
     def __init__(self, file, name, description):
@@ -79,6 +98,10 @@ def read_from_text(
 
     This function will try to catch most basic upload errors, and dispatch other errors
     to either the csv or xml reader based on the file extension.
+
+    The Ofsted lists are read in a separate thread while the 903 files are read, and the CSVs are
+    read concurrently with each other. Problems found in any of them are raised together, in a
+    single UploadError.
     """
     logger.info(f"Reading from text. {sc.t0}")
     metadata_extras = {}
@@ -94,46 +117,12 @@ def read_from_text(
             f"{num_of_CH_and_SCP[0]} (Children's Homes List) and {num_of_CH_and_SCP[1]} (Social Care Providers List) "
             f"URN lookup tables were loaded - Please only load a single file in each box."
         )
-    elif set(num_of_CH_and_SCP) == {0, 1}:
-        if CH_uploaded:
-            # Checks if a single CH list has wrongly been uploaded, or if a single combined SCPCH list has been uploaded
-            combined_scpch = combined_ch_scp_check(CH_uploaded[0])
-            if combined_scpch:
-                logger.info(
-                    f"Combined 'Childrens home' and 'Social Care Providers' lists detected. {sc.t}"
-                )
-                provider_info_df = scpch_provider_info_table(scpch=CH_uploaded[0])
-                metadata_extras["provider_info"] = provider_info_df
-            else:
-                raise UploadError(
-                    "Please load both the latest 'Children's Homes' and 'Social Care Providers' lists "
-                    "from Ofsted into their respective boxes above."
-                )
-        else:
-            raise UploadError(
-                "Please load both the latest 'Children's Homes' and 'Social Care Providers' lists "
-                "from Ofsted into their respective boxes above."
-            )
-    elif set(num_of_CH_and_SCP) == {1}:
-        logger.info(
-            f"Ofsted CH & SCP spreadsheets received - constructing provider info table. {sc.t}"
-        )
-        (CH_uploaded,) = CH_uploaded  # These should both be single-element lists
-        (SCP_uploaded,) = SCP_uploaded
-        provider_info_df = construct_provider_info_table(
-            CH=CH_uploaded, SCP=SCP_uploaded
+    elif num_of_CH_and_SCP == (0, 1):
+        raise UploadError(
+            "Please load both the latest 'Children's Homes' and 'Social Care Providers' lists "
+            "from Ofsted into their respective boxes above."
         )
-        metadata_extras["provider_info"] = provider_info_df
-
-        # logger.info(
-        #     "created providers table. shape:{1} rows, {0}".format(
-        #         *provider_info_df.shape
-        #     )
-        # )
-        logger.debug(f'{", ".join(provider_info_df.columns)}')
-        logger.debug(f"providers dtypes: {provider_info_df.dtypes}")
-
-    else:
+    elif num_of_CH_and_SCP == (0, 0):
         logger.info(
             "Ofsted CH & SCP spreadsheets not loaded - checks involving URN lookup will be skipped."
         )
@@ -150,15 +139,242 @@ def read_from_text(
         raise UploadError(
             f"Mix of CSV and XML files found ({extensions})! Please reupload."
         )
+    elif extensions not in (["csv"], ["xml"]):
+        raise UploadError(f"Unknown file type {extensions[0]} found.")
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        if CH_uploaded:
+            provider_info = pool.submit(
+                read_provider_info, CH_uploaded[0], (SCP_uploaded or [None])[0]
+            )
+
+        try:
+            if extensions == ["csv"]:
+                metadata_extras["file_format"] = "csv"
+                dfs = read_csvs_from_text(raw_files)
+            else:
+                metadata_extras["file_format"] = "xml"
+                dfs = read_xml_from_text(raw_files[0]["file_content"])
+        except UploadError as error:
+            errors.append(error)
+
+        if CH_uploaded:
+            try:
+                metadata_extras["provider_info"] = provider_info.result()
+            except UploadError as error:
+                errors.insert(0, error)
+
+    if errors:
+        raise UploadError("\n".join(str(error) for error in errors))
+    return dfs, metadata_extras
+
+
+def read_provider_info(
+    CH: UploadedFile,
+    SCP: Optional[UploadedFile] = None,
+    cache_dir: Union[str, Path, None] = None,
+) -> DataFrame:
+    """
+    Reads the provider info table from the Ofsted lists. If only the Children's Homes box was filled,
+    it must hold a combined Children's Homes and Social Care Providers list.
+
+    The lists change monthly, so tables are cached by a hash of the lists' contents and the versions of
+    the reference data: in memory, and, if cache_dir is given or the LAC_VALIDATOR_PROVIDER_CACHE
+    environment variable is set, on disk. The tables are saved without pickling (see _save_table), so
+    loading them can't run code.
+
+    :param CH: the file uploaded as the Children's Homes list.
+    :param SCP: the file uploaded as the Social Care Providers list, if any.
+    :param cache_dir: directory to keep built tables in, between processes.
+    :return: the provider info table, see construct_provider_info_table.
+    """
+    key = hashlib.sha256(
+        f"{PROVIDER_INFO_CACHE_VERSION}:{_reference_data_versions()}:{_content_hash(CH, SCP)}".encode()
+    ).hexdigest()
+    cache_dir = cache_dir or os.getenv("LAC_VALIDATOR_PROVIDER_CACHE")
+    cache_file = Path(cache_dir) / f"provider_info_{key}.npz" if cache_dir else None
+
+    with _provider_info_lock:
+        cached = _provider_info_cache.get(key)
+        if cached is not None:
+            _provider_info_cache.move_to_end(key)
+    if cached is not None:
+        logger.info(f"Using cached provider info table. {sc.t}")
+        return cached.copy()
+    if cache_file is not None and cache_file.is_file():
+        logger.info(f"Loading provider info table from {cache_file}. {sc.t}")
+        provider_info_df = _load_table(cache_file)
     else:
-        if extensions == ["csv"]:
-            metadata_extras["file_format"] = "csv"
-            return read_csvs_from_text(raw_files), metadata_extras
-        elif extensions == ["xml"]:
-            metadata_extras["file_format"] = "xml"
-            return read_xml_from_text(raw_files[0]["file_content"]), metadata_extras
+        provider_info_df = _build_provider_info(CH, SCP)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so other processes never read a partial table.
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            if _save_table(provider_info_df, temp_file):
+                temp_file.replace(cache_file)
+            else:
+                logger.warning(
+                    "Provider info table can't be saved, so it isn't cached on disk"
+                )
+
+    with _provider_info_lock:
+        _provider_info_cache[key] = provider_info_df
+        if len(_provider_info_cache) > PROVIDER_INFO_CACHE_SIZE:
+            _provider_info_cache.popitem(last=False)
+    return provider_info_df.copy()
+
+
+def _build_provider_info(CH: UploadedFile, SCP: Optional[UploadedFile]) -> DataFrame:
+    if SCP is None:
+        # Checks if a single CH list has wrongly been uploaded, or if a single combined SCPCH list has been uploaded
+        sheets = combined_ch_scp_check(CH)
+        if not sheets:
+            raise UploadError(
+                "Please load both the latest 'Children's Homes' and 'Social Care Providers' lists "
+                "from Ofsted into their respective boxes above."
+            )
+        logger.info(
+            f"Combined 'Childrens home' and 'Social Care Providers' lists detected. {sc.t}"
+        )
+        return scpch_provider_info_table(scpch=CH, sheets=sheets)
+
+    logger.info(
+        f"Ofsted CH & SCP spreadsheets received - constructing provider info table. {sc.t}"
+    )
+    provider_info_df = construct_provider_info_table(CH=CH, SCP=SCP)
+    logger.debug(f'{", ".join(provider_info_df.columns)}')
+    logger.debug(f"providers dtypes: {provider_info_df.dtypes}")
+    return provider_info_df
+
+
+def _content_hash(*files: Union[UploadedFile, str, None]) -> str:
+    """
+    Hashes the contents of uploaded files. Files may also be given as paths, as they can be to
+    construct_provider_info_table.
+    """
+    content_hash = hashlib.sha256()
+    for file in files:
+        if file is None:
+            content = b""
+        elif isinstance(file, str):
+            content = Path(file).read_bytes()
         else:
-            raise UploadError(f"Unknown file type {extensions[0]} found.")
+            content = file["file_content"]
+            if isinstance(content, str):
+                content = content.encode()
+        content_hash.update(len(content).to_bytes(8, "little"))
+        content_hash.update(content)
+    return content_hash.hexdigest()
+
+
+def _reference_data_versions() -> str:
+    """
+    The installed versions of the reference data packages, which the provider info tables depend on.
+    """
+    versions = []
+    for package in REFERENCE_DATA_PACKAGES:
+        try:
+            versions.append(f"{package}=={importlib.metadata.version(package)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{package} not installed")
+    return ",".join(versions)
+
+
+# the types of the values of object columns saved by _save_table, and how each is read back from text.
+_VALUE_TYPES = {
+    0: lambda text: None,
+    1: lambda text: nan,
+    2: lambda text: pd.NaT,
+    3: str,
+    4: pd.Timestamp,
+    5: int,
+    6: float,
+}
+
+
+def _encode_values(values: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Encodes a column as arrays that np.save can write without pickling: object columns as the text and
+    type of each value, other columns as they are.
+
+    :return: the arrays, or None if the column holds values of other types.
+    """
+    if values.dtype != object:
+        return {"values": values}
+    types = np.empty(len(values), dtype="int8")
+    texts = []
+    for position, value in enumerate(values):
+        if value is None:
+            value_type, text = 0, ""
+        elif value is pd.NaT:
+            value_type, text = 2, ""
+        elif isinstance(value, str):
+            value_type, text = 3, value
+        elif isinstance(value, pd.Timestamp):
+            value_type, text = 4, value.isoformat()
+        elif isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+            value_type, text = 5, str(value)
+        elif isinstance(value, (float, np.floating)):
+            value_type, text = (1, "") if np.isnan(value) else (6, repr(float(value)))
+        else:
+            return None
+        types[position] = value_type
+        texts.append(text)
+    return {"types": types, "texts": np.array(texts, dtype=str)}
+
+
+def _save_table(df: DataFrame, path: Path) -> bool:
+    """
+    Saves a table with np.savez, without pickling, so that loading it with _load_table can't run code.
+
+    :return: whether the table could be saved: its columns must have unique string names and numpy dtypes,
+        and any object columns must hold only strings, numbers, Timestamps and missing values.
+    """
+    if not df.columns.is_unique or not all(
+        isinstance(name, str) for name in df.columns
+    ):
+        return False
+    arrays = {"columns": np.array(df.columns, dtype=str)}
+    columns = {position: values for position, (_, values) in enumerate(df.items())}
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        columns["index"] = df.index.to_series()
+    for position, values in columns.items():
+        if not isinstance(values.dtype, np.dtype):
+            return False
+        encoded = _encode_values(values.to_numpy())
+        if encoded is None:
+            return False
+        for name, array in encoded.items():
+            arrays[f"{position}_{name}"] = array
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+    return True
+
+
+def _load_table(path: Path) -> DataFrame:
+    """
+    Loads a table saved by _save_table.
+    """
+
+    def decode(arrays, position):
+        if f"{position}_values" in arrays.files:
+            return arrays[f"{position}_values"]
+        types = arrays[f"{position}_types"].tolist()
+        texts = arrays[f"{position}_texts"].tolist()
+        values = np.empty(len(types), dtype=object)
+        values[:] = [_VALUE_TYPES[t](text) for t, text in zip(types, texts)]
+        return values
+
+    with np.load(path, allow_pickle=False) as arrays:
+        columns = arrays["columns"].tolist()
+        has_index = any(name.startswith("index_") for name in arrays.files)
+        index = decode(arrays, "index") if has_index else None
+        return DataFrame(
+            {name: decode(arrays, position) for position, name in enumerate(columns)},
+            columns=columns,
+            index=index,
+        )
 
 
 def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
@@ -213,7 +429,9 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     logger.info(f"URN lookup bytes recieved. Reading excel files... {sc.t}")
 
     # read childrens homes file
-    CH_sheets = pd.ExcelFile(CH_bytes, engine="openpyxl").sheet_names
+    # each workbook is opened once, and its sheets parsed from the open file.
+    CH_excel = pd.ExcelFile(CH_bytes, engine="openpyxl")
+    CH_sheets = CH_excel.sheet_names
     CH_cols = [
         "URN",
         "Local Authority",
@@ -225,9 +443,7 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
 
     # check whether file includes consolidated provider information sheet
     if "Provider information" in CH_sheets:
-        CH_providers = pd.read_excel(
-            CH_bytes, sheet_name="Provider information", engine="openpyxl"
-        )
+        CH_providers = CH_excel.parse(sheet_name="Provider information")
         logger.debug(
             f"Reading CH provider info from excel done. cols:{CH_providers.columns} {sc.t}"
         )
@@ -258,16 +474,12 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     # if not check whether file includes separate setting and address sheets
     elif "Settings and Inspection Info" in CH_sheets and "Address Details" in CH_sheets:
         # this sheet contains all columns except the postcode
-        CH_setting = pd.read_excel(
-            CH_bytes, sheet_name="Settings and Inspection Info", engine="openpyxl"
-        )
+        CH_setting = CH_excel.parse(sheet_name="Settings and Inspection Info")
         logger.debug(
             f"Reading CH setting info from excel done. cols:{CH_setting.columns} {sc.t}"
         )
         # from this sheet we need only the postcode
-        CH_address = pd.read_excel(
-            CH_bytes, sheet_name="Address Details", engine="openpyxl"
-        )
+        CH_address = CH_excel.parse(sheet_name="Address Details")
         logger.debug(
             f"Reading CH address info from excel done. cols:{CH_address.columns} {sc.t}"
         )
@@ -301,6 +513,7 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
             "Failed to find expected sheet names in Childrens Homes List. "
             'Expected "Provider information" or "Setting and Inspection Info" and "Address Details"'
         )
+    CH_excel.close()
 
     CH_df["source"] = "CH List"
     CH_df["Provider Placement Code"] = CH_df["Provider Placement Code"].str.replace(
@@ -311,15 +524,13 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     logger.info(f"CH dataframe complete. Creating SCP dataframe {sc.t}")
 
     # read social care providers file
-    SCP_current = pd.read_excel(
-        SCP_bytes, engine="openpyxl", sheet_name=0
-    )  # current providers
+    SCP_excel = pd.ExcelFile(SCP_bytes, engine="openpyxl")
+    SCP_current = SCP_excel.parse(sheet_name=0)  # current providers
     logger.debug(
         f"Reading SCP_current from excel done. cols: {SCP_current.columns}. {sc.t}"
     )
-    SCP_closed = pd.read_excel(
-        SCP_bytes, engine="openpyxl", sheet_name=1
-    )  # closed providers
+    SCP_closed = SCP_excel.parse(sheet_name=1)  # closed providers
+    SCP_excel.close()
     logger.debug(
         f"Reading SCP_closed from excel done. cols: {SCP_closed.columns}. {sc.t}"
     )
@@ -370,7 +581,7 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     # infer LA based on provider's postcode. this does not necessarily match what's in the file!
     provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = (
         merge_postcodes(provider_info_df, "POSTCODE")
-        .merge(la_df, how="left", left_on="laua", right_on="LTLA21CD")
+        .merge(get_la_df(), how="left", left_on="laua", right_on="LTLA21CD")
         .loc[:, ["UTLA21CD", "UTLA21NM"]]
     )
 
@@ -378,10 +589,13 @@ def construct_provider_info_table(CH: UploadedFile, SCP: UploadedFile):
     return provider_info_df
 
 
-def scpch_provider_info_table(scpch: UploadedFile):
+def scpch_provider_info_table(
+    scpch: UploadedFile, sheets: Optional[Dict[str, DataFrame]] = None
+):
     """
     inputs:
     Combined CH (childrens homes) and SCP (social care providers) lists as the files' contents as passed in by the frontend
+    sheets, if the list has already been read: its sheets, as returned by combined_ch_scp_check
 
     returns:
     provider_info_df is a dataframe
@@ -431,7 +645,9 @@ def scpch_provider_info_table(scpch: UploadedFile):
     ]
     logger.info(f"URN lookup bytes recieved. Reading excel files... {sc.t}")
 
-    scpch_providers = pd.read_excel(scpch_bytes, sheet_name=None, engine="openpyxl")
+    if sheets is None:
+        sheets = pd.read_excel(scpch_bytes, sheet_name=None, engine="openpyxl")
+    scpch_providers = sheets
     # Checks to see if it's the one sheet or two sheet version
     if len(scpch_providers) == 1:
         # next iter has a lower memory overhead than extracting the first element via a list
@@ -494,7 +710,7 @@ def scpch_provider_info_table(scpch: UploadedFile):
     # infer LA based on provider's postcode. this does not necessarily match what's in the file!
     provider_info_df[["LA_CODE_INFERRED", "LA_NAME_INFERRED"]] = (
         merge_postcodes(provider_info_df, "POSTCODE")
-        .merge(la_df, how="left", left_on="laua", right_on="LTLA21CD")
+        .merge(get_la_df(), how="left", left_on="laua", right_on="LTLA21CD")
         .loc[:, ["UTLA21CD", "UTLA21NM"]]
     )
 
@@ -526,47 +742,43 @@ def all_cols_to_object_dtype(df) -> pd.DataFrame:
     return df
 
 
-def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
-    def _get_file_type(df) -> str:
-        for table_name, expected_columns in column_names.items():
-            if set(df.columns) == set(expected_columns):
-                logger.info(f"Loaded {table_name} from CSV. ({len(df)} rows)")
-                return table_name
-        else:
-            raise UploadError(
-                f"Failed to match provided data ({list(df.columns)}) to known column names!"
-            )
-
-    files = {}
-    for file_data in raw_files:
-        csv_file = BytesIO(file_data["file_content"])
-        # pd.read_csv on utf-16 files will raise a UnicodeDecodeError. This block prints a descriptive error message if that happens.
-        try:
-            max_cols = max([len(cols) for cols in column_names.values()])
-            df = pd.read_csv(
-                csv_file,
-                converters={
-                    i: lambda s: str(s) if s != "" else nan for i in range(max_cols)
-                },
-            )
+def read_csv_table(csv_file, use_converters=False) -> DataFrame:
+    """
+    Reads a CSV file with every value as an upper-cased string, and empty cells as NaN.
 
-        except UnicodeDecodeError:
-            # raw_files is a list of files of type UploadedFile(TypedDict) whose instance is a dictionary containing the fields name, file_content, Description.
-            # TODO: attempt to identify files that couldnt be decoded at this point; continue; then raise the exception outside the for loop, naming the uploaded filenames
-            raise UploadError(
-                f"Failed to decode one or more files. Try opening the text "
-                f"file(s) in Notepad, then 'Saving As...' with the UTF-8 encoding"
-            )
+    By default the file is read with dtype=str, and only empty cells are treated as missing, so no
+    python code runs per cell. use_converters=True reads it the way it used to be read, converting
+    each cell with a python function, which gives the same result more slowly. It's kept for
+    comparison, see benchmarks/csv_ingest.py.
+    """
+    if use_converters:
+        max_cols = max([len(cols) for cols in column_names.values()])
+        df = pd.read_csv(
+            csv_file,
+            converters={
+                i: lambda s: str(s) if s != "" else nan for i in range(max_cols)
+            },
+        )
         # arrange column data types
-        logger.debug("+" * 50)
-        logger.debug("DF DATATYPES BEFORE CONVERSION", df.dtypes)
         df = all_cols_to_object_dtype(df)
-        logger.debug("AFTER CONVERSION BEFORE CAPITALISING", df.dtypes)
-        # capitalize all string input
-        df = capitalise_object_dtype_cols(df)
-        logger.debug("DF DATATYPES AFTER CAPITALISING", df.dtypes)
+    else:
+        df = pd.read_csv(csv_file, dtype=str, keep_default_na=False, na_values=[""])
+    # capitalize all string input
+    return capitalise_object_dtype_cols(df)
 
-        file_name = _get_file_type(df)
+
+def _read_csv_file(file_data: UploadedFile) -> Tuple[str, DataFrame]:
+    """
+    Reads a single uploaded CSV file.
+
+    :return: the name the table is stored under, and the table.
+    :raises UploadError: if the file can't be decoded, or doesn't match a known table.
+    """
+    csv_file = BytesIO(file_data["file_content"])
+    # pd.read_csv on utf-16 files will raise a UnicodeDecodeError. This block prints a descriptive error message if that happens.
+    try:
+        # check the header before parsing the whole file.
+        file_name = csv_table_name(csv_file)
 
         if "This year" in file_data["description"]:
             name = file_name
@@ -577,9 +789,59 @@ def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
                 f'Unrecognized file description {file_data["description"]}'
             )
 
-        files[name] = df
-        logger.debug("DF NAME: ", name)
-        logger.debug("+" * 50)
+        df = read_csv_table(csv_file)
+
+    except UnicodeDecodeError:
+        raise UploadError(
+            f"Failed to decode the file. Try opening the text "
+            f"file in Notepad, then 'Saving As...' with the UTF-8 encoding"
+        )
+    logger.info(f"Loaded {file_name} from CSV. ({len(df)} rows)")
+    logger.debug(f"DF NAME: {name}")
+    return name, df
+
+
+def csv_table_name(csv_file) -> str:
+    """
+    Identifies the table a CSV file holds from its header row alone, so files that don't match a known
+    table are rejected before the rest of the file is parsed. The file is left at its start.
+
+    :param csv_file: file-like holding the CSV.
+    :return: name of the table whose columns match the header.
+    :raises UploadError: if the columns don't match those of any table.
+    """
+    columns = pd.read_csv(csv_file, nrows=0).columns
+    csv_file.seek(0)
+    for table_name, expected_columns in column_names.items():
+        if set(columns) == set(expected_columns):
+            return table_name
+    raise UploadError(
+        f"Failed to match provided data ({list(columns)}) to known column names!"
+    )
+
+
+def read_csvs_from_text(
+    raw_files: List[UploadedFile], max_workers: Optional[int] = None
+) -> Dict[str, DataFrame]:
+    """
+    Reads the uploaded CSV files concurrently, in a pool of max_workers threads. Files that can't be
+    read are all named in a single UploadError.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_read_csv_file, file_data) for file_data in raw_files]
+
+    files = {}
+    errors = []
+    for position, (file_data, future) in enumerate(zip(raw_files, futures), start=1):
+        try:
+            name, df = future.result()
+        except UploadError as error:
+            file_name = file_data.get("name") or f"File {position}"
+            errors.append(f"{file_name}: {error}")
+        else:
+            files[name] = df
+    if errors:
+        raise UploadError("\n".join(errors))
 
     # Adding UASC column to Header table
     for header_name, uasc_name in (("Header", "UASC"), ("Header_last", "UASC_last")):
@@ -597,101 +859,110 @@ def read_csvs_from_text(raw_files: List[UploadedFile]) -> Dict[str, DataFrame]:
 
 
 def read_xml_from_text(xml_string) -> Dict[str, DataFrame]:
-    header_df = []
-    episodes_df = []
-    uasc_df = []
-    oc2_df = []
-    oc3_df = []
-    ad1_df = []
-    reviews_df = []
-    sbpfa_df = []
-    prev_perm_df = []
-    missing_df = []
+    """
+    Reads the tables from an XML upload. The file is parsed a CHILD element at a time, and each one is
+    cleared once its rows have been read, so memory use follows the size of the tables rather than
+    that of the whole XML tree. Values are appended straight to per-table column lists.
+    """
+    # The CHILDID tag needs to be renamed to CHILD to match the CSV
+    # The PL tag needs to be renamed to PLACE to match the CSV
+    conversions = {
+        "CHILDID": "CHILD",
+        "PL": "PLACE",
+    }
+    # tables read from elements nested in HEADER, by tag.
+    header_tables = {
+        "AREVIEW": "Reviews",
+        "AMISSING": "Missing",
+        "OC2": "OC2",
+        "PERMANENCE": "PrevPerm",
+        "AD_PLACED": "PlacedAdoption",
+    }
+    table_names = [
+        "Header",
+        "Episodes",
+        "UASC",
+        "Reviews",
+        "OC2",
+        "OC3",
+        "AD1",
+        "PlacedAdoption",
+        "PrevPerm",
+        "Missing",
+    ]
 
-    def read_data(table):
-        # The CHILDID tag needs to be renamed to CHILD to match the CSV
-        # The PL tag needs to be renamed to PLACE to match the CSV
-        conversions = {
-            "CHILDID": "CHILD",
-            "PL": "PLACE",
+    # Add UASC column to Header table
+    columns = {
+        table_name: {
+            column: []
+            for column in column_names[table_name]
+            + (["UASC"] if table_name == "Header" else [])
         }
+        for table_name in table_names
+    }
+
+    def read_data(table):
         return {
             conversions.get(node.tag, node.tag): node.text
             for node in table.iter()
             if len(node) == 0
         }
 
-    def get_fields_for_table(all_data, table_name):
-        def read_value(k):
-            val = all_data.get(k, None)
-            if val is None:
-                return nan
-            if not isinstance(val, str):
-                logger.warning(
-                    f"Got a non-string thing reading {table_name}:{k} from xml -- got {val}, of type {type(val)}"
-                )
-            return val
-
-        # Add UASC column to Header and Header_last tables
-        cols = column_names[table_name]
-        if table_name in ["Header", "Header_last"]:
-            cols = cols + ["UASC"]
-
-        return pd.Series({k: read_value(k) for k in cols}, dtype=object)
+    def add_row(table_name, all_data, data=None):
+        # values in data take precedence over those read from the whole child.
+        for column, values in columns[table_name].items():
+            if data is not None and column in data:
+                value = data[column]
+            else:
+                value = all_data.get(column)
+            values.append(nan if value is None else value)
 
-    for child in ET.fromstring(xml_string):
+    def read_child(child):
         all_data = read_data(child)
-        header_df.append(get_fields_for_table(all_data, "Header"))
+        add_row("Header", all_data)
         if all_data.get("UASC", None) is not None:
-            uasc_df.append(get_fields_for_table(all_data, "UASC"))
+            add_row("UASC", all_data)
         if all_data.get("IN_TOUCH", None) is not None:
-            oc3_df.append(get_fields_for_table(all_data, "OC3"))
+            add_row("OC3", all_data)
         if all_data.get("DATE_INT", None) is not None:
-            ad1_df.append(get_fields_for_table(all_data, "AD1"))
+            add_row("AD1", all_data)
         for table in child:
             if table.tag == "EPISODE":
-                data = read_data(table)
-                episodes_df.append(
-                    get_fields_for_table({**all_data, **data}, "Episodes")
-                )
+                add_row("Episodes", all_data, read_data(table))
             elif table.tag == "HEADER":
                 for child_table in table:
-                    if child_table.tag == "AREVIEW":
-                        data = read_data(child_table)
-                        reviews_df.append(
-                            get_fields_for_table({**all_data, **data}, "Reviews")
-                        )
-                    elif child_table.tag == "AMISSING":
-                        data = read_data(child_table)
-                        missing_df.append(
-                            get_fields_for_table({**all_data, **data}, "Missing")
-                        )
-                    elif child_table.tag == "OC2":
-                        data = read_data(child_table)
-                        oc2_df.append(get_fields_for_table({**all_data, **data}, "OC2"))
-                    elif child_table.tag == "PERMANENCE":
-                        data = read_data(child_table)
-                        prev_perm_df.append(
-                            get_fields_for_table({**all_data, **data}, "PrevPerm")
-                        )
-                    elif child_table.tag == "AD_PLACED":
-                        data = read_data(child_table)
-                        sbpfa_df.append(
-                            get_fields_for_table({**all_data, **data}, "PlacedAdoption")
+                    if child_table.tag in header_tables:
+                        add_row(
+                            header_tables[child_table.tag],
+                            all_data,
+                            read_data(child_table),
                         )
 
-    data = {
-        "Header": pd.DataFrame(header_df),
-        "Episodes": pd.DataFrame(episodes_df),
-        "UASC": pd.DataFrame(uasc_df),
-        "Reviews": pd.DataFrame(reviews_df),
-        "OC2": pd.DataFrame(oc2_df),
-        "OC3": pd.DataFrame(oc3_df),
-        "AD1": pd.DataFrame(ad1_df),
-        "PlacedAdoption": pd.DataFrame(sbpfa_df),
-        "PrevPerm": pd.DataFrame(prev_perm_df),
-        "Missing": pd.DataFrame(missing_df),
-    }
+    if isinstance(xml_string, str):
+        source = StringIO(xml_string)
+    else:
+        source = BytesIO(xml_string)
+
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = element
+            continue
+        if depth == 2:
+            read_child(element)
+            # drop the child, and its reference from the root, now it has been read.
+            root.clear()
+        depth -= 1
+
+    data = {}
+    for table_name, table_columns in columns.items():
+        if len(next(iter(table_columns.values()))) == 0:
+            data[table_name] = pd.DataFrame()
+        else:
+            data[table_name] = pd.DataFrame(table_columns, dtype=object)
 
     # capitalize string columns
     for df in data.values():
@@ -707,6 +978,8 @@ def combined_ch_scp_check(excel_to_check):
     """
     Checks whether the file uploaded to the front end in the Children's home box is a CH list or a combined SPC/CH list.
     Only runs in instances where the number fo files uploaded in the SCP/CH boxes is one.
+    Returns the sheets of a combined list, read with pd.read_excel, so that scpch_provider_info_table doesn't
+    read it again.
     """
     if isinstance(excel_to_check, bytes):
         CH_bytes = excel_to_check
@@ -725,7 +998,8 @@ def combined_ch_scp_check(excel_to_check):
             "but it doesn't appear to be a combined list."
             "Please upload lists from Ofsted into their respective boxes above."
         )
-    df = pd.read_excel(CH_bytes, engine="openpyxl")
+    sheets = pd.read_excel(CH_bytes, sheet_name=None, engine="openpyxl")
+    df = next(iter(sheets.values()))
     df.columns = df.columns.str.lower()
     if "provider type" not in df.columns:
         logger.info(
@@ -743,7 +1017,7 @@ def combined_ch_scp_check(excel_to_check):
         logger.info(
             f"Combined 'Childrens home' and 'Social Care Providers' lists detected. {sc.t}"
         )
-        return True
+        return sheets
     if (len(df["provider type"]) == 1) & (
         "Children's Home" in df["provider type"].values
     ):
@@ -1,20 +1,104 @@
 import logging
-from typing import Any, Optional
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterator, NamedTuple, Optional, Union
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from lac_validator.datastore import copy_datastore, create_datastore
+from lac_validator.datastore import (
+    DatastoreView,
+    changed_children,
+    copy_datastore,
+    create_datastore,
+    fingerprint_children,
+    fingerprint_datastore,
+    rebuild_datastore,
+    shard_datastore,
+    subset_datastore,
+)
 from lac_validator.ingress import read_from_text
 from lac_validator.rule_engine import RuleDefinition
+from lac_validator.rules.ruleset_utils import load_rule
 from lac_validator.types import UploadedFile
 
 logger = logging.getLogger(__name__)
 
+EXECUTORS = ("thread", "process")
+
+# tables that rules declare, but that are stored in the datastore's metadata.
+METADATA_TABLES = {"Provider Info": "provider_info"}
+
+RULE_PROFILE_COLUMNS = [
+    "Code",
+    "Status",
+    "WallTime",
+    "CPUTime",
+    "PeakMemory",
+    "RowsTouched",
+]
+
+
+class RuleProfile(NamedTuple):
+    """
+    Resources used by one run of a rule.
+
+    :param float wall_time: seconds from the rule starting to it returning.
+    :param float cpu_time: CPU seconds used by the thread running the rule.
+    :param int peak_memory: the most memory allocated by the rule at once, in bytes, or None if memory
+        wasn't traced.
+    :param int rows_touched: rows in the tables the rule read.
+    """
+
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int]
+    rows_touched: int
+
 
 class LacValidator:
     """
     Central location for running rules on files.
+
+    Rules whose declared tables weren't all uploaded are skipped without being run, and the missing
+    tables are recorded in self.skip_reasons.
+
+    By default rules are run one after another. Passing executor="thread" or executor="process"
+    spreads them over a pool of max_workers threads or processes instead. Results are merged in
+    registry order, so they are the same whichever executor is used.
+
+    Each rule is given a DatastoreView, which copies a table only when the rule reads it. Passing
+    check_mutations=True also fingerprints the tables each rule reads, before and after running it,
+    and records in self.mutations the rules that changed the shared data. This is a debugging aid:
+    it runs the rules one after another, whichever executor is chosen.
+
+    The rows each rule flags are kept in self.errors, as positions within each table. The wide
+    ds_results tables, with one ERR_ column per rule, are only built when ds_results is first read.
+
+    The time each rule took, and the rows of the tables it read, are recorded in rule_profile.
+    Passing profile_memory=True also traces the memory each rule allocates, with tracemalloc, which
+    makes the rules run more slowly. With executor="thread" the rules share one trace, so a rule's
+    peak includes memory allocated by rules running alongside it.
+
+    Passing previous, the LacValidator of an earlier upload of the same return, revalidates only the
+    children whose rows changed since then. Rules are run on just those children, and their errors are
+    combined with the errors the previous run found for the other children. Rules declared whole_dataset,
+    rules that failed or weren't run last time, and rules that behave differently on the subset are run
+    on all of the data. Everything is validated again if the metadata or the tables' columns have
+    changed. The children that were revalidated are recorded in self.changed_children, which is None
+    after a full validation.
+
+    Passing shards splits the datastore into that many shards by CHILD, each with all the rows of its
+    children, and runs the rules on each shard in turn, or on a pool of max_workers threads or processes
+    if an executor is chosen, so that each rule works on the rows of a shard at a time rather than on
+    the whole return. Rules declared whole_dataset, and rules that fail or are skipped on some shards
+    but not others, are run on all of the data. shards is ignored when checking mutations or
+    revalidating.
     """
 
     def __init__(
@@ -23,11 +107,41 @@ class LacValidator:
         files: list[UploadedFile],
         registry: dict[str, RuleDefinition],
         selected_rules: Optional[list[str]] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        check_mutations: bool = False,
+        profile_memory: bool = False,
+        previous: Optional["LacValidator"] = None,
+        shards: Optional[int] = None,
     ):
+        if executor is not None and executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor {executor}. Expected one of: {', '.join(EXECUTORS)}"
+            )
+        if shards is not None and shards < 1:
+            raise ValueError(f"shards must be at least 1, not {shards}")
+        self.executor = executor
+        self.shards = shards
+        self.max_workers = max_workers
+        self.check_mutations = check_mutations
+        self.profile_memory = profile_memory
+
         self.dfs: dict[str, DataFrame] = {}
         self.dones: list[str] = []
         self.skips: list[str] = []
         self.fails: list[str] = []
+        # tables that were missing, for each rule skipped without being run.
+        self.skip_reasons: dict[str, list[str]] = {}
+        # tables changed by each rule, if check_mutations is set.
+        self.mutations: dict[str, list[str]] = {}
+        self.errors: Optional[ErrorLocations] = None
+        self._ds_results: Optional[dict[str, Any]] = None
+        # code, status and RuleProfile of each rule, in the order the rules were run.
+        self._profiles: list[tuple[str, str, Optional[RuleProfile]]] = []
+        # CHILD of each child revalidated, if validated incrementally.
+        self.changed_children: Optional[pd.Index] = None
+        # hashes of each child's rows, from fingerprint_children, once needed.
+        self._child_fingerprints: Optional[dict[str, pd.Series]] = None
 
         logger.info("Reading uploaded files...")
         dfs, metadata_extras = read_from_text(raw_files=files)
@@ -40,7 +154,7 @@ class LacValidator:
         self.metadata = metadata
 
         # validate
-        self.validate(selected_rules)
+        self.validate(selected_rules, previous)
 
     def get_rules_to_run(
         self,
@@ -62,55 +176,721 @@ class LacValidator:
         else:
             return registry
 
-    def validate(self, selected_rules: Optional[list[str]] = None):
+    def validate(
+        self,
+        selected_rules: Optional[list[str]] = None,
+        previous: Optional["LacValidator"] = None,
+    ):
         logger.info("Creating Data store...")
         data_store = create_datastore(self.dfs, self.metadata)
 
         rules_to_run = self.get_rules_to_run(self.registry, selected_rules)
 
+        self.errors = ErrorLocations(data_store)
+        self._ds_results = None
+        self._profiles = []
+        self._child_fingerprints = None
+        self.changed_children = None
+
+        start_tracing = self.profile_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            results = None
+            if previous is not None:
+                results = self._revalidate(rules_to_run, data_store, previous)
+            if results is None and self.shards and not self.check_mutations:
+                results = self._run_sharded(rules_to_run, data_store)
+            if results is None:
+                results = self._run_rules(rules_to_run, data_store)
+            for rule_code, rule, result, profile in results:
+                self._record_result(rule_code, rule, result, profile)
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+
+    def _record_result(
+        self,
+        rule_code: str,
+        rule: RuleDefinition,
+        result: Optional[dict[str, list[Any]]],
+        profile: Optional[RuleProfile],
+    ):
+        """
+        Records the result of a rule: whether it ran, and the rows it flagged.
+        """
+        if result is None:
+            # document instances where the rule cannot run on the data
+            self.fails.append(rule_code)
+            self._profiles.append((rule_code, "failed", profile))
+            return
+
+        if result == {}:
+            # validation rules return an empty dict if the required tables are not all available.
+            if rule_code in self.skip_reasons:
+                missing = ", ".join(self.skip_reasons[rule_code])
+                logger.info(f"Error code {rule.code} skipped, missing {missing}")
+            else:
+                logger.info(f"Error code {rule.code} skipped due to missing tables")
+            self.skips.append(rule.code)
+            self._profiles.append((rule_code, "skipped", profile))
+        else:
+            self.dones.append(rule.code)
+            self._profiles.append((rule_code, "done", profile))
+
+        # map failing locations back to data files.
+        for table, values in result.items():
+            if len(values) > 0:
+                logger.info(f"Error code {rule.code} found {len(values)} errors")
+                nof_errors = len(values)
+                # select out only the valid values, that is remove all nans.
+                values = [i for i, not_nan in zip(values, pd.notna(values)) if not_nan]
+                nof_nans = nof_errors - len(values)
+                if nof_nans != 0:
+                    logger.warning(
+                        f"{rule.code} returned {nof_nans} NaNs! "
+                        + f"Output: {str(values)}"
+                    )
+                self.errors.add(table, rule.code, values)
+
+    @property
+    def ds_results(self) -> dict[str, Any]:
+        """
+        The datastore with an ERR_ column added to each table for every rule that returned errors in
+        it. The column is True on the flagged rows and NaN elsewhere.
+        """
         # this corresponds to raw_data in CINvalidationSession
-        self.ds_results = copy_datastore(data_store)
+        if self._ds_results is None:
+            self._ds_results = self.errors.to_ds_results()
+        return self._ds_results
 
-        for rule_code, rule in rules_to_run.items():
-            logger.info(f"Validating rule {rule_code}...")
-
-            # get a clean copy of the files to be validated
-            ds_copy = copy_datastore(data_store)
-
-            try:
-                # get the result from when the rule is run on the data.
-                result: dict[str, list[Any]] = rule.func(ds_copy)
-            except Exception as e:
-                # document instances where the rule cannot run on the data
-                logger.exception(f"Rule code {rule_code} failed to run!")
-                self.fails.append(rule_code)
+    @property
+    def rule_profile(self) -> DataFrame:
+        """
+        One row per rule, in the order the rules were run, with the rule's Code, its Status (done, skipped
+        or failed), the WallTime and CPUTime it took in seconds, the PeakMemory it allocated in bytes and
+        the RowsTouched in the tables it read. Rules skipped without being run, because their tables are
+        missing, have no times. PeakMemory is only recorded with profile_memory=True.
+        """
+        rows = []
+        for rule_code, status, profile in self._profiles:
+            if profile is None:
+                rows.append((rule_code, status, np.nan, np.nan, np.nan, 0))
+            else:
+                peak_memory = profile.peak_memory
+                rows.append(
+                    (
+                        rule_code,
+                        status,
+                        profile.wall_time,
+                        profile.cpu_time,
+                        np.nan if peak_memory is None else peak_memory,
+                        profile.rows_touched,
+                    )
+                )
+        return DataFrame(rows, columns=RULE_PROFILE_COLUMNS)
+
+    def fingerprint_children(self) -> dict[str, pd.Series]:
+        """
+        The hashes of each child's rows in the validated datastore, from fingerprint_children.
+        """
+        if self._child_fingerprints is None:
+            self._child_fingerprints = fingerprint_children(self.errors.data_store)
+        return self._child_fingerprints
+
+    def _revalidate(
+        self,
+        rules_to_run: dict[str, RuleDefinition],
+        data_store: dict[str, Any],
+        previous: "LacValidator",
+    ) -> Optional[
+        Iterator[
+            tuple[
+                str,
+                RuleDefinition,
+                Optional[dict[str, list[Any]]],
+                Optional[RuleProfile],
+            ]
+        ]
+    ]:
+        """
+        Runs the rules on the children that changed since the previous validation, and combines their errors
+        with the previous errors of the other children.
+
+        :param dict rules_to_run: rules to run, keyed by rule code.
+        :param dict data_store: the datastore the rules are run on.
+        :param LacValidator previous: the validation of an earlier upload.
+        :return: rule code, rule, result and profile for each rule, as from _run_rules, or None if the
+            uploads can't be compared child by child, so everything must be validated again.
+        """
+        previous_store = previous.errors.data_store
+        if not _same_metadata(previous_store["metadata"], data_store["metadata"]):
+            logger.info("Metadata changed, validating all children")
+            return None
+        self._child_fingerprints = fingerprint_children(data_store)
+        children = changed_children(
+            previous_store,
+            data_store,
+            previous.fingerprint_children(),
+            self._child_fingerprints,
+        )
+        if children is None:
+            logger.info("Tables changed, validating all children")
+            return None
+        logger.info(f"Revalidating {len(children)} changed children...")
+        self.changed_children = children
+
+        previous_status = {
+            rule_code: status for rule_code, status, _ in previous._profiles
+        }
+        previous_errors = previous.errors.by_rule()
+        per_child_rules = {
+            rule_code: rule
+            for rule_code, rule in rules_to_run.items()
+            if not rule.whole_dataset
+            and previous_status.get(rule_code) in ("done", "skipped")
+        }
+
+        def moved(table_name):
+            return _moved_rows(
+                previous_store[table_name], data_store[table_name], children
+            )
+
+        if len(children) > 0:
+            subset_results = self._run_rules(
+                per_child_rules, subset_datastore(data_store, children)
+            )
+        else:
+            # there are no children to run the rules on, so each gives what it would for no errors.
+            tables = {
+                table_name: [] for table_name in data_store if table_name != "metadata"
+            }
+            for rule_code in per_child_rules:
+                if rule_code in previous.skip_reasons:
+                    self.skip_reasons[rule_code] = previous.skip_reasons[rule_code]
+            subset_results = (
+                (
+                    rule_code,
+                    rule,
+                    {} if previous_status[rule_code] == "skipped" else tables,
+                    None,
+                )
+                for rule_code, rule in per_child_rules.items()
+            )
+
+        row_maps = {}
+        spliced = {}
+        for rule_code, rule, result, profile in subset_results:
+            if result is None or (result == {}) != (
+                previous_status[rule_code] == "skipped"
+            ):
+                # the rule needs children it wasn't given; run it on all of them instead.
                 continue
+            result = {table_name: list(labels) for table_name, labels in result.items()}
+            for table_name, positions in previous_errors.get(rule_code, {}).items():
+                if table_name not in row_maps:
+                    row_maps[table_name] = moved(table_name)
+                positions = row_maps[table_name][positions]
+                labels = data_store[table_name].index[positions[positions >= 0]]
+                result.setdefault(table_name, []).extend(labels)
+            spliced[rule_code] = (rule_code, rule, result, profile)
 
-            if result == {}:
-                # TODO replace this with behaviour that models rules skipped because of lack of data.
+        full_rules = {
+            rule_code: rule
+            for rule_code, rule in rules_to_run.items()
+            if rule_code not in spliced
+        }
+        logger.info(f"Validating {len(full_rules)} rules on all children...")
+        full_results = {
+            rule_code: (rule_code, rule, result, profile)
+            for rule_code, rule, result, profile in self._run_rules(
+                full_rules, data_store
+            )
+        }
+        return (
+            spliced[rule_code] if rule_code in spliced else full_results[rule_code]
+            for rule_code in rules_to_run
+        )
 
-                # validation rules return an empty dict if the required tables are not all available.
-                logger.info(f"Error code {rule.code} skipped due to missing tables")
-                self.skips.append(rule.code)
+    def _run_sharded(
+        self, rules_to_run: dict[str, RuleDefinition], data_store: dict[str, Any]
+    ) -> Iterator[
+        tuple[
+            str, RuleDefinition, Optional[dict[str, list[Any]]], Optional[RuleProfile]
+        ]
+    ]:
+        """
+        Runs the rules on each shard of the datastore, and combines the errors they find in each shard.
+
+        :param dict rules_to_run: rules to run, keyed by rule code.
+        :param dict data_store: the datastore the rules are run on.
+        :return: rule code, rule, result and profile for each rule, as from _run_rules.
+        """
+        sharded_rules = {}
+        for rule_code, rule in rules_to_run.items():
+            missing = missing_tables(rule, data_store)
+            if missing:
+                self.skip_reasons[rule_code] = missing
+            elif not rule.whole_dataset:
+                sharded_rules[rule_code] = rule
+
+        shards = shard_datastore(data_store, self.shards)
+        logger.info(f"Validating {len(sharded_rules)} rules on {self.shards} shards...")
+        rules = list(sharded_rules.values())
+        if self.executor is None:
+            shard_results = [
+                _run_shard(rules, shard, self.profile_memory) for shard in shards
+            ]
+        else:
+            if self.executor == "thread":
+                pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                task = partial(_run_shard, rules)
             else:
-                self.dones.append(rule.code)
-
-            # map failing locations back to data files.
-            for table, values in result.items():
-                if len(values) > 0:
-                    logger.info(f"Error code {rule.code} found {len(values)} errors")
-                    nof_errors = len(values)
-                    # select out only the valid values, that is remove all nans.
-                    values = [
-                        i for i, not_nan in zip(values, pd.notna(values)) if not_nan
-                    ]
-                    nof_nans = nof_errors - len(values)
-                    if nof_nans != 0:
-                        logger.warning(
-                            f"{rule.code} returned {nof_nans} NaNs! "
-                            + f"Output: {str(values)}"
-                        )
-                    self.ds_results[table].loc[values, f"ERR_{rule.code}"] = True
+                # each shard is sent with its task, so a worker process only ever holds the shard it validates.
+                rule_paths = [(rule.func.__module__, rule.code) for rule in rules]
+                pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                task = partial(_run_shard_in_worker, rule_paths)
+            # shards are made as they are submitted, and no more are submitted than there are workers to
+            # validate them, so that only those being validated are kept in memory.
+            workers = self.max_workers or os.cpu_count() or 1
+            shard_results = []
+            futures = deque()
+            with pool:
+                for shard in shards:
+                    if len(futures) >= workers:
+                        shard_results.append(futures.popleft().result())
+                    futures.append(pool.submit(task, shard, self.profile_memory))
+                shard_results.extend(future.result() for future in futures)
+
+        combined = {}
+        for position, (rule_code, rule) in enumerate(sharded_rules.items()):
+            results = [shard_result[position] for shard_result in shard_results]
+            result = _combine_results([result for result, _ in results])
+            if result is not None:
+                profile = _combine_profiles([profile for _, profile in results])
+                combined[rule_code] = (rule_code, rule, result, profile)
+
+        full_rules = {
+            rule_code: rule
+            for rule_code, rule in rules_to_run.items()
+            if rule_code not in combined
+        }
+        logger.info(f"Validating {len(full_rules)} rules on all children...")
+        full_results = {
+            rule_code: (rule_code, rule, result, profile)
+            for rule_code, rule, result, profile in self._run_rules(
+                full_rules, data_store
+            )
+        }
+        return (
+            combined[rule_code] if rule_code in combined else full_results[rule_code]
+            for rule_code in rules_to_run
+        )
+
+    def _run_rules(
+        self, rules_to_run: dict[str, RuleDefinition], data_store: dict[str, Any]
+    ) -> Iterator[
+        tuple[
+            str, RuleDefinition, Optional[dict[str, list[Any]]], Optional[RuleProfile]
+        ]
+    ]:
+        """
+        Runs the rules, yielding results in the order of rules_to_run. Rules with missing tables
+        aren't run, and give an empty result and no profile.
+
+        :param dict rules_to_run: rules to run, keyed by rule code.
+        :param dict data_store: the datastore the rules are run on.
+        :return: rule code, rule, result and profile for each rule. The result is None if the rule failed
+            to run.
+        """
+        runnable_rules = {}
+        for rule_code, rule in rules_to_run.items():
+            missing = missing_tables(rule, data_store)
+            if missing:
+                self.skip_reasons[rule_code] = missing
+            else:
+                runnable_rules[rule_code] = rule
+
+        results = self._dispatch_rules(runnable_rules, data_store)
+        for rule_code, rule in rules_to_run.items():
+            if rule_code in self.skip_reasons:
+                yield rule_code, rule, {}, None
+            else:
+                yield next(results)
+        # let the executor shut down
+        results.close()
+
+    def _dispatch_rules(
+        self, rules_to_run: dict[str, RuleDefinition], data_store: dict[str, Any]
+    ) -> Iterator[
+        tuple[str, RuleDefinition, Optional[dict[str, list[Any]]], RuleProfile]
+    ]:
+        """
+        Runs the rules with the chosen executor, yielding results in the order of rules_to_run.
+
+        :param dict rules_to_run: rules to run, keyed by rule code.
+        :param dict data_store: the datastore the rules are run on.
+        :return: rule code, rule, result and profile for each rule. The result is None if the rule
+            failed to run.
+        """
+        if self.check_mutations:
+            fingerprints = fingerprint_datastore(data_store)
+            for rule_code, rule in rules_to_run.items():
+                logger.info(f"Validating rule {rule_code}, checking for mutations...")
+                result, profile, changed_tables = _run_rule_checking_mutations(
+                    rule, data_store, fingerprints, self.profile_memory
+                )
+                if changed_tables:
+                    logger.warning(
+                        f"Rule code {rule.code} changed shared data in: {', '.join(changed_tables)}"
+                    )
+                    self.mutations[rule_code] = changed_tables
+                yield rule_code, rule, result, profile
+            return
+
+        if self.executor is None:
+            for rule_code, rule in rules_to_run.items():
+                logger.info(f"Validating rule {rule_code}...")
+                yield rule_code, rule, *_profile_rule(
+                    rule, data_store, self.profile_memory
+                )
+            return
+
+        logger.info(
+            f"Validating {len(rules_to_run)} rules with a {self.executor} pool..."
+        )
+        if self.executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            futures = [
+                pool.submit(_profile_rule, rule, data_store, self.profile_memory)
+                for rule in rules_to_run.values()
+            ]
+        else:
+            # rule functions can't be pickled, so each worker imports the rule modules itself
+            # and receives the datastore once, when it starts.
+            pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(data_store, self.profile_memory),
+            )
+            futures = [
+                pool.submit(_run_rule_in_worker, rule.func.__module__, rule.code)
+                for rule in rules_to_run.values()
+            ]
+        with pool:
+            for (rule_code, rule), future in zip(rules_to_run.items(), futures):
+                yield rule_code, rule, *future.result()
+
+
+class ErrorLocations:
+    """
+    The rows flagged by each rule, stored per table as (rule code, row positions) pairs. This grows
+    with the number of errors found rather than with the number of rows times the number of rules.
+    """
+
+    def __init__(self, data_store: dict[str, Any]):
+        self.data_store = data_store
+        # rule codes and row positions, in the order they were added, by table name.
+        self.codes: dict[str, list[str]] = {}
+        self.positions: dict[str, list[np.ndarray]] = {}
+
+    def add(self, table_name: str, rule_code: str, labels: list[Any]):
+        """
+        Records the rows a rule flagged in a table. Adding an empty list still gives the rule an ERR_
+        column, with no rows flagged.
+
+        :param str table_name: the table the errors are in.
+        :param str rule_code: the code of the rule that found them.
+        :param list labels: index labels of the flagged rows.
+        :raises KeyError: if any of the labels aren't in the table's index.
+        """
+        index = self.data_store[table_name].index
+        positions = index.get_indexer_for(labels)
+        if (positions == -1).any():
+            not_found = [
+                label for label, position in zip(labels, positions) if position == -1
+            ]
+            raise KeyError(f"{not_found} not in index of {table_name}")
+        self.codes.setdefault(table_name, []).append(rule_code)
+        self.positions.setdefault(table_name, []).append(positions.astype(np.int32))
+
+    def by_rule(self) -> dict[str, dict[str, np.ndarray]]:
+        """
+        :return: the positions of the rows each rule flagged, by table name, keyed by rule code.
+        """
+        errors: dict[str, dict[str, np.ndarray]] = {}
+        for table_name, codes in self.codes.items():
+            for rule_code, positions in zip(codes, self.positions[table_name]):
+                errors.setdefault(rule_code, {})[table_name] = positions
+        return errors
+
+    def to_frame(self) -> DataFrame:
+        """
+        :return: one row per error, with the Table, the RowID (the row's index label) and the rule Code.
+        """
+        frames = []
+        for table_name, codes in self.codes.items():
+            index = self.data_store[table_name].index
+            for rule_code, positions in zip(codes, self.positions[table_name]):
+                frames.append(
+                    DataFrame(
+                        {
+                            "Table": table_name,
+                            "RowID": index[positions],
+                            "Code": rule_code,
+                        }
+                    )
+                )
+        if not frames:
+            return DataFrame(columns=["Table", "RowID", "Code"])
+        return pd.concat(frames, ignore_index=True)
+
+    def to_ds_results(self) -> dict[str, Any]:
+        """
+        Builds a copy of the datastore with an ERR_ column for each rule that was added to a table,
+        True on the flagged rows and NaN elsewhere.
+        """
+        ds_results = copy_datastore(self.data_store)
+        for table_name, codes in self.codes.items():
+            df = ds_results[table_name]
+            error_columns = {}
+            for rule_code, positions in zip(codes, self.positions[table_name]):
+                column = np.full(len(df), np.nan, dtype=object)
+                column[positions] = True
+                error_columns[f"ERR_{rule_code}"] = column
+            ds_results[table_name] = pd.concat(
+                [df, DataFrame(error_columns, index=df.index)], axis=1
+            )
+        return ds_results
+
+
+def missing_tables(rule: RuleDefinition, data_store: dict[str, Any]) -> list[str]:
+    """
+    Finds the tables a rule needs that aren't in the datastore. Tables the rule declares as optional
+    aren't needed, and rules that don't declare their tables are assumed to need none.
+
+    :param RuleDefinition rule: the rule to check.
+    :param dict data_store: the datastore the rule would be run on.
+    :return: names of the missing tables, as declared by the rule.
+    """
+    optional_tables = rule.optional_tables or []
+    missing = []
+    for table_name in rule.tables or []:
+        if table_name is None or table_name in optional_tables:
+            continue
+        if table_name in METADATA_TABLES:
+            available = METADATA_TABLES[table_name] in data_store["metadata"]
+        else:
+            available = table_name in data_store
+        if not available:
+            missing.append(table_name)
+    return missing
+
+
+def _same_metadata(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    """
+    Checks whether two datastores have the same metadata, apart from the dates and derived values computed
+    from their tables.
+    """
+    for key in (set(old) | set(new)) - {"parsed_dates", "derived"}:
+        old_value, new_value = old.get(key), new.get(key)
+        if isinstance(old_value, DataFrame) or isinstance(new_value, DataFrame):
+            if not (
+                isinstance(old_value, DataFrame)
+                and isinstance(new_value, DataFrame)
+                and old_value.equals(new_value)
+            ):
+                return False
+        elif old_value != new_value:
+            return False
+    return True
+
+
+def _moved_rows(old_df: DataFrame, new_df: DataFrame, children: pd.Index) -> np.ndarray:
+    """
+    Finds the rows of a table in a later upload of it. The rows of a child that hasn't changed are the same, in
+    the same order, but may have moved within the table.
+
+    :param DataFrame old_df: the table from the earlier upload.
+    :param DataFrame new_df: the table from the later upload.
+    :param Index children: the CHILD of every child that has changed.
+    :return: the position in new_df of each row of old_df, or -1 for the rows of changed children.
+    """
+
+    def keys(df):
+        child = df["CHILD"].to_numpy()
+        rank = df.groupby(child, dropna=False, sort=False).cumcount().to_numpy()
+        return pd.MultiIndex.from_arrays([child, rank])
+
+    positions = keys(new_df).get_indexer(keys(old_df))
+    positions[old_df["CHILD"].isin(children).to_numpy()] = -1
+    return positions
+
+
+def _combine_results(
+    results: list[Optional[dict[str, list[Any]]]]
+) -> Optional[dict[str, list[Any]]]:
+    """
+    Combines the results of a rule run on each shard of a datastore.
+
+    :param list results: the result from each shard.
+    :return: the errors found in every shard, by table name, or None if the rule must be run on all of the
+        data instead: because it failed on a shard, or was skipped on some shards but not others.
+    """
+    if any(result is None for result in results):
+        return None
+    skipped = [result == {} for result in results]
+    if all(skipped):
+        return {}
+    if any(skipped):
+        return None
+    combined: dict[str, list[Any]] = {}
+    for result in results:
+        for table_name, labels in result.items():
+            combined.setdefault(table_name, []).extend(labels)
+    return combined
+
+
+def _combine_profiles(profiles: list[RuleProfile]) -> RuleProfile:
+    """
+    Adds up the RuleProfiles of a rule run on each shard of a datastore. Its peak memory is the largest of
+    the shards' peaks.
+    """
+    peaks = [profile.peak_memory for profile in profiles]
+    return RuleProfile(
+        wall_time=sum(profile.wall_time for profile in profiles),
+        cpu_time=sum(profile.cpu_time for profile in profiles),
+        peak_memory=None if None in peaks else max(peaks, default=None),
+        rows_touched=sum(profile.rows_touched for profile in profiles),
+    )
+
+
+def _run_rule(
+    rule: RuleDefinition, data_store: Union[dict[str, Any], DatastoreView]
+) -> Optional[dict[str, list[Any]]]:
+    """
+    Runs a single rule on a copy-on-access view of the datastore.
+
+    :param RuleDefinition rule: the rule to run.
+    :param dict data_store: the datastore to run the rule on, or a view of it.
+    :return: error locations by table name, or None if the rule failed to run.
+    """
+    if not isinstance(data_store, DatastoreView):
+        data_store = DatastoreView(data_store)
+    try:
+        # get the result from when the rule is run on the data.
+        return rule.func(data_store)
+    except Exception:
+        logger.exception(f"Rule code {rule.code} failed to run!")
+        return None
+
+
+def _profile_rule(
+    rule: RuleDefinition,
+    data_store: Union[dict[str, Any], DatastoreView],
+    trace_memory: bool = False,
+) -> tuple[Optional[dict[str, list[Any]]], RuleProfile]:
+    """
+    Runs a single rule like _run_rule, and measures the resources it used.
+
+    :param RuleDefinition rule: the rule to run.
+    :param dict data_store: the datastore to run the rule on, or a view of it.
+    :param bool trace_memory: whether to measure the rule's peak memory. tracemalloc must be tracing.
+    :return: the result of the rule, and its RuleProfile.
+    """
+    if not isinstance(data_store, DatastoreView):
+        data_store = DatastoreView(data_store)
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    result = _run_rule(rule, data_store)
+    cpu_time = time.thread_time() - start_cpu
+    wall_time = time.perf_counter() - start_wall
+    peak_memory = None
+    if trace_memory:
+        peak_memory = max(tracemalloc.get_traced_memory()[1] - start_memory, 0)
+
+    return result, RuleProfile(
+        wall_time, cpu_time, peak_memory, data_store.rows_accessed
+    )
+
+
+def _run_rule_checking_mutations(
+    rule: RuleDefinition,
+    data_store: dict[str, Any],
+    fingerprints: dict[str, tuple],
+    trace_memory: bool = False,
+) -> tuple[Optional[dict[str, list[Any]]], RuleProfile, list[str]]:
+    """
+    Runs a single rule like _profile_rule, and reports which of the tables it read it also changed.
+
+    :param RuleDefinition rule: the rule to run.
+    :param dict data_store: the datastore to run the rule on.
+    :param dict fingerprints: fingerprints of the datastore before the rule is run, from
+        fingerprint_datastore. Updated with the changes made by the rule.
+    :param bool trace_memory: whether to measure the rule's peak memory.
+    :return: the result of the rule, its RuleProfile, and the names of the tables it changed.
+    """
+    view = DatastoreView(data_store)
+    result, profile = _profile_rule(rule, view, trace_memory)
+    after = fingerprint_datastore(data_store, view.accessed)
+    changed_tables = [
+        table_name
+        for table_name, fingerprint in after.items()
+        if fingerprints.get(table_name) != fingerprint
+    ]
+    fingerprints.update(after)
+    return result, profile, changed_tables
+
+
+# the datastore each worker process validates, and whether to trace memory, set when the worker starts.
+_worker_data_store: Optional[dict[str, Any]] = None
+_worker_trace_memory = False
+
+
+def _init_worker(data_store: dict[str, Any], trace_memory: bool = False):
+    global _worker_data_store, _worker_trace_memory
+    # unless the worker was forked, the datastore has been pickled to get here.
+    _worker_data_store = rebuild_datastore(data_store)
+    _worker_trace_memory = trace_memory
+    if trace_memory:
+        tracemalloc.start()
+
+
+def _run_rule_in_worker(
+    module_path: str, rule_code: str
+) -> tuple[Optional[dict[str, list[Any]]], RuleProfile]:
+    return _profile_rule(
+        load_rule(module_path, rule_code), _worker_data_store, _worker_trace_memory
+    )
+
+
+def _run_shard(
+    rules: list[RuleDefinition], data_store: dict[str, Any], trace_memory: bool = False
+) -> list[tuple[Optional[dict[str, list[Any]]], RuleProfile]]:
+    """
+    Runs rules one after another on a shard of the datastore.
+
+    :return: the result and RuleProfile of each rule, in the order of rules.
+    """
+    return [_profile_rule(rule, data_store, trace_memory) for rule in rules]
+
+
+def _run_shard_in_worker(
+    rule_paths: list[tuple[str, str]],
+    data_store: dict[str, Any],
+    trace_memory: bool = False,
+) -> list[tuple[Optional[dict[str, list[Any]]], RuleProfile]]:
+    """
+    Runs rules on a shard of the datastore in a worker process, importing each rule from its module path
+    and code, as rule functions can't be pickled.
+    """
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    rules = [load_rule(module_path, rule_code) for module_path, rule_code in rule_paths]
+    return _run_shard(rules, rebuild_datastore(data_store), trace_memory)
 
 
 def create_issue_df(report: DataFrame, error_report: DataFrame):
@@ -120,64 +900,48 @@ def create_issue_df(report: DataFrame, error_report: DataFrame):
 
     Uses output of 903validator.report because it is closer to desired structure.
 
+    The ERR_ columns are turned into one row per error in a single pass, ordered by rule and then by
+    row, before the rule data is joined on and the affected columns exploded.
+
     :param df report: childID, rule_code, tables_affected and row_id will be grabbed from here
     :param df error_report: rule_description and affected_fields, per rule_code, will be grabbed from here.
     :return df full_issue_df: data to drive frontend display of issue locations.
     """
     # get rule codes from column names
     col_error_names = [c for c in report.columns if c[:4] == "ERR_"]
+    rule_codes = np.array([c[4:] for c in col_error_names], dtype=object)
 
-    # loop through rule codes and fetch rule data from error_report each time.
-    issue_dfs_per_rule = []
-    for col_name in col_error_names:
-        rule_code = col_name[4:]
-
-        # child, table, row where rule fails.
-        rule_table = report[report[col_name] == True][
-            [
-                "Table",
-                "RowID",
-                "CHILD",
-            ]
-            + [col_name]
-        ]
-        rule_table["Code"] = rule_code
-
-        rule_desc = error_report[error_report["Code"] == rule_code]
-        # assumption. error_description has one entry per rule.
-        rule_issue_df = rule_table.merge(rule_desc, on="Code")
-
-        rule_issue_df.rename(
-            columns={
-                "Table": "tables_affected",
-                "RowID": "row_id",
-                "Code": "rule_code",
-                "Description": "rule_description",
-                "Fields": "columns_affected",
-                "CHILD": "child_id",
-            },
-            inplace=True,
-        )
-        # remove ERR_ columns
-        rule_issue_df.drop(columns=[col_name], inplace=True)
-        # explode column lists into one per row.
-        rule_issue_df = rule_issue_df.explode(
-            column=["columns_affected"], ignore_index=True
-        )
-        # reorder
-        rule_issue_df = rule_issue_df[
-            [
-                "child_id",
-                "tables_affected",
-                "columns_affected",
-                "row_id",
-                "rule_code",
-                "rule_description",
-            ]
-        ]
-
-        issue_dfs_per_rule.append(rule_issue_df)
+    # child, table, row and rule for every error, in rule order and then row order.
+    is_error = (report[col_error_names] == True).to_numpy()
+    rule_positions, row_positions = np.nonzero(is_error.T)
+    rule_table = report[["Table", "RowID", "CHILD"]].iloc[row_positions]
+    rule_table = rule_table.assign(Code=rule_codes[rule_positions])
 
-    full_issue_df = pd.concat(issue_dfs_per_rule)
-    full_issue_df.reset_index(drop=True, inplace=True)
-    return full_issue_df
+    # assumption. error_description has one entry per rule.
+    full_issue_df = rule_table.merge(error_report, on="Code")
+    full_issue_df.rename(
+        columns={
+            "Table": "tables_affected",
+            "RowID": "row_id",
+            "Code": "rule_code",
+            "Description": "rule_description",
+            "Fields": "columns_affected",
+            "CHILD": "child_id",
+        },
+        inplace=True,
+    )
+    # explode column lists into one per row.
+    full_issue_df = full_issue_df.explode(
+        column=["columns_affected"], ignore_index=True
+    )
+    # reorder
+    return full_issue_df[
+        [
+            "child_id",
+            "tables_affected",
+            "columns_affected",
+            "row_id",
+            "rule_code",
+            "rule_description",
+        ]
+    ]
@@ -0,0 +1,97 @@
+"""
+A prebuilt postcode reference store, read through memory maps.
+
+The store is a directory of .npy files, one per column, sorted by the postcode without spaces. Opening it maps
+the files rather than reading them, so every process that opens the same store shares one copy of the pages,
+and only the pages a lookup touches are read from disk.
+
+Build a store with `python -m lac_validator postcode-store <directory>`, or with write_postcode_store from a
+postcodes dataframe, and point the validator at it with the LAC_VALIDATOR_POSTCODE_STORE environment variable.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+from pandas import DataFrame
+
+# bump when the layout of the store changes, so old stores are rebuilt rather than misread.
+STORE_VERSION = 1
+
+
+class PostcodeStore:
+    """
+    The columns of a postcode store, memory-mapped. keys holds the postcodes without spaces, sorted, as ASCII
+    bytes. values holds the pcd, oseast1m and osnrth1m columns in the same order, and laua_codes the laua of each
+    postcode as a position in laua_categories, or -1 if it has none.
+
+    :param directory: the directory the store was written to.
+    :raises ValueError: if the store was written by a different version of write_postcode_store.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        directory = Path(directory)
+        with open(directory / "store.json", "rt") as file:
+            info = json.load(file)
+        if info.get("version") != STORE_VERSION:
+            raise ValueError(
+                f"Postcode store {directory} has version {info.get('version')}, expected {STORE_VERSION}"
+            )
+
+        def load(name):
+            return np.load(directory / f"{name}.npy", mmap_mode="r")
+
+        self.keys = load("pcd_abbr")
+        self.values: Dict[str, np.ndarray] = {
+            column: load(column) for column in ["pcd", "oseast1m", "osnrth1m"]
+        }
+        self.laua_codes = load("laua_codes")
+        self.laua_categories = np.array(info["laua_categories"], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def write_postcode_store(postcodes: DataFrame, directory: Union[str, Path]):
+    """
+    Writes a postcode store.
+
+    :param DataFrame postcodes: the postcodes, with columns pcd, oseast1m, osnrth1m and laua. pcd may include
+        spaces; the store is keyed on it without them, in upper case.
+    :param directory: the directory to write the store to. It's created if needed.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    abbreviations = postcodes["pcd"].str.upper().str.replace(" ", "")
+    postcodes = postcodes[abbreviations.notna().to_numpy()]
+    abbreviations = abbreviations.dropna()
+    keys = abbreviations.to_numpy(dtype=str).astype("S")
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    # keep only the first occurrence of any duplicate postcode, as drop_duplicates(keep="first") does. This
+    # differs from the merge on the key that lookups replaced, which gave a row for every duplicate.
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    order = order[first]
+
+    laua = postcodes["laua"].astype("category").cat
+    columns = {
+        "pcd_abbr": keys[first],
+        "pcd": postcodes["pcd"].to_numpy(dtype=str).astype("S")[order],
+        "oseast1m": postcodes["oseast1m"].to_numpy(dtype="float64")[order],
+        "osnrth1m": postcodes["osnrth1m"].to_numpy(dtype="float64")[order],
+        "laua_codes": laua.codes.to_numpy(dtype="int16")[order],
+    }
+    for name, values in columns.items():
+        np.save(directory / f"{name}.npy", values)
+    with open(directory / "store.json", "wt") as file:
+        json.dump(
+            {
+                "version": STORE_VERSION,
+                "rows": int(len(order)),
+                "laua_categories": laua.categories.tolist(),
+            },
+            file,
+            indent=2,
+        )
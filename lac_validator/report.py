@@ -9,6 +9,11 @@ from openpyxl.worksheet.table import Table, TableStyleInfo
 
 logger = logging.getLogger(__name__)
 
+# the most rows an excel sheet can hold, including the header row.
+EXCEL_MAX_ROWS = 1_048_576
+# rows converted from the dataframe at a time when writing a sheet.
+CHUNK_SIZE = 10_000
+
 
 class Report:
     def __init__(self, data_store, ruleset_registry):
@@ -47,7 +52,12 @@ class Report:
             df_error = value[["CHILD"] + cols_error].copy()
             df_error["Table"] = table
             df_error["RowID"] = df_error.index
-            df_error["Context"] = value[cols_data].apply(lambda row: {**row}, axis=1)
+            # context is only needed, and only built, for the rows with errors.
+            has_error = (value[cols_error] == True).any(axis=1)
+            df_error["Context"] = pd.Series(None, index=value.index, dtype=object)
+            df_error.loc[has_error, "Context"] = value.loc[
+                has_error, cols_data
+            ].to_dict("records")
 
             dataframes.append(df_error)
 
@@ -147,21 +157,38 @@ class Report:
             self.__child_summary = _create_child_summary(self.child_report)
         return self.__child_summary
 
-    def excel_report(self, file=None):
+    def excel_report(self, file=None, max_rows_per_sheet=EXCEL_MAX_ROWS - 1):
         """
         Creates an excel report containing an error summary and full details of each error with context information.
 
         If a string or file-like is provided, then the output is saved to this,
-        otherwise the workbook data are returned as a buffer.
+        otherwise the workbook data are returned as a buffer. Saving to a file keeps memory use down,
+        as the workbook is written a row at a time.
+
+        Child summaries with more than max_rows_per_sheet rows are split across sheets named
+        "Child Summary", "Child Summary 2" and so on.
         """
+        if not 0 < max_rows_per_sheet < EXCEL_MAX_ROWS:
+            raise ValueError(
+                f"max_rows_per_sheet must be between 1 and {EXCEL_MAX_ROWS - 1}"
+            )
+
         logger.info("Creating workbook")
         wb = Workbook(write_only=True)
 
         error_sheet = wb.create_sheet(title="Error Summary")
         _populate_error_sheet(error_sheet, self.error_summary)
 
-        child_sheet = wb.create_sheet(title="Child Summary")
-        _populate_child_sheet(child_sheet, self.child_summary)
+        child_summary = self.child_summary
+        sheet_starts = range(0, max(len(child_summary), 1), max_rows_per_sheet)
+        for sheet_number, start in enumerate(sheet_starts, start=1):
+            suffix = "" if sheet_number == 1 else str(sheet_number)
+            child_sheet = wb.create_sheet(title=f"Child Summary {suffix}".strip())
+            _populate_child_sheet(
+                child_sheet,
+                child_summary.iloc[start : start + max_rows_per_sheet],
+                display_name=f"ChildSummary{suffix}",
+            )
 
         logger.info("Creating workbook - saving")
         if file:
@@ -212,7 +239,7 @@ def _populate_error_sheet(error_sheet, df):
     error_sheet.add_table(error_table)
 
 
-def _populate_child_sheet(child_sheet, df):
+def _populate_child_sheet(child_sheet, df, display_name="ChildSummary"):
     logger.debug("Creating workbook - child summary")
 
     child_sheet.column_dimensions["A"].width = 15
@@ -231,12 +258,16 @@ def _populate_child_sheet(child_sheet, df):
     child_sheet.append(headers)
 
     logger.debug("Child Summary - Populating rows")
-    for index, row in df.iterrows():
-        child_sheet.append([row[h] for h in headers])
+    # rows are built from the columns a chunk at a time, so only one chunk is held as python objects.
+    columns = [df[h].to_numpy() for h in headers]
+    for start in range(0, df.shape[0], CHUNK_SIZE):
+        chunk = [column[start : start + CHUNK_SIZE].tolist() for column in columns]
+        for row in zip(*chunk):
+            child_sheet.append(row)
 
     logger.debug("Child Summary - Adding table")
     child_table = Table(
-        displayName="ChildSummary",
+        displayName=display_name,
         ref=f"A1:{get_column_letter(len(headers))}{df.shape[0] + 1}",
     )
     child_table._initialise_columns()
@@ -273,21 +304,53 @@ def _create_child_summary(child_report: pd.DataFrame) -> pd.DataFrame:
             "Error Type Count": "Errors of Type",
         }
     )
+    fields = df["Fields"].map(tuple)
+    context_keys = df["Context"].map(tuple)
     logger.debug("Child Summary - Setting Error Fields")
-    df["Error Fields"] = df["Fields"].apply(lambda x: ", ".join(x))
+    df["Error Fields"] = fields.map(", ".join)
     logger.debug("Child Summary - Setting Affected Values")
-    df["Affected Values"] = df[["Fields", "Context"]].apply(
-        lambda row: ", ".join(
-            [f"{f}: {row.Context[f]}" for f in row.Fields if f in row.Context]
-        ),
-        axis=1,
-    )
+    df["Affected Values"] = _context_values(df["Context"], fields, context_keys)
     logger.debug("Child Summary - Setting Locator Hints")
-    df["Locator Hints"] = df.Context.apply(
-        lambda row: ", ".join(
-            [f"{f}: {row[f]}" for f in ["DECOM", "MIS_START", "REVIEW"] if f in row]
-        )
+    locator_fields = pd.Series(
+        [("DECOM", "MIS_START", "REVIEW")] * len(df), index=df.index, dtype=object
     )
+    df["Locator Hints"] = _context_values(df["Context"], locator_fields, context_keys)
     logger.debug("Child Summary - Sorting")
     df.sort_values(["Child", "Affected Table", "Error Code"], inplace=True)
     return df[headers]
+
+
+def _context_values(
+    context: pd.Series, fields: pd.Series, context_keys: pd.Series
+) -> pd.Series:
+    """
+    Formats the given fields of each row's context as "field: value" pairs, joined by commas. Fields
+    that aren't in a row's context are left out.
+
+    Rows are grouped by their fields and context keys, which are shared by all the errors of a rule
+    in a table, so the strings are built a column at a time rather than a row at a time.
+
+    :param Series context: dicts of field name to value, one per row.
+    :param Series fields: tuples of the field names to format, one per row.
+    :param Series context_keys: tuples of the keys of each row's context.
+    :return: the formatted strings, with the same index as context.
+    """
+    values = pd.Series("", index=context.index, dtype=object)
+    groups = pd.DataFrame({"fields": fields, "keys": context_keys}).groupby(
+        ["fields", "keys"], sort=False
+    )
+    for (field_names, keys), index in groups.indices.items():
+        present = [f for f in field_names if f in keys]
+        if not present:
+            continue
+        group_context = pd.DataFrame(
+            context.iloc[index].tolist(),
+            columns=list(dict.fromkeys(present)),
+            dtype=object,
+        )
+        formatted = [f + ": " + group_context[f].astype(str) for f in present]
+        joined = formatted[0]
+        for column in formatted[1:]:
+            joined = joined + ", " + column
+        values.iloc[index] = joined.to_numpy()
+    return values
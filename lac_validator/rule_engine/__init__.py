@@ -1,6 +1,16 @@
-from .__registry import rule_definition, RuleDefinition, YearConfig
+from .__registry import (
+    code_list_errors,
+    code_list_rule,
+    rule_definition,
+    CodeList,
+    RuleDefinition,
+    YearConfig,
+)
 
 __all__ = [
+    "code_list_errors",
+    "code_list_rule",
+    "CodeList",
     "rule_definition",
     "RuleDefinition",
     "YearConfig",
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+
+from lac_validator.datastore import get_string_column, isin_codes
 
 
 @dataclass(frozen=True, eq=True)
@@ -13,6 +15,11 @@ class RuleDefinition:
     :param Callable func: logic of the validation rule function.
     :param str message: The message to be displayed if rule is flagged.
     :param str affected_fields: The fields/columns affected by a validation rule.
+    :param list tables: The tables used by a validation rule. The rule is skipped if any of them weren't uploaded.
+    :param list optional_tables: Those of the tables the rule can run without, which don't cause it to be skipped.
+    :param bool whole_dataset: Whether the rule's errors for one child can depend on the rows of other children,
+        or on where rows are in their tables. Such rules are always run on all of the data, rather than only on the
+        children that changed.
 
     :returns: RuleDefinition object containing information about validation rules.
     :rtype: dataclass object.
@@ -23,6 +30,45 @@ class RuleDefinition:
     message: Optional[str] = None
     affected_fields: Optional[list[str]] = None
     tables: Optional[list[str]] = (None,)
+    optional_tables: Optional[list[str]] = None
+    whole_dataset: bool = False
+
+
+@dataclass(frozen=True, eq=True)
+class CodeList:
+    """
+    A check that every value of a field is one of a list of codes.
+
+    :param str table: The table holding the field.
+    :param str field: The field checked.
+    :param tuple codes: The valid codes. Values are compared as strings, so 1 matches "1".
+    :param bool allow_null: Whether blank values are valid.
+    """
+
+    table: str
+    field: str
+    codes: tuple[str, ...]
+    allow_null: bool = False
+
+
+def code_list_errors(dfs: dict[str, Any], code_list: CodeList) -> dict[str, list]:
+    """
+    Finds the rows whose value of the field isn't in the code list. The field is read with get_string_column,
+    so it is converted to strings once per validation run and each code list is tested with integer
+    comparisons, however many rules check it.
+
+    :param dfs: the datastore, or any dict of DataFrames, as passed to a rule.
+    :param CodeList code_list: the check to make.
+    :return: the error locations in the table, or an empty dict if the table wasn't uploaded.
+    """
+    if code_list.table not in dfs:
+        return {}
+    df = dfs[code_list.table]
+    values = get_string_column(dfs, code_list.table, code_list.field)
+    valid = isin_codes(values, list(code_list.codes))
+    if code_list.allow_null:
+        valid |= values.isna()
+    return {code_list.table: df.index[~valid.to_numpy()].tolist()}
 
 
 def rule_definition(
@@ -30,6 +76,8 @@ def rule_definition(
     message: Optional[str] = None,
     affected_fields: Optional[list[str]] = None,
     tables: Optional[list[str]] = None,
+    optional_tables: Optional[list[str]] = None,
+    whole_dataset: bool = False,
 ):
     """
     Creates the rule definition for validation rules using RuleDefinition class as a template.
@@ -37,6 +85,9 @@ def rule_definition(
     :param str code: The rule code for each rule.
     :param str message: The message displayed for each validation rule.
     :param str affected_fields: The fields/columns affected by a validation rule.
+    :param list tables: The tables used by a validation rule.
+    :param list optional_tables: Those of the tables the rule can run without.
+    :param bool whole_dataset: Whether the rule must always be run on all of the data.
 
     :returns: RuleDefinition object containing information about validation rules.
     :rtype: RuleDefiniton class object.
@@ -53,6 +104,8 @@ def rule_definition(
             message=message,
             affected_fields=affected_fields,
             tables=tables,
+            optional_tables=optional_tables,
+            whole_dataset=whole_dataset,
         )
         # when validator funcs are created, give them a unique attribute that they can be
         # recognised by when the file is read later.
@@ -62,6 +115,52 @@ def rule_definition(
     return decorator
 
 
+def code_list_rule(
+    code: str,
+    module: str,
+    table: str,
+    field: str,
+    codes: list[str],
+    message: Optional[str] = None,
+    allow_null: bool = False,
+    affected_fields: Optional[list[str]] = None,
+) -> Callable:
+    """
+    Creates a rule that only checks that a field holds one of a list of codes, as data rather than code, e.g.
+
+        validate = code_list_rule(
+            code="101", module=__name__, table="Header", field="SEX", codes=["1", "2"]
+        )
+
+    :param str code: The rule code.
+    :param str module: The import path of the rule file, i.e. its __name__. Rules are imported again from
+        it, by the manifests and the process executor.
+    :param str table: The table holding the field.
+    :param str field: The field checked.
+    :param list codes: The valid codes.
+    :param str message: The message displayed for the rule.
+    :param bool allow_null: Whether blank values are valid.
+    :param list affected_fields: The fields flagged by the rule, if not only field.
+
+    :returns: the rule's validate function, like one decorated with rule_definition.
+    """
+    check = CodeList(
+        table=table, field=field, codes=tuple(codes), allow_null=allow_null
+    )
+
+    def validate(dfs):
+        return code_list_errors(dfs, check)
+
+    # the rule is found again from the module of its function, so the function must belong to the rule file.
+    validate.__module__ = module
+    return rule_definition(
+        code=code,
+        message=message,
+        affected_fields=affected_fields or [field],
+        tables=[table],
+    )(validate)
+
+
 @dataclass(eq=True)
 class YearConfig:
     deleted: list[str]
@@ -1,8 +1,25 @@
 from pathlib import Path
 
+from lac_validator.rule_engine import RuleDefinition
 from lac_validator.rules.ruleset_utils import extract_validator_functions
 
-files = Path(__file__).parent.glob("*.py")
-registry = extract_validator_functions(files)
+
+def load_registry() -> dict[str, RuleDefinition]:
+    """
+    Imports every rule file in this folder and returns the rules they define.
+    """
+    files = Path(__file__).parent.glob("*.py")
+    return extract_validator_functions(files)
+
+
+def __getattr__(name: str):
+    # the registry is built when it is first used, so that importing a single rule file,
+    # or reading the ruleset's manifest, doesn't import every rule.
+    if name == "registry":
+        global registry
+        registry = load_registry()
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["registry"]
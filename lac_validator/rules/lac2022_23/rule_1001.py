@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -11,6 +12,7 @@ from lac_validator.rule_engine import rule_definition
     "check may generate false positives if a child had episodes prior to last year's collection.]",
     affected_fields=["IN_TOUCH", "ACTIV", "ACCOM"],
     tables=["Episodes", "OC3", "Header", "Episodes_last"],
+    whole_dataset=True,
 )
 def validate(dfs):
     # requiring 'Episodes_last' to reduce false positive rate, though more could be done
@@ -44,9 +46,7 @@ def validate(dfs):
         )
         episodes.drop_duplicates(subset=["CHILD", "DECOM"])
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         header = header[header["DOB"].notnull()]
         header["DOB14"] = header["DOB"] + pd.DateOffset(years=14)
         header["DOB16"] = header["DOB"] + pd.DateOffset(years=16)
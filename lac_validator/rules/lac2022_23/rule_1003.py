@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,12 +18,10 @@ def validate(dfs):
         placed_adoption = dfs["PlacedAdoption"]
 
         # to datetime
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # select the earliest episodes with RNE =  S
         eps_rne = episodes[episodes["RNE"] == "S"]
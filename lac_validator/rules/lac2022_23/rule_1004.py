@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,9 +16,7 @@ def validate(dfs):
     else:
         missing = dfs["Missing"]
 
-        missing["fMIS_START"] = pd.to_datetime(
-            missing["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        missing["fMIS_START"] = get_date_column(dfs, "Missing", "MIS_START")
 
         missing_start_date = missing["MIS_START"].isna()
         invalid_start_date = missing["fMIS_START"].isna()
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,9 +15,7 @@ def validate(dfs):
         return {}
     else:
         missing = dfs["Missing"]
-        missing["fMIS_END"] = pd.to_datetime(
-            missing["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
+        missing["fMIS_END"] = get_date_column(dfs, "Missing", "MIS_END")
 
         missing_end_date = missing["MIS_END"].isna()
         invalid_end_date = missing["fMIS_END"].isna()
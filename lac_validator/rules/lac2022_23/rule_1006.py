@@ -1,30 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="1006",
+    module=__name__,
     message="Missing type invalid.",
-    affected_fields=["MISSING"],
-    tables=["Missing"],
+    table="Missing",
+    field="MISSING",
+    codes=["M", "A"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "Missing" not in dfs:
-        return {}
-
-    missing_from_care = dfs["Missing"]
-    code_list = ["M", "A"]
-
-    mask = (
-        missing_from_care["MISSING"].isin(code_list)
-        | missing_from_care["MISSING"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = missing_from_care.index[validation_error_mask]
-
-    return {"Missing": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,20 +1,12 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="1009",
+    module=__name__,
     message="Reason for placement change is not a valid code.",
-    affected_fields=["REASON_PLACE_CHANGE"],
-    tables=["Episodes"],
-)
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = [
+    table="Episodes",
+    field="REASON_PLACE_CHANGE",
+    codes=[
         "CARPL",
         "CLOSE",
         "ALLEG",
@@ -27,17 +19,9 @@ def validate(dfs):
         "PLACE",
         "CUSTOD",
         "OTHER",
-    ]
-
-    mask = (
-        episodes["REASON_PLACE_CHANGE"].isin(code_list)
-        | episodes["REASON_PLACE_CHANGE"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
+    ],
+    allow_null=True,
+)
 
 
 def test_validate():
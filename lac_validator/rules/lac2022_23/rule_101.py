@@ -1,27 +1,13 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="101",
+    module=__name__,
     message="Gender code is not valid.",
-    affected_fields=["SEX"],
-    tables=["Header"],
+    table="Header",
+    field="SEX",
+    codes=["1", "2"],
 )
-def validate(dfs):
-    if "Header" not in dfs:
-        return {}
-
-    header = dfs["Header"]
-    code_list = ["1", "2"]
-
-    mask = header["SEX"].astype(str).isin(code_list)
-
-    validation_error_mask = ~mask
-    validation_error_locations = header.index[validation_error_mask]
-
-    return {"Header": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -23,9 +24,7 @@ def validate(dfs):
         oc3 = dfs["OC3"]
 
         # convert DECOM to datetime, drop missing/invalid sort by CHILD then DECOM,
-        episodes_last["DECOM"] = pd.to_datetime(
-            episodes_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
         episodes_last = episodes_last.dropna(subset=["DECOM"]).sort_values(
             ["CHILD", "DECOM"], ascending=True
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,7 +16,7 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         oc3 = dfs["OC3"]
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # If final <REC> = 'E3' then <IN_TOUCH>; <ACTIV> and <ACCOM> should not be provided
         epi.sort_values(["CHILD", "DECOM"], inplace=True)
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,7 +15,7 @@ def validate(dfs):
         return {}
     else:
         header = dfs["Header"]
-        mask = pd.to_datetime(header["DOB"], format="%d/%m/%Y", errors="coerce").notna()
+        mask = get_date_column(dfs, "Header", "DOB").notna()
 
         validation_error_mask = ~mask
         validation_error_locations = header.index[validation_error_mask]
@@ -1,20 +1,12 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="103",
+    module=__name__,
     message="The ethnicity code is either not valid or has not been entered.",
-    affected_fields=["ETHNIC"],
-    tables=["Header"],
-)
-def validate(dfs):
-    if "Header" not in dfs:
-        return {}
-
-    header = dfs["Header"]
-    code_list = [
+    table="Header",
+    field="ETHNIC",
+    codes=[
         "WBRI",
         "WIRI",
         "WOTH",
@@ -35,14 +27,8 @@ def validate(dfs):
         "OOTH",
         "REFU",
         "NOBT",
-    ]
-
-    mask = header["ETHNIC"].isin(code_list)
-
-    validation_error_mask = ~mask
-    validation_error_locations = header.index[validation_error_mask]
-
-    return {"Header": validation_error_locations.tolist()}
+    ],
+)
 
 
 def test_validate():
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,7 +15,7 @@ def validate(dfs):
         return {}
     else:
         uasc = dfs["UASC"]
-        uasc["DUC_dt"] = pd.to_datetime(uasc["DUC"], format="%d/%m/%Y", errors="coerce")
+        uasc["DUC_dt"] = get_date_column(dfs, "UASC", "DUC")
         collection_start = pd.to_datetime(
             dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
         )
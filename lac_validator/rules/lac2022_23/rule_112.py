@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,9 +15,7 @@ def validate(dfs):
         return {}
     else:
         ad1 = dfs["AD1"]
-        mask = pd.to_datetime(
-            ad1["DATE_INT"], format="%d/%m/%Y", errors="coerce"
-        ).notna()
+        mask = get_date_column(dfs, "AD1", "DATE_INT").notna()
 
         na_location = ad1["DATE_INT"].isna()
 
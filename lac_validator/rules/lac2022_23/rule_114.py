@@ -1,30 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="114",
+    module=__name__,
     message="Data entry to record the status of former carer(s) of an adopted child is invalid.",
-    affected_fields=["FOSTER_CARE"],
-    tables=["AD1"],
+    table="AD1",
+    field="FOSTER_CARE",
+    codes=["0", "1"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "AD1" not in dfs:
-        return {}
-
-    adoptions = dfs["AD1"]
-    code_list = ["0", "1"]
-
-    mask = (
-        adoptions["FOSTER_CARE"].astype(str).isin(code_list)
-        | adoptions["FOSTER_CARE"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = adoptions.index[validation_error_mask]
-
-    return {"AD1": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,9 +15,7 @@ def validate(dfs):
         return {}
     else:
         adopt = dfs["PlacedAdoption"]
-        mask = pd.to_datetime(
-            adopt["DATE_PLACED_CEASED"], format="%d/%m/%Y", errors="coerce"
-        ).notna()
+        mask = get_date_column(dfs, "PlacedAdoption", "DATE_PLACED_CEASED").notna()
 
         na_location = adopt["DATE_PLACED_CEASED"].isna()
 
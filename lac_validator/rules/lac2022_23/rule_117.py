@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,23 +19,17 @@ def validate(dfs):
         collection_end = dfs["metadata"]["collection_end"]
 
         # datetime
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        placed_adoption["DATE_PLACED_CEASED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # Drop nans and continuing episodes
         episodes = episodes.dropna(subset=["DECOM"])
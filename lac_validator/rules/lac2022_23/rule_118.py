@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -19,13 +20,9 @@ def validate(dfs):
         code_list = ["V3", "V4"]
 
         # datetime
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        placed_adoption["DATE_PLACED_CEASED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
@@ -1,30 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="120",
+    module=__name__,
     message="The reason for the reversal of the decision that the child should be placed for adoption code is not valid.",
-    affected_fields=["REASON_PLACED_CEASED"],
-    tables=["PlacedAdoption"],
+    table="PlacedAdoption",
+    field="REASON_PLACED_CEASED",
+    codes=["RD1", "RD2", "RD3", "RD4"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "PlacedAdoption" not in dfs:
-        return {}
-
-    placed_adoptions = dfs["PlacedAdoption"]
-    code_list = ["RD1", "RD2", "RD3", "RD4"]
-
-    mask = (
-        placed_adoptions["REASON_PLACED_CEASED"].isin(code_list)
-        | placed_adoptions["REASON_PLACED_CEASED"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = placed_adoptions.index[validation_error_mask]
-
-    return {"PlacedAdoption": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,26 +1,13 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="131",
+    module=__name__,
     message="Data entry for being in touch after leaving care is invalid.",
-    affected_fields=["IN_TOUCH"],
-    tables=["OC3"],
+    table="OC3",
+    field="IN_TOUCH",
+    codes=["YES", "NO", "DIED", "REFU", "NREQ", "RHOM"],
 )
-def validate(dfs):
-    if "OC3" not in dfs:
-        return {}
-
-    care_leavers = dfs["OC3"]
-    code_list = ["YES", "NO", "DIED", "REFU", "NREQ", "RHOM"]
-    mask = care_leavers["IN_TOUCH"].isin(code_list)
-
-    validation_error_mask = ~mask
-    validation_error_locations = care_leavers.index[validation_error_mask]
-
-    return {"OC3": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,39 +1,13 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="132",
+    module=__name__,
     message="Data entry for activity after leaving care is invalid.",
-    affected_fields=["ACTIV"],
-    tables=["OC3"],
+    table="OC3",
+    field="ACTIV",
+    codes=["F1", "P1", "F2", "P2", "F4", "P4", "F5", "P5", "G4", "G5", "G6", "0"],
 )
-def validate(dfs):
-    if "OC3" not in dfs:
-        return {}
-
-    care_leavers = dfs["OC3"]
-    code_list = [
-        "F1",
-        "P1",
-        "F2",
-        "P2",
-        "F4",
-        "P4",
-        "F5",
-        "P5",
-        "G4",
-        "G5",
-        "G6",
-        "0",
-    ]
-    mask = care_leavers["ACTIV"].astype(str).isin(code_list)
-
-    validation_error_mask = ~mask
-    validation_error_locations = care_leavers.index[validation_error_mask]
-
-    return {"OC3": validation_error_locations.tolist()}
 
 
 def test_validate():
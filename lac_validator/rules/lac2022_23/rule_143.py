@@ -1,27 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="143",
+    module=__name__,
     message="The reason for new episode code is not a valid code.",
-    affected_fields=["RNE"],
-    tables=["Episodes"],
+    table="Episodes",
+    field="RNE",
+    codes=["S", "P", "L", "T", "U", "B"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = ["S", "P", "L", "T", "U", "B"]
-
-    mask = episodes["RNE"].isin(code_list) | episodes["RNE"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
 
 
 def test_validate():
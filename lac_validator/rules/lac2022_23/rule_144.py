@@ -1,20 +1,12 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="144",
+    module=__name__,
     message="The legal status code is not a valid code.",
-    affected_fields=["LS"],
-    tables=["Episodes"],
-)
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = [
+    table="Episodes",
+    field="LS",
+    codes=[
         "C1",
         "C2",
         "D1",
@@ -28,14 +20,9 @@ def validate(dfs):
         "L1",
         "L2",
         "L3",
-    ]
-
-    mask = episodes["LS"].isin(code_list) | episodes["LS"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
+    ],
+    allow_null=True,
+)
 
 
 def test_validate():
@@ -1,35 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="145",
+    module=__name__,
     message="Category of need code is not a valid code.",
-    affected_fields=["CIN"],
-    tables=["Episodes"],
+    table="Episodes",
+    field="CIN",
+    codes=["N1", "N2", "N3", "N4", "N5", "N6", "N7", "N8"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = [
-        "N1",
-        "N2",
-        "N3",
-        "N4",
-        "N5",
-        "N6",
-        "N7",
-        "N8",
-    ]
-
-    mask = episodes["CIN"].isin(code_list) | episodes["CIN"].isna()
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
 
 
 def test_validate():
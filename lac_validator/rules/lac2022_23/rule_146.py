@@ -1,20 +1,12 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="146",
+    module=__name__,
     message="Placement type code is not a valid code.",
-    affected_fields=["PLACE"],
-    tables=["Episodes"],
-)
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = [
+    table="Episodes",
+    field="PLACE",
+    codes=[
         "A3",
         "A4",
         "A5",
@@ -42,14 +34,9 @@ def validate(dfs):
         "U5",
         "U6",
         "Z1",
-    ]
-
-    mask = episodes["PLACE"].isin(code_list) | episodes["PLACE"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
+    ],
+    allow_null=True,
+)
 
 
 def test_validate():
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,9 +15,7 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        mask = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        ).notna()
+        mask = get_date_column(dfs, "Episodes", "DEC").notna()
 
         na_location = episodes["DEC"].isna()
 
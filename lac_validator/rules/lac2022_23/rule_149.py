@@ -1,20 +1,12 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="149",
+    module=__name__,
     message="Reason episode ceased code is not valid. ",
-    affected_fields=["REC"],
-    tables=["Episodes"],
-)
-def validate(dfs):
-    if "Episodes" not in dfs:
-        return {}
-
-    episodes = dfs["Episodes"]
-    code_list = [
+    table="Episodes",
+    field="REC",
+    codes=[
         "E11",
         "E12",
         "E2",
@@ -37,14 +29,9 @@ def validate(dfs):
         "E16",
         "E17",
         "X1",
-    ]
-
-    mask = episodes["REC"].isin(code_list) | episodes["REC"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = episodes.index[validation_error_mask]
-
-    return {"Episodes": validation_error_locations.tolist()}
+    ],
+    allow_null=True,
+)
 
 
 def test_validate():
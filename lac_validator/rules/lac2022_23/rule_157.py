@@ -13,6 +13,7 @@ from lac_validator.utils import (
     "Strengths and Difficulties Questionnaire (SDQ) score.",
     affected_fields=["SDQ_REASON", "DOB"],
     tables=["OC2", "Episodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "OC2" not in dfs or "Episodes" not in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,9 +16,7 @@ def validate(dfs):
     else:
         review = dfs["Reviews"]
 
-        error_mask = pd.to_datetime(
-            review["REVIEW"], format="%d/%m/%Y", errors="coerce"
-        ).isna()
+        error_mask = get_date_column(dfs, "Reviews", "REVIEW").isna()
 
         validation_error_locations = review.index[error_mask]
 
@@ -1,30 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="175",
+    module=__name__,
     message="The number of adopter(s) code is not a valid code.",
-    affected_fields=["NB_ADOPTR"],
-    tables=["AD1"],
+    table="AD1",
+    field="NB_ADOPTR",
+    codes=["1", "2"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "AD1" not in dfs:
-        return {}
-
-    adoptions = dfs["AD1"]
-    code_list = ["1", "2"]
-
-    mask = (
-        adoptions["NB_ADOPTR"].astype(str).isin(code_list)
-        | adoptions["NB_ADOPTR"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = adoptions.index[validation_error_mask]
-
-    return {"AD1": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,27 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="176",
+    module=__name__,
     message="The gender of adopter(s) at the date of adoption code is not a valid code.",
-    affected_fields=["SEX_ADOPTR"],
-    tables=["AD1"],
+    table="AD1",
+    field="SEX_ADOPTR",
+    codes=["M1", "F1", "MM", "FF", "MF"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "AD1" not in dfs:
-        return {}
-
-    adoptions = dfs["AD1"]
-    code_list = ["M1", "F1", "MM", "FF", "MF"]
-
-    mask = adoptions["SEX_ADOPTR"].isin(code_list) | adoptions["SEX_ADOPTR"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = adoptions.index[validation_error_mask]
-
-    return {"AD1": validation_error_locations.tolist()}
 
 
 def test_validate():
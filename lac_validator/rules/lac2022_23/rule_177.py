@@ -1,27 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="177",
+    module=__name__,
     message="The legal status of adopter(s) code is not a valid code.",
-    affected_fields=["LS_ADOPTR"],
-    tables=["AD1"],
+    table="AD1",
+    field="LS_ADOPTR",
+    codes=["L0", "L11", "L12", "L2", "L3", "L4"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "AD1" not in dfs:
-        return {}
-
-    adoptions = dfs["AD1"]
-    code_list = ["L0", "L11", "L12", "L2", "L3", "L4"]
-
-    mask = adoptions["LS_ADOPTR"].isin(code_list) | adoptions["LS_ADOPTR"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = adoptions.index[validation_error_mask]
-
-    return {"AD1": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -12,6 +12,7 @@ from lac_validator.utils import (
     + "31 March but a Strengths and Difficulties (SDQ) score has been completed.",
     affected_fields=["SDQ_SCORE"],
     tables=["Episodes", "OC2"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs or "OC2" not in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 from lac_validator.utils import (
     add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER as add_CLA_column,  # Check 'Episodes' present before use!
@@ -29,7 +30,7 @@ def validate(dfs):
     collection_end = pd.to_datetime(
         collection_end_str, format="%d/%m/%Y", errors="coerce"
     )
-    oc2["DOB_dt"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
+    oc2["DOB_dt"] = get_date_column(dfs, "OC2", "DOB")
 
     oc2 = add_CLA_column(dfs, "OC2")
 
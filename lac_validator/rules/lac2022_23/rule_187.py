@@ -22,6 +22,7 @@ from lac_validator.utils import (
         "ACCOM",
     ],  # AD1
     tables=["OC3", "AD1", "Episodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "OC3" not in dfs or "AD1" not in dfs or "Episodes" not in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -22,7 +23,7 @@ def validate(dfs):
     collection_end = pd.to_datetime(
         collection_end_str, format="%d/%m/%Y", errors="coerce"
     )
-    oc2["DOB_dt"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
+    oc2["DOB_dt"] = get_date_column(dfs, "OC2", "DOB")
 
     oc2["4th_bday"] = oc2["DOB_dt"] + pd.DateOffset(years=4)
     error_mask = (oc2["4th_bday"] > collection_end) & oc2[
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,7 +19,7 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
 
         # datetime format allows appropriate comparison between dates
-        oc2["DOB"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
+        oc2["DOB"] = get_date_column(dfs, "OC2", "DOB")
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
         )
@@ -21,6 +21,7 @@ from lac_validator.utils import (
         "INTERVENTION_OFFERED",
     ],  # AD1
     tables=["OC2", "Episodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "OC2" not in dfs or "Episodes" not in dfs:
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import first_episode_per_child
 from lac_validator.utils import (
     add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER as add_CLA_column,  # Check 'Episodes' present before use!
 )
@@ -40,9 +41,7 @@ def validate(dfs):
     oc2_error_locs = oc2[mask_oc2].index.to_list()
 
     # CHILD is not in OC2 at all
-    eps["DECOM"] = pd.to_datetime(eps["DECOM"], format="%d/%m/%Y", errors="coerce")
-    eps = eps.reset_index()
-    eps = eps.loc[eps.groupby("CHILD")["DECOM"].idxmin()]
+    eps = eps.loc[first_episode_per_child(dfs, "Episodes")].reset_index()
     merged_eps = eps.merge(oc2[["CHILD"]], on="CHILD", how="left", indicator=True)
     mask_eps = merged_eps["CONTINUOUSLY_LOOKED_AFTER"] & (
         merged_eps["_merge"] == "left_only"
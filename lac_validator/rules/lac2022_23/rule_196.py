@@ -1,27 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="196",
+    module=__name__,
     message="Strengths and Difficulties (SDQ) reason is not a valid code.",
-    affected_fields=["SDQ_REASON"],
-    tables=["OC2"],
+    table="OC2",
+    field="SDQ_REASON",
+    codes=["SDQ1", "SDQ2", "SDQ3", "SDQ4", "SDQ5"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "OC2" not in dfs:
-        return {}
-
-    oc2 = dfs["OC2"]
-    code_list = ["SDQ1", "SDQ2", "SDQ3", "SDQ4", "SDQ5"]
-
-    mask = oc2["SDQ_REASON"].isin(code_list) | oc2["SDQ_REASON"].isna()
-
-    validation_error_mask = ~mask
-    validation_error_locations = oc2.index[validation_error_mask]
-
-    return {"OC2": validation_error_locations.tolist()}
 
 
 def test_validate():
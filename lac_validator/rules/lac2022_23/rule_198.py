@@ -12,6 +12,7 @@ from lac_validator.utils import (
     "for no Strengths and Difficulties (SDQ) score has been completed. ",
     affected_fields=["SDQ_REASON"],
     tables=["Episodes", "OC2"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs or "OC2" not in dfs:
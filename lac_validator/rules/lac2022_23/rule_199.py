@@ -9,6 +9,7 @@ from lac_validator.rule_engine import rule_definition
     "[NOTE: This only tests the current and previous year data loaded into the tool]",
     affected_fields=["CHILD"],
     tables=["Episodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -16,12 +17,8 @@ def validate(dfs):
         header = dfs["Header"]
         header_last = dfs["Header_last"]
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        header_last["DOB"] = pd.to_datetime(
-            header_last["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
+        header_last["DOB"] = get_date_column(dfs, "Header_last", "DOB")
 
         header_merged = (
             header.reset_index()
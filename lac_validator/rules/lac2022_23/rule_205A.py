@@ -10,6 +10,8 @@ from lac_validator.types import MissingMetadataError
     "years does not support this.",
     affected_fields=["CHILD", "UASC"],
     tables=["UASC", "UASC_last", "Header", "Header_last"],
+    # csv uploads without Header tables take the UASC status from the UASC tables
+    optional_tables=["Header", "Header_last"],
 )
 def validate(dfs):
     try:
@@ -9,6 +9,8 @@ from lac_validator.types import MissingMetadataError
     message="Child previously identified as UASC is also UASC this year, but date UASC ceased in both years does not support this.",
     affected_fields=["DUC", "UASC"],
     tables=["UASC", "UASC_last", "Header", "Header_last"],
+    # csv uploads without Header tables take the UASC status from the UASC tables
+    optional_tables=["Header", "Header_last"],
 )
 def validate(dfs):
     try:
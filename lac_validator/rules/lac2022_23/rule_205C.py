@@ -9,6 +9,8 @@ from lac_validator.types import MissingMetadataError
     message="Child not identified as UASC either this year or last year but date UASC ceased has been provided.",
     affected_fields=["DUC", "UASC"],
     tables=["UASC", "UASC_last", "Header", "Header_last"],
+    # csv uploads without Header tables take the UASC status from the UASC tables
+    optional_tables=["Header", "Header_last"],
 )
 def validate(dfs):
     try:
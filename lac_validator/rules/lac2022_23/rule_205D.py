@@ -8,6 +8,8 @@ from lac_validator.rule_engine import rule_definition
     message="Child identified as UASC this year but not identified as UASC status provided for the child last year.",
     affected_fields=["UASC", "CHILD"],
     tables=["UASC", "UASC_last", "Header", "Header_last"],
+    # the UASC status is taken from either the Header or the UASC tables
+    optional_tables=["UASC", "UASC_last", "Header", "Header_last"],
 )
 def validate(dfs):
     if "Header" in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -16,9 +17,7 @@ def validate(dfs):
         header = dfs["Header"]
         collection_start = dfs["metadata"]["collection_start"]
         # convert to datetime
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,9 +15,7 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
         max_decom_allowed = pd.to_datetime(
             "01/04/2015", format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -35,9 +36,7 @@ def validate(dfs):
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
         )
-        episodes["DEC_dt"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC_dt"] = get_date_column(dfs, "Episodes", "DEC")
 
         out_of_england = (
             episodes["PL_LA"]
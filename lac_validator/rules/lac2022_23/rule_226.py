@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,9 +18,7 @@ def validate(dfs):
 
         code_list = ["T0", "T1", "T2", "T3", "T4"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # create column to see previous REASON_PLACE_CHANGE
         episodes = episodes.sort_values(["CHILD", "DECOM"])
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,9 +18,7 @@ def validate(dfs):
         provider_info = dfs["metadata"]["provider_info"]
 
         # convert date fields from strings to datetime format. NB. REG_END is in datetime format already.
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # merge
         episodes["index_eps"] = episodes.index
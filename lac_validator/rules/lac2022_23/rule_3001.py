@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -24,9 +25,7 @@ def validate(dfs):
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         header["DOB17"] = header["DOB"] + pd.DateOffset(years=17)
 
         oc3_merged = (
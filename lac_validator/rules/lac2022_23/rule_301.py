@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,9 +21,7 @@ def validate(dfs):
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
 
         # <DOB> must be <= <COLLECTION_END_DATE>
         mask = header["DOB"] > collection_end
@@ -1,6 +1,8 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import first_episode_per_child
 
 
 @rule_definition(
@@ -18,17 +20,13 @@ def validate(dfs):
         header = dfs["Header"]
         episodes = dfs["Episodes"]
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        first_ep_inds = first_episode_per_child(dfs, "Episodes")
 
-        episodes = episodes.reset_index()
-        header = header.reset_index()
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
-        episodes = episodes.loc[episodes.groupby("CHILD")["DECOM"].idxmin()]
+        episodes = episodes.loc[first_ep_inds].reset_index()
+        header = header.reset_index()
 
         merged = episodes.merge(
             header, how="left", on=["CHILD"], suffixes=("_eps", "_hdr")
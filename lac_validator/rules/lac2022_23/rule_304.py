@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,8 +15,8 @@ def validate(dfs):
         return {}
     else:
         uasc = dfs["UASC"]
-        uasc["DOB"] = pd.to_datetime(uasc["DOB"], format="%d/%m/%Y", errors="coerce")
-        uasc["DUC"] = pd.to_datetime(uasc["DUC"], format="%d/%m/%Y", errors="coerce")
+        uasc["DOB"] = get_date_column(dfs, "UASC", "DOB")
+        uasc["DUC"] = get_date_column(dfs, "UASC", "DUC")
         mask = uasc["DUC"].notna() & (
             uasc["DUC"] > uasc["DOB"] + pd.offsets.DateOffset(years=18)
         )
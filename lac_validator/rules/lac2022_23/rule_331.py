@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,10 +21,8 @@ def validate(dfs):
         adt["AD1_index"] = adt.index
         eps["Episodes_index"] = eps.index
 
-        adt["DATE_MATCH"] = pd.to_datetime(
-            adt["DATE_MATCH"], format="%d/%m/%Y", errors="coerce"
-        )
-        eps["DECOM"] = pd.to_datetime(eps["DECOM"], format="%d/%m/%Y", errors="coerce")
+        adt["DATE_MATCH"] = get_date_column(dfs, "AD1", "DATE_MATCH")
+        eps["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # Only keep the episodes where <Adopted> = 'Y'
         adoption_eps = eps[eps["REC"].isin(["E11", "E12"])]
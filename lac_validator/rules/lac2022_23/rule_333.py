@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         adt = dfs["AD1"]
-        adt["DATE_MATCH"] = pd.to_datetime(
-            adt["DATE_MATCH"], format="%d/%m/%Y", errors="coerce"
-        )
-        adt["DATE_INT"] = pd.to_datetime(
-            adt["DATE_INT"], format="%d/%m/%Y", errors="coerce"
-        )
+        adt["DATE_MATCH"] = get_date_column(dfs, "AD1", "DATE_MATCH")
+        adt["DATE_INT"] = get_date_column(dfs, "AD1", "DATE_INT")
 
         # If <DATE_MATCH> provided, then <DATE_INT> must also be provided and be <= <DATE_MATCH>
         mask1 = adt["DATE_MATCH"].notna() & adt["DATE_INT"].isna()
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,12 +18,8 @@ def validate(dfs):
         ad1 = dfs["AD1"]
 
         # to datetime
-        ad1["DATE_INT"] = pd.to_datetime(
-            ad1["DATE_INT"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        ad1["DATE_INT"] = get_date_column(dfs, "AD1", "DATE_INT")
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         # select the earliest episodes with RNE =  S
         eps_rne = episodes[episodes["RNE"] == "S"]
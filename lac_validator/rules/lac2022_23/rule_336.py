@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -28,9 +29,7 @@ def validate(dfs):
             "U6",
         ]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
         # new column that contains place of previous episode
 
         sorted_and_grouped_eps = episodes.sort_values("DECOM").groupby("CHILD")
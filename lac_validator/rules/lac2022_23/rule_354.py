@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,7 +18,7 @@ def validate(dfs):
         collection_end = pd.to_datetime(
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
         error_mask = epi["DECOM"] > collection_end
         error_list = epi.index[error_mask].to_list()
         return {"Episodes": error_list}
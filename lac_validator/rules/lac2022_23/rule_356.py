@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
         error_mask = episodes["DEC"].notna() & (episodes["DEC"] < episodes["DECOM"])
 
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,7 +21,7 @@ def validate(dfs):
     collection_start = pd.to_datetime(
         dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
     )
-    eps["DECOM"] = pd.to_datetime(eps["DECOM"], format="%d/%m/%Y", errors="coerce")
+    eps["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
     eps = eps.loc[eps["DECOM"].notnull()]
 
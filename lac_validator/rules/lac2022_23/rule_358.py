@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,12 +19,8 @@ def validate(dfs):
         code_list = ["J1", "J2", "J3"]
 
         # convert dates to datetime format
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         # prepare to merge
         episodes.reset_index(inplace=True)
         header.reset_index(inplace=True)
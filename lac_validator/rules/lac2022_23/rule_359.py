@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,7 +16,7 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         hea = dfs["Header"]
-        hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
+        hea["DOB"] = get_date_column(dfs, "Header", "DOB")
         collection_end = pd.to_datetime(
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -16,8 +17,8 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         collection_end = pd.to_datetime(
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
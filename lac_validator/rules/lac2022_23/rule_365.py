@@ -15,7 +15,8 @@ def validate(dfs):
     episodes = dfs["Episodes"]
     collection_end_str = dfs["metadata"]["collection_end"]
 
-    episodes.loc[episodes["DEC"].isna(), "DEC"] = collection_end_str
+    # fillna rather than .loc, so the shared DEC column isn't overwritten for other rules.
+    episodes["DEC"] = episodes["DEC"].fillna(collection_end_str)
     episodes["DECOM"] = pd.to_datetime(
         episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
     )
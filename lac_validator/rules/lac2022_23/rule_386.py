@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,12 +19,8 @@ def validate(dfs):
         header = dfs["Header"]
         episodes = dfs["Episodes"]
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         header["DOB18"] = header["DOB"] + pd.DateOffset(years=18)
 
         episodes_merged = (
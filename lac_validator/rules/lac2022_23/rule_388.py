@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,8 +15,8 @@ def validate(dfs):
         return {}
     else:
         df = dfs["Episodes"]
-        df["DECOM"] = pd.to_datetime(df["DECOM"], format="%d/%m/%Y", errors="coerce")
-        df["DEC"] = pd.to_datetime(df["DEC"], format="%d/%m/%Y", errors="coerce")
+        df["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        df["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
         df["DECOM"] = df["DECOM"].fillna(
             "01/01/1901"
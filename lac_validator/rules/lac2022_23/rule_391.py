@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,7 +18,7 @@ def validate(dfs):
         collection_end = dfs["metadata"]["collection_end"]
 
         # convert dates to datetime format
-        oc3["DOB"] = pd.to_datetime(oc3["DOB"], format="%d/%m/%Y", errors="coerce")
+        oc3["DOB"] = get_date_column(dfs, "OC3", "DOB")
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,6 +1,6 @@
 import pandas as pd
 
-from lac_validator.datastore import merge_postcodes
+from lac_validator.datastore import lookup_postcodes
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,11 +17,11 @@ def validate(dfs):
         episodes = dfs["Episodes"]
 
         home_provided = episodes["HOME_POST"].notna()
-        home_details = merge_postcodes(episodes, "HOME_POST")
+        home_details = lookup_postcodes(episodes["HOME_POST"])
         home_valid = home_details["pcd"].notna()
 
         pl_provided = episodes["PL_POST"].notna()
-        pl_details = merge_postcodes(episodes, "PL_POST")
+        pl_details = lookup_postcodes(episodes["PL_POST"])
         pl_valid = pl_details["pcd"].notna()
 
         error_mask = (home_provided & ~home_valid) | (pl_provided & ~pl_valid)
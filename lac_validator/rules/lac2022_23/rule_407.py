@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,12 +19,8 @@ def validate(dfs):
         code_list = ["E45", "E46", "E47", "E48"]
 
         # convert dates to datetime format
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         # prepare to merge
         episodes.reset_index(inplace=True)
         header.reset_index(inplace=True)
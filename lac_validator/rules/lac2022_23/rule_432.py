@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -16,7 +17,7 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         epi.sort_values(["CHILD", "DECOM"], inplace=True)
         epi.reset_index(inplace=True)
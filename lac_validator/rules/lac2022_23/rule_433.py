@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        episodes["DECOM_dt"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC_dt"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM_dt"] = get_date_column(dfs, "Episodes", "DECOM")
+        episodes["DEC_dt"] = get_date_column(dfs, "Episodes", "DEC")
 
         episodes["original_index"] = episodes.index
         episodes.sort_values(["CHILD", "DECOM_dt", "DEC_dt"], inplace=True)
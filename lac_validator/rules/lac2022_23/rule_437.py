@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,9 +18,7 @@ def validate(dfs):
     else:
         episodes = dfs["Episodes"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         episodes.sort_values(["CHILD", "DECOM"], inplace=True)
         episodes[["NEXT_DECOM", "NEXT_CHILD"]] = episodes[["DECOM", "CHILD"]].shift(-1)
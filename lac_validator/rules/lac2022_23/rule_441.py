@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         reviews = dfs["Reviews"]
-        reviews["DOB"] = pd.to_datetime(
-            reviews["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        reviews["REVIEW"] = pd.to_datetime(
-            reviews["REVIEW"], format="%d/%m/%Y", errors="coerce"
-        )
+        reviews["DOB"] = get_date_column(dfs, "Reviews", "DOB")
+        reviews["REVIEW"] = get_date_column(dfs, "Reviews", "REVIEW")
         reviews = reviews.dropna(subset=["REVIEW", "DOB"])
 
         mask = reviews["REVIEW_CODE"].isin(
@@ -1,6 +1,11 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import (
+    first_episode_per_child,
+    last_episode_per_child,
+)
 from lac_validator.fixtures import current_episodes, previous_episodes
 
 import pandas as pd
@@ -21,15 +26,11 @@ def validate(dfs):
         episodes = dfs["Episodes"]
         episodes_last = dfs["Episodes_last"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes_last["DECOM"] = pd.to_datetime(
-            episodes_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes_min = first_episode_per_child(dfs, "Episodes")
+        episodes_last_max = last_episode_per_child(dfs, "Episodes_last")
 
-        episodes_min = episodes.groupby("CHILD")["DECOM"].idxmin()
-        episodes_last_max = episodes_last.groupby("CHILD")["DECOM"].idxmax()
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        episodes_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
 
         episodes = episodes[episodes.index.isin(episodes_min)]
         episodes_last = episodes_last[episodes_last.index.isin(episodes_last_max)]
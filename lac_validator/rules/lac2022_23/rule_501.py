@@ -8,6 +8,7 @@ from lac_validator.rule_engine import rule_definition
     message="A new episode has started before the end date of the previous episode.",
     affected_fields=["DECOM", "DEC"],
     tables=["Episodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs:
@@ -1,6 +1,8 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import first_episode_per_child
 
 
 @rule_definition(
@@ -15,20 +17,14 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         epi_last = dfs["Episodes_last"]
-        epi = epi.reset_index()
+        first_ep_inds = first_episode_per_child(dfs, "Episodes")
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
 
         epi_last_no_dec = epi_last[epi_last["DEC"].isna()]
 
-        epi_min_decoms_index = (
-            epi[["CHILD", "DECOM"]].groupby(["CHILD"])["DECOM"].idxmin()
-        )
-
-        epi_min_decom_df = epi.loc[epi_min_decoms_index, :]
+        epi_min_decom_df = epi.loc[first_ep_inds, :].reset_index()
 
         merged_episodes = epi_min_decom_df.merge(
             epi_last_no_dec, on="CHILD", how="inner"
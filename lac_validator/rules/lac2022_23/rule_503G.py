@@ -1,7 +1,12 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.fixtures import current_episodes, previous_episodes
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import (
+    first_episode_per_child,
+    last_episode_per_child,
+)
 
 
 @rule_definition(
@@ -18,20 +23,14 @@ def validate(dfs):
         epi_last = dfs["Episodes_last"]
         field = "PL_DISTANCE"
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        epi_last["DEC"] = pd.to_datetime(
-            epi_last["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-
-        epi.reset_index(inplace=True)
+        first_ep_inds = first_episode_per_child(dfs, "Episodes")
+        last_ep_inds = last_episode_per_child(dfs, "Episodes_last")
 
-        first_ep_inds = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
-        min_decom = epi.loc[first_ep_inds, :]
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
+        epi_last["DEC"] = get_date_column(dfs, "Episodes_last", "DEC")
 
-        last_ep_inds = epi_last.groupby(["CHILD"])["DECOM"].idxmax(skipna=True)
+        min_decom = epi.loc[first_ep_inds, :].reset_index()
         max_last_decom = epi_last.loc[last_ep_inds, :]
 
         merged_co = min_decom.merge(
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -19,12 +20,8 @@ def validate(dfs):
         # if PLACE is equal to A3, A4, A5 or A6 then placed-for-adoption = Y
 
         # to datetime
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        ad1["DATE_INT"] = pd.to_datetime(
-            ad1["DATE_INT"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        ad1["DATE_INT"] = get_date_column(dfs, "AD1", "DATE_INT")
 
         # prepare to merge
         episodes.reset_index(inplace=True)
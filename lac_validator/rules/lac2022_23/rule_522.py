@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,13 +16,11 @@ def validate(dfs):
     else:
         placed_adoption = dfs["PlacedAdoption"]
         # Convert to datetimes
-        placed_adoption["DATE_PLACED_CEASED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED_CEASED"],
-            format="%d/%m/%Y",
-            errors="coerce",
+        placed_adoption["DATE_PLACED_CEASED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         # Boolean mask
         mask = placed_adoption["DATE_PLACED_CEASED"] < placed_adoption["DATE_PLACED"]
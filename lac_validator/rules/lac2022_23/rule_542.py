@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -7,14 +8,14 @@ from lac_validator.rule_engine import rule_definition
     code="542",
     message="A child aged under 10 at 31 March should not have conviction information completed.",
     affected_fields=["CONVICTED"],
-    tables=["OC2s"],
+    tables=["OC2"],
 )
 def validate(dfs):
     if "OC2" not in dfs:
         return {}
     else:
         oc2 = dfs["OC2"]
-        oc2["DOB"] = pd.to_datetime(oc2["DOB"], format="%d/%m/%Y", errors="coerce")
+        oc2["DOB"] = get_date_column(dfs, "OC2", "DOB")
         collection_end = pd.to_datetime(
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
@@ -8,6 +8,7 @@ from lac_validator.rule_engine import rule_definition
     message="Child has been placed for adoption but there is no date of the decision that the child should be placed for adoption.",
     affected_fields=["DATE_PLACED", "PLACE"],
     tables=["Episodes", "PlacedAdoption"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs or "PlacedAdoption" not in dfs:
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -8,6 +9,7 @@ from lac_validator.rule_engine import rule_definition
     message="Date of decision that the child should be placed for adoption should be on or prior to the date that the freeing order was granted.",
     affected_fields=["DATE_PLACED", "DECOM"],
     tables=["Episodes", "PlacedAdoption"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "Episodes" not in dfs or "PlacedAdoption" not in dfs:
@@ -16,11 +18,9 @@ def validate(dfs):
         episodes = dfs["Episodes"]
         placedAdoptions = dfs["PlacedAdoption"]
 
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        placedAdoptions["DATE_PLACED"] = pd.to_datetime(
-            placedAdoptions["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        placedAdoptions["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
 
         episodes = episodes.reset_index()
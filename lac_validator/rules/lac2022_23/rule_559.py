@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,11 +19,11 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
 
         # convert dates to appropriate format
-        pa_last["DATE_PLACED"] = pd.to_datetime(
-            pa_last["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        pa_last["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption_last", "DATE_PLACED"
         )
-        placed_adoption["DATE_PLACED"] = pd.to_datetime(
-            placed_adoption["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        placed_adoption["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
@@ -1,6 +1,8 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import last_episode_per_child
 
 
 @rule_definition(
@@ -15,10 +17,10 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         epi_last = dfs["Episodes_last"]
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        grp_last_decom_by_child = last_episode_per_child(dfs, "Episodes_last")
+
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
         collection_start = pd.to_datetime(
             dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
         )
@@ -28,10 +30,6 @@ def validate(dfs):
 
         grp_decom_by_child = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
         min_decom = epi.loc[epi.index.isin(grp_decom_by_child), :]
-
-        grp_last_decom_by_child = epi_last.groupby(["CHILD"])["DECOM"].idxmax(
-            skipna=True
-        )
         max_last_decom = epi_last.loc[epi_last.index.isin(grp_last_decom_by_child), :]
 
         merged_co = min_decom.merge(
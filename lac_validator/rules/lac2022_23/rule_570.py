@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,9 +19,7 @@ def validate(dfs):
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
 
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = get_date_column(dfs, "Missing", "MIS_START")
         error_mask = mis["MIS_START"] > collection_end
 
         return {"Missing": mis.index[error_mask].to_list()}
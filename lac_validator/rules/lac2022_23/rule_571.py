@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -21,9 +22,7 @@ def validate(dfs):
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
 
-        missing["fMIS_END"] = pd.to_datetime(
-            missing["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
+        missing["fMIS_END"] = get_date_column(dfs, "Missing", "MIS_END")
 
         end_date_before_year = missing["fMIS_END"] < collection_start
         end_date_after_year = missing["fMIS_END"] > collection_end
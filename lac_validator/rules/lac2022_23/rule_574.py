@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,12 +15,8 @@ def validate(dfs):
         return {}
     else:
         mis = dfs["Missing"]
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        mis["MIS_END"] = pd.to_datetime(
-            mis["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = get_date_column(dfs, "Missing", "MIS_START")
+        mis["MIS_END"] = get_date_column(dfs, "Missing", "MIS_END")
 
         mis["MIS_END_FILL"] = mis["MIS_END"].fillna(mis["MIS_START"])
         mis.sort_values(["CHILD", "MIS_END_FILL", "MIS_START"], inplace=True)
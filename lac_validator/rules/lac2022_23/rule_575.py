@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,8 +21,8 @@ def validate(dfs):
 
         mis.reset_index(inplace=True)
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         mis["MIS_START"] = pd.to_datetime(
             mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -9,7 +10,7 @@ from lac_validator.rule_engine import rule_definition
     + "last year’s return and there is no corresponding period recorded at the start of "
     + "this year.",
     affected_fields=["CHILD"],
-    tables=["MIssing", "Missing_last"],
+    tables=["Missing", "Missing_last"],
 )
 def validate(dfs):
     if "Missing" not in dfs or "Missing_last" not in dfs:
@@ -17,12 +18,8 @@ def validate(dfs):
     else:
         mis = dfs["Missing"]
         mis_l = dfs["Missing_last"]
-        mis["MIS_START"] = pd.to_datetime(
-            mis["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        mis_l["MIS_START"] = pd.to_datetime(
-            mis_l["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
+        mis["MIS_START"] = get_date_column(dfs, "Missing", "MIS_START")
+        mis_l["MIS_START"] = get_date_column(dfs, "Missing_last", "MIS_START")
 
         mis.reset_index(inplace=True)
         mis["MIS_START"].fillna(
@@ -1,6 +1,8 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
+from lac_validator.rules.rule_utils import periods_of_care
 
 
 @rule_definition(
@@ -13,64 +15,17 @@ def validate(dfs):
     if "Episodes" not in dfs or "Missing" not in dfs:
         return {}
     else:
-        episodes = dfs["Episodes"]
         missing = dfs["Missing"]
 
-        episodes["original_index"] = episodes.index
-
         # put dates in appropriate format.
-        missing["MIS_END"] = pd.to_datetime(
-            missing["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
-        missing["MIS_START"] = pd.to_datetime(
-            missing["MIS_START"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        missing["MIS_END"] = get_date_column(dfs, "Missing", "MIS_END")
+        missing["MIS_START"] = get_date_column(dfs, "Missing", "MIS_START")
 
         # filter data based on provided conditions.
         missing = missing[missing["MIS_START"].notna()].copy()
-        episodes = episodes.dropna(subset=["DECOM"])
-
-        # create period of care blocks
-        episodes = episodes.sort_values(["CHILD", "DECOM"])
-
-        episodes["index"] = pd.RangeIndex(0, len(episodes))
-        episodes["index+1"] = episodes["index"] + 1
-        episodes = episodes.merge(
-            episodes,
-            left_on="index",
-            right_on="index+1",
-            how="left",
-            suffixes=[None, "_prev"],
-        )
-        episodes = episodes[
-            [
-                "original_index",
-                "DECOM",
-                "DEC",
-                "DEC_prev",
-                "CHILD",
-                "CHILD_prev",
-                "LS",
-            ]
-        ]
-
-        episodes["new_period"] = (episodes["DECOM"] > episodes["DEC_prev"]) | (
-            episodes["CHILD"] != episodes["CHILD_prev"]
-        )
-        episodes["period_id"] = episodes["new_period"].astype(int).cumsum()
 
-        # allocate the same DECOM (min) and DEC (max) to all episodes in a period of care.
-        pocs = pd.DataFrame()
-        pocs[["CHILD", "poc_DECOM"]] = episodes.groupby("period_id")[
-            ["CHILD", "DECOM"]
-        ].first()
-        pocs["poc_DEC"] = episodes.groupby("period_id")["DEC"].nth(-1)
+        # periods of care, with the DECOM of their first and the DEC of their last episode.
+        pocs = periods_of_care(dfs)
 
         # prepare to merge
         missing["index_ing"] = missing.index
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,11 +15,11 @@ def validate(dfs):
         return {}
     else:
         adopt_placed = dfs["PlacedAdoption"]
-        adopt_placed["DATE_PLACED"] = pd.to_datetime(
-            adopt_placed["DATE_PLACED"], format="%d/%m/%Y", errors="coerce"
+        adopt_placed["DATE_PLACED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED"
         )
-        adopt_placed["DATE_PLACED_CEASED"] = pd.to_datetime(
-            adopt_placed["DATE_PLACED_CEASED"], format="%d/%m/%Y", errors="coerce"
+        adopt_placed["DATE_PLACED_CEASED"] = get_date_column(
+            dfs, "PlacedAdoption", "DATE_PLACED_CEASED"
         )
 
         adopt_placed.sort_values(["CHILD", "DATE_PLACED"], inplace=True)
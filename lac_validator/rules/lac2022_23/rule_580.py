@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -7,7 +8,7 @@ from lac_validator.rule_engine import rule_definition
     code="580",
     message="Child is missing when cease being looked after but reason episode ceased not ‘E8’.",
     affected_fields=["REC"],
-    tables=["Episodes", "MIssing"],
+    tables=["Episodes", "Missing"],
 )
 def validate(dfs):
     if "Episodes" not in dfs or "Missing" not in dfs:
@@ -15,11 +16,9 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         mis = dfs["Missing"]
-        mis["MIS_END"] = pd.to_datetime(
-            mis["MIS_END"], format="%d/%m/%Y", errors="coerce"
-        )
-        mis["DOB"] = pd.to_datetime(mis["DOB"], format="%d/%m/%Y", errors="coerce")
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+        mis["MIS_END"] = get_date_column(dfs, "Missing", "MIS_END")
+        mis["DOB"] = get_date_column(dfs, "Missing", "DOB")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
         epi.reset_index(inplace=True)
         mis["BD18"] = mis["DOB"] + pd.DateOffset(years=18)
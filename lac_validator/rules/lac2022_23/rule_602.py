@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,7 +16,7 @@ def validate(dfs):
     else:
         epi = dfs["Episodes"]
         ad1 = dfs["AD1"]
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         collection_start = pd.to_datetime(
             dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,9 +21,7 @@ def validate(dfs):
         code_list = ["V3", "V4"]
 
         # convert to datetiime format
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,7 +18,7 @@ def validate(dfs):
         collection_start = pd.to_datetime(
             dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
         )
-        hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
+        hea["DOB"] = get_date_column(dfs, "Header", "DOB")
 
         hea_mother = hea[hea["MOTHER"].astype(str) == "1"]
         error_cohort = (
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -15,12 +16,8 @@ def validate(dfs):
     else:
         header = dfs["Header"]
 
-        header["MC_DOB"] = pd.to_datetime(
-            header["MC_DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["MC_DOB"] = get_date_column(dfs, "Header", "MC_DOB")
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
         mask = (header["MC_DOB"] > header["DOB"]) | header["MC_DOB"].isna()
 
         validation_error_mask = ~mask
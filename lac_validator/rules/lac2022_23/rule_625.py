@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -21,12 +22,8 @@ def validate(dfs):
         collection_end = pd.to_datetime(
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
-        header["MC_DOB"] = pd.to_datetime(
-            header["MC_DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["MC_DOB"] = get_date_column(dfs, "Header", "MC_DOB")
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
         # prepare to merge
         header.reset_index(inplace=True)
         episodes.reset_index(inplace=True)
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -17,9 +18,7 @@ def validate(dfs):
         header = dfs["Header"]
         header_prev = dfs["Header_last"]
         collection_start = dfs["metadata"]["collection_start"]
-        header["MC_DOB"] = pd.to_datetime(
-            header["MC_DOB"], format="%d/%m/%Y", errors="coerce"
-        )
+        header["MC_DOB"] = get_date_column(dfs, "Header", "MC_DOB")
         collection_start = pd.to_datetime(
             collection_start, format="%d/%m/%Y", errors="coerce"
         )
@@ -1,30 +1,14 @@
-import pandas as pd
+from lac_validator.rule_engine import code_list_rule
 
-from lac_validator.rule_engine import rule_definition
-
-
-@rule_definition(
+validate = code_list_rule(
     code="631",
+    module=__name__,
     message="Previous permanence option not a valid value.",
-    affected_fields=["PREV_PERM"],
-    tables=["PrevPerm"],
+    table="PrevPerm",
+    field="PREV_PERM",
+    codes=["P1", "P2", "P3", "P4", "Z1"],
+    allow_null=True,
 )
-def validate(dfs):
-    if "PrevPerm" not in dfs:
-        return {}
-
-    previous_permanence = dfs["PrevPerm"]
-    code_list = ["P1", "P2", "P3", "P4", "Z1"]
-
-    mask = (
-        previous_permanence["PREV_PERM"].isin(code_list)
-        | previous_permanence["PREV_PERM"].isna()
-    )
-
-    validation_error_mask = ~mask
-    validation_error_locations = previous_permanence.index[validation_error_mask]
-
-    return {"PrevPerm": validation_error_locations.tolist()}
 
 
 def test_validate():
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -21,9 +22,7 @@ def validate(dfs):
         prevperm = dfs["PrevPerm"]
 
         # convert dates from strings to appropriate format.
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
         prevperm["DATE_PERM_dt"] = prevperm["DATE_PERM"].apply(
             lac_validator.rules.rule_utils.valid_date
         )
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.fixtures import fake_INT_file, fake_INT_header
 from lac_validator.rule_engine import rule_definition
 
@@ -17,10 +18,8 @@ def validate(dfs):
         header = dfs["Header"]
         file = dfs["Missing"]
 
-        header["DOB"] = pd.to_datetime(
-            header["DOB"], format="%d/%m/%Y", errors="coerce"
-        )
-        file["DOB"] = pd.to_datetime(file["DOB"], format="%d/%m/%Y", errors="coerce")
+        header["DOB"] = get_date_column(dfs, "Header", "DOB")
+        file["DOB"] = get_date_column(dfs, "Missing", "DOB")
 
         file["index_file"] = file.index
 
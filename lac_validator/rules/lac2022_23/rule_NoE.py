@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -14,13 +15,9 @@ def validate(dfs):
         return {}
     else:
         episodes = dfs["Episodes"]
-        episodes["DECOM"] = pd.to_datetime(
-            episodes["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
         episodes_last = dfs["Episodes_last"]
-        episodes_last["DECOM"] = pd.to_datetime(
-            episodes_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
         collection_start = pd.to_datetime(
             dfs["metadata"]["collection_start"], format="%d/%m/%Y", errors="coerce"
         )
@@ -1,21 +1,37 @@
 from pathlib import Path
 
 from lac_validator.rule_engine import RuleDefinition, YearConfig
-from lac_validator.rules.lac2022_23 import registry as prev_registry
 from lac_validator.rules.ruleset_utils import (
     extract_validator_functions,
     update_validator_functions,
 )
 
-files = Path(__file__).parent.glob("*.py")
-this_year_validator_funcs: dict[str, RuleDefinition] = extract_validator_functions(
-    files
-)
 # if any rules need to be deleted, add their codes as strings into del_list
 del_list: list[str] = []
-this_year_config = YearConfig(
-    deleted=del_list, added_or_modified=this_year_validator_funcs
-)
 
-registry = update_validator_functions(prev_registry, this_year_config)
+
+def load_registry() -> dict[str, RuleDefinition]:
+    """
+    Imports every rule file in this folder and returns lac2022_23's rules, updated with this year's.
+    """
+    from lac_validator.rules.lac2022_23 import registry as prev_registry
+
+    files = Path(__file__).parent.glob("*.py")
+    this_year_validator_funcs = extract_validator_functions(files)
+    this_year_config = YearConfig(
+        deleted=del_list, added_or_modified=this_year_validator_funcs
+    )
+    return update_validator_functions(prev_registry, this_year_config)
+
+
+def __getattr__(name: str):
+    # the registry is built when it is first used, so that importing a single rule file,
+    # or reading the ruleset's manifest, doesn't import every rule.
+    if name == "registry":
+        global registry
+        registry = load_registry()
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["registry"]
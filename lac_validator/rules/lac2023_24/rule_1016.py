@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -27,9 +28,7 @@ def validate(dfs):
             collection_end, format="%d/%m/%Y", errors="coerce"
         )
 
-        episodes["DEC"] = pd.to_datetime(
-            episodes["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
+        episodes["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
         OC3 = OC3.reset_index()
 
@@ -38,7 +38,7 @@ def validate(dfs):
         errors = merged_df[condition]
         error_rows = errors["index"].tolist()
 
-        return {"SWEpisodes": error_rows}
+        return {"Episodes": error_rows}
 
 
 def test_validate():
@@ -72,4 +72,4 @@ def test_validate():
 
     result = validate(fake_dfs)
 
-    assert result == {"SWEpisodes": [0, 1, 2, 6]}
+    assert result == {"Episodes": [0, 1, 2, 6]}
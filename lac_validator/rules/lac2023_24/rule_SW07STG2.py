@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,7 +21,7 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
         collection_start = pd.to_datetime(collection_start, format="%d/%m/%Y")
 
-        df["SW_DEC"] = pd.to_datetime(df["SW_DEC"], format="%d/%m/%Y", errors="coerce")
+        df["SW_DEC"] = get_date_column(dfs, "SWEpisodes", "SW_DEC")
         df = df[df["SW_DEC"].notna()].copy()
 
         error_rows = df[
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -8,6 +9,7 @@ from lac_validator.rule_engine import rule_definition
     message="A new social worker episode has started, but the previous episode has not ended.",
     affected_fields=["SW_DEC"],
     tables=["SWEpisodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "SWEpisodes" not in dfs:
@@ -15,10 +17,8 @@ def validate(dfs):
     else:
         df = dfs["SWEpisodes"]
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        df["SW_DEC"] = pd.to_datetime(df["SW_DEC"], format="%d/%m/%Y", errors="coerce")
+        df["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
+        df["SW_DEC"] = get_date_column(dfs, "SWEpisodes", "SW_DEC")
 
         df["SW_DECOM"] = df["SW_DECOM"].fillna(
             "01/01/1901"
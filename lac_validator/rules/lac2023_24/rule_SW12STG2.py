@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 from lac_validator.utils import add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER
 
@@ -17,12 +18,10 @@ def validate(dfs):
         SWE = dfs["SWEpisodes"]
         epi = dfs["Episodes"]
 
-        SWE["SW_DECOM"] = pd.to_datetime(
-            SWE["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
 
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         epi = epi.reset_index()
 
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -20,7 +21,7 @@ def validate(dfs):
             dfs["metadata"]["collection_end"], format="%d/%m/%Y", errors="coerce"
         )
 
-        df["DOB"] = pd.to_datetime(df["DOB"], format="%d/%m/%Y", errors="coerce")
+        df["DOB"] = get_date_column(dfs, "Header", "DOB")
 
         under_11_uasc = df[
             ((df["DOB"] > collection_end - pd.DateOffset(years=11)))
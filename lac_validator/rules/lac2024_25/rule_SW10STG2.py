@@ -9,6 +9,7 @@ from lac_validator.rule_engine import rule_definition
     message="A new social worker episode has started before the end date of the previous social worker episode.",
     affected_fields=["SW_DECOM"],
     tables=["SWEpisodes"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if "SWEpisodes" not in dfs:
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 from lac_validator.utils import add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER
 
@@ -24,12 +25,10 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
         collection_start = pd.to_datetime(collection_start, format="%d/%m/%Y")
 
-        SWE["SW_DECOM"] = pd.to_datetime(
-            SWE["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
 
-        epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
+        epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
 
         epi = epi.reset_index()
 
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -29,10 +30,8 @@ def validate(dfs):
             "OTHERS",
         ]
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        df["SW_DEC"] = pd.to_datetime(df["SW_DEC"], format="%d/%m/%Y", errors="coerce")
+        df["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
+        df["SW_DEC"] = get_date_column(dfs, "SWEpisodes", "SW_DEC")
 
         df.sort_values(["CHILD", "SW_DECOM", "SW_DEC"], ascending=True, inplace=True)
 
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -18,9 +19,7 @@ def validate(dfs):
         collection_start = dfs["metadata"]["collection_start"]
         collection_start = pd.to_datetime(collection_start, format="%d/%m/%Y")
 
-        df["SW_DECOM"] = pd.to_datetime(
-            df["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        df["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
 
         reason_null = df[df["SW_REASON"].isna()]
 
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from lac_validator.datastore import get_date_column
 from lac_validator.rule_engine import rule_definition
 
 
@@ -8,6 +9,7 @@ from lac_validator.rule_engine import rule_definition
     message="The social worker reason episode changed does not match the open episode at the end of last year.",
     affected_fields=["SW_REASON"],
     tables=["SWEpisodes", "SWEpisodes_last"],
+    whole_dataset=True,
 )
 def validate(dfs):
     if ("SWEpisodes" not in dfs) | ("SWEpisodes_last" not in dfs):
@@ -19,15 +21,11 @@ def validate(dfs):
         # If present, where there is a previous collection year’s final social worker episode, and <SW_DEC> not provided,
         # then first social worker episode of this year’s collection <SW_REASON> be the same as the previous episode
 
-        SWE_prev["SW_DECOM"] = pd.to_datetime(
-            SWE_prev["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE_prev["SW_DECOM"] = get_date_column(dfs, "SWEpisodes_last", "SW_DECOM")
         prev_ordered = SWE_prev.sort_values(by=["SW_DECOM"], ascending=False)
         prev_ordered = prev_ordered.drop_duplicates(["CHILD"], keep="first")
 
-        SWE["SW_DECOM"] = pd.to_datetime(
-            SWE["SW_DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
+        SWE["SW_DECOM"] = get_date_column(dfs, "SWEpisodes", "SW_DECOM")
         current_ordered = SWE.sort_values(by=["SW_DECOM"], ascending=True)
         current_ordered = current_ordered.drop_duplicates(["CHILD"], keep="first")
         current_ordered["index"] = current_ordered.index
@@ -1,13 +1,94 @@
 import pandas as pd
 
+from lac_validator.datastore import DATE_FORMAT, get_date_column, get_derived
+
+
+def _episode_dates(episodes, columns):
+    dates = pd.DataFrame({"CHILD": episodes["CHILD"]})
+    for column in columns:
+        dates[column] = pd.to_datetime(
+            episodes[column], format=DATE_FORMAT, errors="coerce"
+        )
+    return dates
+
+
+def first_episode_per_child(dfs, table_name="Episodes"):
+    """
+    Index of the episode with the earliest DECOM of each child, as from
+    episodes.groupby("CHILD")["DECOM"].idxmin() once DECOM is parsed. Computed once per validation run.
+    """
+
+    def compute(episodes):
+        return _episode_dates(episodes, ["DECOM"]).groupby("CHILD")["DECOM"].idxmin()
+
+    return get_derived(
+        dfs, "first_episode_per_child", table_name, ["CHILD", "DECOM"], compute
+    )
+
+
+def last_episode_per_child(dfs, table_name="Episodes"):
+    """
+    Index of the episode with the latest DECOM of each child, as from
+    episodes.groupby("CHILD")["DECOM"].idxmax() once DECOM is parsed. Computed once per validation run.
+    """
+
+    def compute(episodes):
+        return _episode_dates(episodes, ["DECOM"]).groupby("CHILD")["DECOM"].idxmax()
+
+    return get_derived(
+        dfs, "last_episode_per_child", table_name, ["CHILD", "DECOM"], compute
+    )
+
+
+def periods_of_care(dfs, table_name="Episodes"):
+    """
+    Periods of care of each child: consecutive episodes of a child, where each starts no later than the
+    previous one ended. Episodes without a DECOM are left out. Computed once per validation run.
+
+    Returns a DataFrame indexed by period_id, with the CHILD, the poc_DECOM of the first episode and the
+    poc_DEC of the last episode of each period.
+    """
+
+    def compute(episodes):
+        episodes = _episode_dates(episodes, ["DECOM", "DEC"])
+        episodes = episodes.dropna(subset=["DECOM"])
+        episodes = episodes.sort_values(["CHILD", "DECOM"])
+
+        episodes["index"] = pd.RangeIndex(0, len(episodes))
+        episodes["index+1"] = episodes["index"] + 1
+        episodes = episodes.merge(
+            episodes,
+            left_on="index",
+            right_on="index+1",
+            how="left",
+            suffixes=[None, "_prev"],
+        )
+
+        episodes["new_period"] = (episodes["DECOM"] > episodes["DEC_prev"]) | (
+            episodes["CHILD"] != episodes["CHILD_prev"]
+        )
+        episodes["period_id"] = episodes["new_period"].astype(int).cumsum()
+
+        # allocate the DECOM of the first and the DEC of the last episode to each period of care.
+        pocs = pd.DataFrame()
+        pocs[["CHILD", "poc_DECOM"]] = episodes.groupby("period_id")[
+            ["CHILD", "DECOM"]
+        ].first()
+        pocs["poc_DEC"] = episodes.groupby("period_id")["DEC"].nth(-1)
+        return pocs
+
+    return get_derived(
+        dfs, "periods_of_care", table_name, ["CHILD", "DECOM", "DEC"], compute
+    )
+
 
 def decom_before_dob(dfs, p_code, y_gap):
     epi = dfs["Episodes"]
     hea = dfs["Header"]
 
-    hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
-    epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-    epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+    hea["DOB"] = get_date_column(dfs, "Header", "DOB")
+    epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+    epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
     epi.reset_index(inplace=True)
     epi_p2 = epi[epi["PLACE"] == p_code]
@@ -23,9 +104,9 @@ def dec_after_decom(dfs, p_code, y_gap):
     epi = dfs["Episodes"]
     hea = dfs["Header"]
 
-    hea["DOB"] = pd.to_datetime(hea["DOB"], format="%d/%m/%Y", errors="coerce")
-    epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-    epi["DEC"] = pd.to_datetime(epi["DEC"], format="%d/%m/%Y", errors="coerce")
+    hea["DOB"] = get_date_column(dfs, "Header", "DOB")
+    epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+    epi["DEC"] = get_date_column(dfs, "Episodes", "DEC")
 
     epi.reset_index(inplace=True)
     epi_p2 = epi[epi["PLACE"] == p_code]
@@ -46,20 +127,14 @@ def field_different_from_previous(dfs, field):
         epi = dfs["Episodes"]
         epi_last = dfs["Episodes_last"]
 
-        epi["DECOM"] = pd.to_datetime(epi["DECOM"], format="%d/%m/%Y", errors="coerce")
-        epi_last["DECOM"] = pd.to_datetime(
-            epi_last["DECOM"], format="%d/%m/%Y", errors="coerce"
-        )
-        epi_last["DEC"] = pd.to_datetime(
-            epi_last["DEC"], format="%d/%m/%Y", errors="coerce"
-        )
-
-        epi.reset_index(inplace=True)
+        first_ep_inds = first_episode_per_child(dfs, "Episodes")
+        last_ep_inds = last_episode_per_child(dfs, "Episodes_last")
 
-        first_ep_inds = epi.groupby(["CHILD"])["DECOM"].idxmin(skipna=True)
-        min_decom = epi.loc[first_ep_inds, :]
+        epi["DECOM"] = get_date_column(dfs, "Episodes", "DECOM")
+        epi_last["DECOM"] = get_date_column(dfs, "Episodes_last", "DECOM")
+        epi_last["DEC"] = get_date_column(dfs, "Episodes_last", "DEC")
 
-        last_ep_inds = epi_last.groupby(["CHILD"])["DECOM"].idxmax(skipna=True)
+        min_decom = epi.loc[first_ep_inds, :].reset_index()
         max_last_decom = epi_last.loc[last_ep_inds, :]
 
         merged_co = min_decom.merge(
@@ -1,8 +1,18 @@
+import hashlib
 import importlib
-from typing import Iterable
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Optional
 
 from lac_validator.rule_engine import RuleDefinition, YearConfig
 
+logger = logging.getLogger(__name__)
+
+MANIFEST_DIR = Path(__file__).parent / "manifests"
+# bump when the layout of the manifest files changes.
+MANIFEST_VERSION = 1
+
 
 def extract_validator_functions(
     file_paths: Iterable, marker: str = "rule"
@@ -33,6 +43,21 @@ def extract_validator_functions(
     return validator_funcs
 
 
+def load_rule(module_path: str, code: str) -> RuleDefinition:
+    """
+    :param str module_path: import path of the rule file, e.g. lac_validator.rules.lac2022_23.rule_101
+    :param str code: code of the rule defined in that file.
+
+    :return: definition of the rule, imported from its file.
+    :rtype: RuleDefinition
+    """
+    rule_content = importlib.import_module(module_path)
+    for _, element in vars(rule_content).items():
+        if hasattr(element, "rule") and element.rule.code == code:
+            return element.rule
+    raise ValueError(f"Rule with code {code} not found in {module_path}")
+
+
 def update_validator_functions(
     prev_validator_funcs, this_year_config: YearConfig
 ) -> dict:
@@ -51,6 +76,138 @@ def update_validator_functions(
     return updated_validator_funcs
 
 
+class LazyRuleFunction:
+    """
+    Stands in for the function of a rule read from a manifest. The rule file is only imported
+    the first time the rule is run.
+
+    :param str module_path: import path of the rule file, e.g. lac_validator.rules.lac2022_23.rule_101
+    :param str code: code of the rule defined in that file.
+    """
+
+    def __init__(self, module_path: str, code: str):
+        # matches the module of the rule function, so the rule can be found again from its function.
+        self.__module__ = module_path
+        self.code = code
+        self._func = None
+
+    def __call__(self, *args, **kwargs):
+        if self._func is None:
+            self._func = load_rule(self.__module__, self.code).func
+        return self._func(*args, **kwargs)
+
+    def __getstate__(self):
+        # the imported function can't be pickled, so it is imported again after unpickling.
+        return {"__module__": self.__module__, "code": self.code, "_func": None}
+
+    def __repr__(self):
+        return f"LazyRuleFunction({self.__module__!r}, {self.code!r})"
+
+
+def build_manifest(ruleset: str) -> dict[str, Any]:
+    """
+    Imports every rule of a ruleset and describes them, so that the ruleset can later be listed
+    without importing any rule code.
+
+    :param str ruleset: name of the ruleset, e.g. lac2023_24.
+    :return: manifest of the ruleset, with the rules in registry order.
+    :rtype: dict
+    """
+    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
+    registry = getattr(module, "registry")
+    rules = [
+        {
+            "code": rule.code,
+            "message": rule.message,
+            "affected_fields": rule.affected_fields,
+            "tables": rule.tables,
+            "optional_tables": rule.optional_tables,
+            "whole_dataset": rule.whole_dataset,
+            "module": rule.func.__module__,
+        }
+        for rule in registry.values()
+    ]
+    return {
+        "ruleset": ruleset,
+        "version": MANIFEST_VERSION,
+        "checksum": _checksum(rules),
+        "rules": rules,
+    }
+
+
+def _checksum(rules: list[dict[str, Any]]) -> str:
+    """
+    sha256 of the rules of a manifest, so that a manifest that has been edited by hand can be recognised.
+    """
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def write_manifest(ruleset: str, manifest_dir: Path = MANIFEST_DIR) -> Path:
+    """
+    Builds the manifest of a ruleset and saves it as <ruleset>.json in manifest_dir.
+
+    :param str ruleset: name of the ruleset, e.g. lac2023_24.
+    :param Path manifest_dir: folder the manifest is saved to.
+    :return: path of the saved manifest.
+    """
+    manifest = build_manifest(ruleset)
+    manifest_path = Path(manifest_dir) / f"{ruleset}.json"
+    with open(manifest_path, "wt", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest_path
+
+
+def load_manifest(
+    ruleset: str, manifest_dir: Path = MANIFEST_DIR
+) -> dict[str, RuleDefinition]:
+    """
+    Reads the registry of a ruleset from its manifest, without importing any rule files.
+    The functions of the rules are imported when they are first run.
+
+    :param str ruleset: name of the ruleset, e.g. lac2023_24.
+    :param Path manifest_dir: folder the manifest is read from.
+    :return: rules of the ruleset, keyed by rule code.
+    :rtype: dict
+    """
+    with open(Path(manifest_dir) / f"{ruleset}.json", "rt", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest["version"] != MANIFEST_VERSION:
+        raise ValueError(
+            f"Manifest of {ruleset} has version {manifest['version']}, expected {MANIFEST_VERSION}"
+        )
+    if manifest["checksum"] != _checksum(manifest["rules"]):
+        raise ValueError(f"Manifest of {ruleset} doesn't match its checksum")
+    return {
+        rule["code"]: RuleDefinition(
+            code=rule["code"],
+            func=LazyRuleFunction(rule["module"], rule["code"]),
+            message=rule["message"],
+            affected_fields=rule["affected_fields"],
+            tables=rule["tables"],
+            optional_tables=rule.get("optional_tables"),
+            whole_dataset=rule.get("whole_dataset", False),
+        )
+        for rule in manifest["rules"]
+    }
+
+
+def get_ruleset(ruleset: str) -> dict[str, RuleDefinition]:
+    """
+    Gets the registry of a ruleset, from its manifest if there is one.
+
+    :param str ruleset: name of the ruleset, e.g. lac2023_24.
+    :return: rules of the ruleset, keyed by rule code.
+    :rtype: dict
+    """
+    try:
+        return load_manifest(ruleset)
+    except (OSError, ValueError, KeyError):
+        logger.warning(f"No usable manifest for {ruleset}, importing its rules instead")
+        module = importlib.import_module(f"lac_validator.rules.{ruleset}")
+        return getattr(module, "registry")
+
+
 def get_year_ruleset(collection_year: str) -> dict[str, RuleDefinition]:
     """
     Gets the registry of validation rules for the year specified in the metadata.
@@ -58,7 +215,4 @@ def get_year_ruleset(collection_year: str) -> dict[str, RuleDefinition]:
     # for example, convert "2023" to "lac2022_23"
     ruleset = f"lac{int(collection_year)-1}_{collection_year[2:4]}"
 
-    module = importlib.import_module(f"lac_validator.rules.{ruleset}")
-    registry = getattr(module, "registry")
-
-    return registry
+    return get_ruleset(ruleset)
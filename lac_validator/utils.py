@@ -2,6 +2,7 @@ from io import TextIOWrapper
 
 import pandas as pd
 
+from lac_validator.datastore import get_derived
 from lac_validator.types import UploadedFile, UploadError
 
 
@@ -72,6 +73,28 @@ def add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER(
     return episodes
 
 
+def continuously_looked_after(dfs):
+    """
+    Takes: the `dfs` dict, which must contain 'Episodes' and 'metadata'
+    Returns: a True/False Series with the index of the 'Episodes' table, as the 'CONTINUOUSLY_LOOKED_AFTER'
+             column of add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER.
+
+    This is computed once per validation run and shared by every rule that asks for it.
+    """
+    metadata = dfs["metadata"]
+    columns = ["CHILD", "DECOM", "DEC", "RNE", "REC", "LS"]
+
+    def compute(episodes):
+        eps_with_CLA = add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER(
+            episodes[columns].copy(),
+            metadata["collection_start"],
+            metadata["collection_end"],
+        )
+        return eps_with_CLA["CONTINUOUSLY_LOOKED_AFTER"]
+
+    return get_derived(dfs, "continuously_looked_after", "Episodes", columns, compute)
+
+
 def add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER(dfs, required_tables=None):
     """
     Takes: the `dfs` dict and `required_tables` (table name or list of table names)
@@ -90,9 +113,8 @@ def add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER(dfs, required_tables=None):
             + f"CONTINUOUSLY_LOOKED_AFTER -- only received: {', '.join(str(i) for i in dfs.keys())}"
         )
 
-    eps_with_CLA = add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER(
-        eps, metadata["collection_start"], metadata["collection_end"]
-    )
+    eps[CLA_col] = continuously_looked_after(dfs)
+    eps_with_CLA = eps
     known_CLA = eps_with_CLA.drop_duplicates("CHILD")
 
     if isinstance(required_tables, str):
@@ -1,13 +1,35 @@
+import pickle
+import subprocess
+import sys
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from lac_validator.datastore import (
+    DatastoreView,
+    PostcodeIndex,
     _add_postcode_derived_fields,
+    _laua_locations,
+    changed_children,
+    copy_datastore,
     create_datastore,
+    encode_strings,
+    fingerprint_datastore,
+    get_date_column,
+    get_derived,
+    get_la_df,
+    get_string_column,
+    isin_codes,
+    lookup_postcodes,
     merge_postcodes,
     postcodes,
+    rebuild_datastore,
+    shard_datastore,
+    subset_datastore,
+    warm_up,
 )
+from lac_validator.postcode_store import PostcodeStore, write_postcode_store
 
 
 def test_postcode_key():
@@ -23,6 +45,20 @@ def test_postcode_key():
     assert postcodes.dataframe.shape[0] > 100
 
 
+def test_reference_data_loaded_on_first_use():
+    # a fresh interpreter, as this one has already loaded the reference data
+    check = (
+        "import sys, lac_validator.__main__, lac_validator.datastore as ds;"
+        "assert ds._la_df is None and ds._postcodes is None;"
+        "assert 'qlacref_postcodes' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True)
+
+    warm_up()
+    assert get_la_df() is get_la_df()
+    assert "LTLA21CD" in get_la_df().columns
+
+
 def test_create_datastore(dummy_empty_input):
     metadata = {"collectionYear": "2019/20", "localAuthority": "test_LA"}
     ds = create_datastore(dummy_empty_input, metadata)
@@ -50,6 +86,27 @@ def test_add_postcodes_columns():
     ]
 
 
+def test_laua_locations():
+    # Hartlepool is its own upper tier LA; Scottish, Welsh and NI lauas get their country
+    pl_la, pl_location = _laua_locations(
+        np.array(["E06000001", "E06000002", "S12000027", "w06000001", "N09000001"]),
+        "E06000001",
+    )
+    assert pl_la.tolist() == ["E06000001", "E06000002", "SCO", "WAL", "NIR"]
+    assert pl_location.tolist() == ["IN", "OUT", "OUT", "OUT", "OUT"]
+
+    df = pd.DataFrame(
+        {
+            "HOME_POST": ["ZE1 0AA", None, "ZE1 0AA"],
+            "PL_POST": ["ZE3 9JX", "ZE3 9JX", "X"],
+        }
+    )
+    df_new = _add_postcode_derived_fields(df, "")
+    assert df_new["PL_LA"].tolist()[:2] == ["SCO", "SCO"]
+    assert df_new["PL_LOCATION"].tolist() == ["OUT", "OUT", pd.NA]
+    assert np.isnan(df_new["PL_DISTANCE"][1:]).all()
+
+
 @pytest.mark.parametrize(
     "postcode, expected",
     [
@@ -66,3 +123,279 @@ def test_merge_postcodes(postcode, expected):
         assert np.isnan(df.laua[0])
     else:
         assert df.laua[0] == expected
+
+
+def test_lookup_postcodes():
+    details = lookup_postcodes(
+        pd.Series(["ze1 0aa", None, "invalid", "ZE10AA"], index=[3, 1, 4, 1])
+    )
+
+    assert details.index.tolist() == [3, 1, 4, 1]
+    assert details.columns.tolist() == PostcodeIndex.columns
+    assert details["laua"].tolist()[0] == "S12000027"
+    assert details["pcd_abbr"].tolist()[3] == "ZE10AA"
+    assert details.iloc[1:3].isna().all(axis=None)
+
+
+def test_postcode_index_loads_letters():
+    class FakePostcodes:
+        letters = []
+        dataframe = pd.DataFrame(columns=PostcodeIndex.columns)
+
+        def load_postcodes(self, letters):
+            self.letters.append(sorted(letters))
+            if "B" in letters:
+                self.dataframe = pd.DataFrame(
+                    {
+                        "pcd": ["B2 1AA", "B1 1AA"],
+                        "oseast1m": [2.0, 1.0],
+                        "osnrth1m": [4.0, 3.0],
+                        "laua": ["E2", "E1"],
+                        "pcd_abbr": ["B21AA", "B11AA"],
+                    }
+                )
+
+    index = PostcodeIndex(FakePostcodes())
+    details = index.lookup(pd.Series(["b1 1aa", "A1 1AA", "B21AA", "B3 1AA"]))
+
+    assert index._postcodes.letters == [["A", "B"]]
+    assert details["laua"].tolist()[::2] == ["E1", "E2"]
+    assert details["oseast1m"].tolist()[::2] == [1.0, 2.0]
+    assert details[["laua", "oseast1m"]].iloc[[1, 3]].isna().all(axis=None)
+
+
+def test_postcode_store(tmp_path):
+    postcodes = pd.DataFrame(
+        {
+            "pcd": ["B2 1AA", "B1 1AA", "b1 1aa", "A1 1AA"],
+            "oseast1m": [2.0, 1.0, 5.0, 6.0],
+            "osnrth1m": [4.0, 3.0, 5.0, 7.0],
+            "laua": ["E2", "E1", "E3", np.nan],
+        }
+    )
+    write_postcode_store(postcodes, tmp_path)
+    store = PostcodeStore(tmp_path)
+    # keyed without spaces, keeping the first of any duplicates
+    assert len(store) == 3
+    assert store.keys.tolist() == [b"A11AA", b"B11AA", b"B21AA"]
+
+    index = PostcodeIndex(None, store=tmp_path)
+    queries = pd.Series(["b1 1aa", "A1 1AA", "B21AA", "B3 1AA"], index=[4, 3, 2, 1])
+    details = index.lookup(queries)
+    assert details.index.tolist() == [4, 3, 2, 1]
+    assert details["pcd"].tolist()[:3] == ["B1 1AA", "A1 1AA", "B2 1AA"]
+    assert details["oseast1m"].tolist()[:3] == [1.0, 6.0, 2.0]
+    assert details["laua"].tolist()[::2] == ["E1", "E2"]
+    assert details["laua"].iloc[[1, 3]].isna().all()
+    assert details["osnrth1m"].iloc[[3]].isna().all()
+
+    (tmp_path / "store.json").write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        PostcodeStore(tmp_path)
+
+
+def test_create_datastore_parses_dates():
+    missing = pd.DataFrame(
+        {
+            "CHILD": ["1", "2", "3"],
+            "MIS_START": ["01/04/2020", "31/02/2020", pd.NA],
+            "MIS_END": ["04/06/2020", pd.NA, "01/01/2021"],
+        }
+    )
+    metadata = {"collectionYear": "2020/21", "localAuthority": "test_LA"}
+    ds = create_datastore({"Missing_last": missing}, metadata)
+
+    parsed = ds["metadata"]["parsed_dates"]["Missing_last"].dates
+    assert parsed.columns.tolist() == ["MIS_START", "MIS_END"]
+    assert parsed["MIS_START"].tolist()[0] == pd.Timestamp("2020-04-01")
+    assert parsed["MIS_START"].isna().tolist() == [False, True, True]
+    # the raw table keeps its strings
+    assert ds["Missing_last"]["MIS_START"].tolist()[0] == "01/04/2020"
+
+
+def test_get_date_column():
+    header = pd.DataFrame({"CHILD": ["1", "2"], "DOB": ["01/04/2020", "bad date"]})
+    expected = pd.to_datetime(header["DOB"], format="%d/%m/%Y", errors="coerce")
+
+    # without a datastore, the column is parsed on request
+    pd.testing.assert_series_equal(
+        get_date_column({"Header": header}, "Header", "DOB"), expected
+    )
+
+    metadata = {"collectionYear": "2020/21", "localAuthority": "test_LA"}
+    ds = create_datastore({"Header": header}, metadata)
+    dob = get_date_column(ds, "Header", "DOB")
+    pd.testing.assert_series_equal(dob, expected)
+
+    # rules get a copy, so the shared parsed dates can't be changed
+    dob[:] = pd.NaT
+    assert get_date_column(ds, "Header", "DOB").notna().tolist() == [True, False]
+
+    # shallow copies, as given to each rule, still use the parsed dates
+    ds_copy = copy_datastore(ds)
+    assert get_date_column(ds_copy, "Header", "DOB").notna().tolist() == [True, False]
+
+    # a column that has been replaced since the datastore was created is parsed again
+    ds_copy["Header"]["DOB"] = ["bad date", "01/04/2020"]
+    assert get_date_column(ds_copy, "Header", "DOB").notna().tolist() == [False, True]
+    ds_copy["Header"] = header.iloc[::-1].reset_index(drop=True)
+    assert get_date_column(ds_copy, "Header", "DOB").notna().tolist() == [False, True]
+
+
+def test_datastore_view():
+    header = pd.DataFrame({"CHILD": ["1", "2"], "SEX": ["1", "2"]})
+    episodes = pd.DataFrame({"CHILD": ["1", "2"], "RNE": ["P", "S"]})
+    ds = {"Header": header, "Episodes": episodes, "metadata": {"a": 1}}
+    view = DatastoreView(ds)
+
+    assert "Header" in view and "Missing" not in view
+    assert list(view) == ["Header", "Episodes", "metadata"]
+    assert view.accessed == []
+
+    # tables are copied when read, so changing them doesn't change the datastore
+    view["Header"]["SEX"] = "3"
+    view["Header"].reset_index(inplace=True)
+    view["metadata"]["a"] = 2
+    assert view.accessed == ["Header", "metadata"]
+    assert header.columns.tolist() == ["CHILD", "SEX"]
+    assert header["SEX"].tolist() == ["1", "2"]
+    assert ds["metadata"] == {"a": 1}
+
+    # nor does setting or deleting tables
+    view["Episodes_last"] = episodes
+    del view["Episodes"]
+    assert list(view) == ["Header", "metadata", "Episodes_last"]
+    assert len(view) == 3
+    assert list(ds) == ["Header", "Episodes", "metadata"]
+    with pytest.raises(KeyError):
+        view["Episodes"]
+
+
+def test_fingerprint_datastore():
+    header = pd.DataFrame({"CHILD": ["1", "2"], "SEX": ["1", "2"]})
+    provider_info = pd.DataFrame({"URN": ["1"]})
+    ds = {"Header": header, "metadata": {"provider_info": provider_info}}
+    before = fingerprint_datastore(ds)
+    assert set(before) == {"Header", "metadata/provider_info"}
+
+    # writing through a shallow copy changes the shared data
+    DatastoreView(ds)["Header"].loc[0, "SEX"] = "2"
+    after = fingerprint_datastore(ds, ["Header"])
+    assert after["Header"] != before["Header"]
+
+
+def test_changed_children():
+    header = pd.DataFrame(
+        {
+            "CHILD": ["1", "2", "1", "3"],
+            "DOB": ["01/04/2020", "01/04/2020", "03/04/2020", "02/04/2020"],
+        }
+    )
+    old = create_datastore(
+        {"Header": header}, {"collectionYear": "2021", "localAuthority": "E1"}
+    )
+
+    # child 2 has moved, but its rows are the same
+    new = {"Header": header.iloc[[1, 0, 2, 3]].reset_index(drop=True)}
+    assert changed_children(old, new).tolist() == []
+    new = {"Header": header.iloc[[0, 2]]}
+    assert changed_children(old, new).tolist() == ["2", "3"]
+    new = {"Header": header.replace("02/04/2020", "01/04/2020")}
+    assert changed_children(old, new).tolist() == ["3"]
+    # the order of a child's rows counts
+    new = {"Header": header.iloc[[2, 1, 0, 3]]}
+    assert changed_children(old, new).tolist() == ["1"]
+    # tables that can't be compared
+    assert changed_children(old, {"Header": header, "UASC": header}) is None
+    assert changed_children(old, {"Header": header.assign(X=1)}) is None
+
+    subset = subset_datastore(old, pd.Index(["1"]))
+    assert subset["Header"].index.tolist() == [0, 2]
+    dob = get_date_column(subset, "Header", "DOB")
+    assert dob.index.tolist() == [0, 2]
+    assert subset["metadata"]["collection_end"] == old["metadata"]["collection_end"]
+
+
+def test_shard_datastore():
+    header = pd.DataFrame({"CHILD": ["1", "2", "1", "3", None]})
+    data_store = create_datastore(
+        {"Header": header}, {"collectionYear": "2021", "localAuthority": "E1"}
+    )
+
+    shards = list(shard_datastore(data_store, 3))
+    assert len(shards) == 3
+    # each row is in exactly one shard, with all the rows of its child
+    indexes = [shard["Header"].index.tolist() for shard in shards]
+    assert sorted(sum(indexes, [])) == [0, 1, 2, 3, 4]
+    assert any(set(index) >= {0, 2} for index in indexes)
+    (shard,) = shard_datastore(data_store, 1)
+    assert shard["Header"].index.tolist() == [0, 1, 2, 3, 4]
+
+    # a shard sent to a worker process is unpickled, and then rebuilt
+    rebuilt = rebuild_datastore(pickle.loads(pickle.dumps(shard)))
+    rebuilt["Header"]["CHILD"].astype(str)
+    assert rebuilt["Header"]["CHILD"].isna().tolist() == header["CHILD"].isna().tolist()
+    pd.testing.assert_frame_equal(rebuilt["Header"], shard["Header"])
+
+
+def test_get_derived():
+    header = pd.DataFrame({"CHILD": ["1", "2"], "SEX": ["1", "2"]})
+    calls = []
+
+    def compute(df):
+        calls.append(df)
+        return df["SEX"].astype(int)
+
+    # without a datastore, the value is computed on request
+    assert get_derived(
+        {"Header": header}, "sex", "Header", ["SEX"], compute
+    ).tolist() == [1, 2]
+
+    metadata = {"collectionYear": "2020/21", "localAuthority": "test_LA"}
+    ds = create_datastore({"Header": header}, metadata)
+    calls.clear()
+
+    # views of the datastore share a value, computed once
+    for _ in range(2):
+        sex = get_derived(DatastoreView(ds), "sex", "Header", ["SEX"], compute)
+        assert sex.tolist() == [1, 2]
+        sex[:] = 0
+    assert len(calls) == 1
+
+    # a table whose columns have been replaced gets its own value
+    view = DatastoreView(ds)
+    view["Header"]["SEX"] = ["2", "2"]
+    assert get_derived(view, "sex", "Header", ["SEX"], compute).tolist() == [2, 2]
+    assert len(calls) == 2
+
+
+def test_isin_codes():
+    place = pd.Series(["U1", "XX", np.nan, "U1"], index=[3, 2, 1, 0])
+    encoded = encode_strings(place)
+
+    # every value is kept, so comparisons are unchanged
+    assert (encoded == "U1").tolist() == (place == "U1").tolist()
+    for codes in [["U1", "U2"], ["XX"], [np.nan], []]:
+        pd.testing.assert_series_equal(isin_codes(encoded, codes), place.isin(codes))
+    # plain columns are tested with isin
+    pd.testing.assert_series_equal(isin_codes(place, ["XX"]), place.isin(["XX"]))
+
+
+def test_encode_strings():
+    values = pd.Series([1, "1", 2.0, np.nan, pd.NA, "x"], index=[5, 4, 3, 2, 1, 0])
+    encoded = encode_strings(values)
+
+    # the same as astype(str), except for blanks
+    assert encoded.index.tolist() == [5, 4, 3, 2, 1, 0]
+    assert encoded.cat.categories.tolist() == ["1", "2.0", "x"]
+    assert encoded.isna().tolist() == [False, False, False, True, True, False]
+    assert encoded[encoded.notna()].astype(str).tolist() == ["1", "1", "2.0", "x"]
+    assert encode_strings(pd.Series([np.nan, None])).isna().all()
+    assert len(encode_strings(pd.Series([], dtype=object))) == 0
+
+    header = pd.DataFrame({"CHILD": ["1", "2"], "SEX": ["1", np.nan]})
+    ds = create_datastore(
+        {"Header": header}, {"collectionYear": "2021", "localAuthority": "E1"}
+    )
+    sex = get_string_column(DatastoreView(ds), "Header", "SEX")
+    assert sex.equals(encode_strings(header["SEX"]))
@@ -1,10 +1,17 @@
 import os
+from io import BytesIO
 
+import pandas as pd
 import pytest
+from numpy import nan
 
+import lac_validator.ingress
 from lac_validator.ingress import (
+    csv_table_name,
+    read_csv_table,
     read_csvs_from_text,
     read_from_text,
+    read_provider_info,
     read_xml_from_text,
     construct_provider_info_table,
     combined_ch_scp_check,
@@ -65,7 +72,9 @@ class Test_read_from_text:
 
         read_from_text(files)
         combined_scpch_check.assert_called_once_with(ch)
-        scpch_provider_info_table.assert_called_once_with(scpch=ch)
+        scpch_provider_info_table.assert_called_once_with(
+            scpch=ch, sheets=combined_scpch_check.return_value
+        )
 
         # Test ingress for one SCP upload to check if it's the combined form
         files: list[UploadedFile] = [
@@ -191,11 +200,16 @@ def test_combined_ch_scp_check(dummy_chscp):
     with pytest.raises(UploadError):
         combined_ch_scp_check(ch["file_content"])
 
+    # the sheets of combined lists are returned, so that they aren't read again
     combined_outcome = combined_ch_scp_check(combined["file_content"])
-    assert combined_outcome == True
+    assert len(combined_outcome) == 1
+    pd.testing.assert_frame_equal(
+        scpch_provider_info_table(combined, sheets=combined_outcome),
+        scpch_provider_info_table(combined),
+    )
 
     combined_assisted_outcome = combined_ch_scp_check(combined_assisted["file_content"])
-    assert combined_assisted_outcome == True
+    assert len(combined_assisted_outcome) == 2
 
 
 def test_scpch_provider_info_table(dummy_chscp):
@@ -230,3 +244,133 @@ def test_scpch_provider_info_table(dummy_chscp):
     combined_assisted_output = scpch_provider_info_table(combined_assisted)
     combined_assisted_output_columns = combined_assisted_output.columns.to_list()
     assert combined_assisted_output_columns == expected_columns
+
+
+def test_read_xml_from_text_columns():
+    xml = (
+        "<?xml version='1.0' encoding='us-ascii'?><EXPSSDA903>"
+        "<CHILD><HEADER><CHILDID>1</CHILDID><SEX>m</SEX><UASC />"
+        "<AREVIEW><REVIEW>01/01/2020</REVIEW></AREVIEW></HEADER>"
+        "<EPISODE><DECOM>01/01/2020</DECOM><PL>r1</PL></EPISODE>"
+        "<EPISODE><DECOM>01/02/2020</DECOM><PL /></EPISODE></CHILD>"
+        "<CHILD><HEADER><CHILDID>2</CHILDID><UASC>1</UASC></HEADER></CHILD>"
+        "</EXPSSDA903>"
+    )
+
+    out = read_xml_from_text(xml)
+
+    assert out["Header"]["CHILD"].tolist() == ["1", "2"]
+    assert out["Header"]["SEX"].tolist()[0] == "M"
+    assert out["Episodes"][["CHILD", "DECOM"]].values.tolist() == [
+        ["1", "01/01/2020"],
+        ["1", "01/02/2020"],
+    ]
+    assert out["Episodes"]["PLACE"].tolist()[0] == "R1"
+    assert pd.isna(out["Episodes"]["PLACE"].tolist()[1])
+    assert out["Reviews"]["CHILD"].tolist() == ["1"]
+    assert out["UASC"]["CHILD"].tolist() == ["2"]
+    assert out["OC3"].empty
+    for name, val in read_xml_from_text(xml.encode()).items():
+        pd.testing.assert_frame_equal(val, out[name])
+
+
+def test_read_csv_table(dummy_input_files):
+    csv_path_dir = os.path.join(os.path.dirname(__file__), "fake_data")
+    contents = [
+        b'A,B,C\nna,"",x\nnull, 1 ,N/A\n,nan,"a,b"\n1.0,-1,#N/A\n',
+        b"A,B\n",
+    ]
+    for file_name in dummy_input_files:
+        with open(os.path.join(csv_path_dir, file_name), "rb") as f:
+            contents.append(f.read())
+
+    for content in contents:
+        pd.testing.assert_frame_equal(
+            read_csv_table(BytesIO(content)),
+            read_csv_table(BytesIO(content), use_converters=True),
+        )
+
+    df = read_csv_table(BytesIO(contents[0]))
+    assert df.values.tolist()[0] == ["NA", nan, "X"]
+
+
+def test_csv_table_name(mocker):
+    csv_file = BytesIO(b"CHILD,SEX,DOB,DUC\n1,1,01/01/2010,01/01/2020\n")
+    assert csv_table_name(csv_file) == "UASC"
+    assert csv_file.tell() == 0
+
+    read_csv = mocker.patch("lac_validator.ingress.read_csv_table")
+    with pytest.raises(UploadError):
+        read_csvs_from_text(
+            [{"file_content": b"CHILD,X\n1,2\n", "description": "This year"}]
+        )
+    with pytest.raises(UploadError):
+        read_csvs_from_text(
+            [
+                {
+                    "file_content": b"CHILD,SEX,DOB,DUC\n1,2,3,4\n",
+                    "description": "Next year",
+                }
+            ]
+        )
+    read_csv.assert_not_called()
+
+
+def test_read_csvs_from_text_names_every_bad_file():
+    files = [
+        {
+            "name": "uasc.csv",
+            "file_content": b"CHILD,SEX,DOB,DUC\n1,2,3,4\n",
+            "description": "This year",
+        },
+        {
+            "name": "utf16.csv",
+            "file_content": "CHILD,SEX,DOB,DUC\n1,2,3,4\n".encode("utf-16"),
+            "description": "This year",
+        },
+        {
+            "name": "unknown.csv",
+            "file_content": b"CHILD,X\n1,2\n",
+            "description": "This year",
+        },
+    ]
+
+    with pytest.raises(UploadError) as error:
+        read_csvs_from_text(files, max_workers=2)
+
+    lines = str(error.value).split("\n")
+    assert [line.split(":")[0] for line in lines] == ["utf16.csv", "unknown.csv"]
+    assert "Failed to decode" in lines[0]
+
+    assert list(read_csvs_from_text(files[:1])) == ["UASC"]
+
+
+def test_read_provider_info_cache(dummy_chscp, mocker, tmp_path):
+    ch = {"file_content": dummy_chscp[0]}
+    scp = {"file_content": dummy_chscp[1]}
+    mocker.patch.dict("lac_validator.ingress._provider_info_cache", clear=True)
+    build = mocker.spy(lac_validator.ingress, "_build_provider_info")
+
+    provider_info = read_provider_info(ch, scp, cache_dir=tmp_path)
+    provider_info["URN"] = None
+    cached = read_provider_info(ch, scp, cache_dir=tmp_path)
+    assert build.call_count == 1
+    assert cached["URN"].notna().all()
+
+    # a new process finds the table on disk.
+    lac_validator.ingress._provider_info_cache.clear()
+    from_disk = read_provider_info(ch, scp, cache_dir=tmp_path)
+    assert build.call_count == 1
+    pd.testing.assert_frame_equal(from_disk, cached)
+
+    # different lists are built afresh.
+    read_provider_info({"file_content": dummy_chscp[5]}, cache_dir=tmp_path)
+    assert build.call_count == 2
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+    # as are the same lists, with other reference data.
+    mocker.patch(
+        "lac_validator.ingress._reference_data_versions", return_value="postcodes==2"
+    )
+    read_provider_info(ch, scp, cache_dir=tmp_path)
+    assert build.call_count == 3
@@ -0,0 +1,302 @@
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lac_validator import lac_validator
+from lac_validator.config import column_names
+from lac_validator.lac_validator import (
+    METADATA_TABLES,
+    ErrorLocations,
+    LacValidator,
+    create_issue_df,
+    missing_tables,
+)
+from lac_validator.rule_engine import RuleDefinition
+from lac_validator.rules.lac2022_23 import registry
+from lac_validator.rules.ruleset_utils import get_ruleset
+
+selected_rules = ["101", "103", "164", "365", "502", "577", "1001"]
+
+
+def _validate(dummy_uploads, **kwargs):
+    return LacValidator(
+        metadata={"collectionYear": "2023", "localAuthority": "E09000027"},
+        files=dummy_uploads,
+        registry=registry,
+        selected_rules=selected_rules,
+        **kwargs,
+    )
+
+
+def _upload(uploads, name):
+    return next(u for u in uploads if u["name"] == name)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_executor_matches_serial(dummy_uploads, executor):
+    serial = _validate(dummy_uploads)
+    parallel = _validate(dummy_uploads, executor=executor, max_workers=2)
+
+    assert parallel.dones == serial.dones
+    assert parallel.skips == serial.skips
+    assert parallel.fails == serial.fails
+    for table_name, df in serial.ds_results.items():
+        if table_name != "metadata":
+            pd.testing.assert_frame_equal(parallel.ds_results[table_name], df)
+
+
+def test_spawned_process_executor_matches_serial(dummy_uploads, monkeypatch):
+    # workers that aren't forked are sent a pickled copy of the datastore, which every rule must see unchanged.
+    spawn = partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+    )
+    monkeypatch.setattr(lac_validator, "ProcessPoolExecutor", spawn)
+    metadata = {"collectionYear": "2023", "localAuthority": "E09000027"}
+    serial = LacValidator(metadata=metadata, files=dummy_uploads, registry=registry)
+    parallel = LacValidator(
+        metadata=metadata,
+        files=dummy_uploads,
+        registry=registry,
+        executor="process",
+        max_workers=2,
+    )
+
+    assert parallel.dones == serial.dones
+    assert parallel.fails == serial.fails
+    for table_name, df in serial.ds_results.items():
+        if table_name != "metadata":
+            pd.testing.assert_frame_equal(parallel.ds_results[table_name], df)
+
+
+def test_unknown_executor(dummy_uploads):
+    with pytest.raises(ValueError):
+        _validate(dummy_uploads, executor="gpu")
+
+
+def test_check_mutations(dummy_uploads):
+    def mutating_rule(dfs):
+        episodes = dfs["Episodes"]
+        episodes.loc[episodes.index[0], "RNE"] = "X"
+        return {"Episodes": []}
+
+    def copying_rule(dfs):
+        episodes = dfs["Episodes"]
+        episodes["RNE"] = "X"
+        return {"Episodes": []}
+
+    validator = LacValidator(
+        metadata={"collectionYear": "2023", "localAuthority": "E09000027"},
+        files=dummy_uploads,
+        registry={
+            "copying": RuleDefinition(code="copying", func=copying_rule),
+            "mutating": RuleDefinition(code="mutating", func=mutating_rule),
+        },
+        check_mutations=True,
+    )
+
+    assert validator.mutations == {"mutating": ["Episodes"]}
+    assert validator.dones == ["copying", "mutating"]
+
+
+def test_missing_tables():
+    data_store = {"Header": pd.DataFrame(), "metadata": {}}
+
+    def rule(**kwargs):
+        return RuleDefinition(code="1", func=lambda dfs: {}, **kwargs)
+
+    assert missing_tables(rule(), data_store) == []
+    assert missing_tables(rule(tables=None), data_store) == []
+    assert missing_tables(rule(tables=["Header"]), data_store) == []
+    assert missing_tables(
+        rule(tables=["Header", "Header_last", "Provider Info"]), data_store
+    ) == ["Header_last", "Provider Info"]
+    assert (
+        missing_tables(
+            rule(tables=["Header", "Header_last"], optional_tables=["Header_last"]),
+            data_store,
+        )
+        == []
+    )
+
+
+@pytest.mark.parametrize("ruleset", ["lac2022_23", "lac2023_24", "lac2024_25"])
+def test_rule_tables_exist(ruleset):
+    known_tables = set(column_names) | {f"{t}_last" for t in column_names}
+    known_tables |= set(METADATA_TABLES)
+    for rule in get_ruleset(ruleset).values():
+        assert set(rule.tables) <= known_tables, rule.code
+
+
+def test_skip_missing_tables(dummy_uploads):
+    uploads = [
+        upload
+        for upload in dummy_uploads
+        if upload["name"] in ("ad1.csv", "placed_for_adoption.csv")
+        and upload["description"] == "This year"
+    ]
+    validator = _validate(uploads)
+
+    assert validator.skip_reasons == {
+        "101": ["Header"],
+        "103": ["Header"],
+        "164": ["Episodes"],
+        "365": ["Episodes"],
+        "502": ["Episodes", "Episodes_last"],
+        "577": ["Episodes", "Missing"],
+        "1001": ["Episodes", "OC3", "Header", "Episodes_last"],
+    }
+    assert sorted(validator.skips) == sorted(selected_rules)
+    assert validator.dones == []
+
+
+def test_rule_profile(dummy_uploads):
+    def failing_rule(dfs):
+        return dfs["Header"]["NOT_A_COLUMN"]
+
+    registry = {
+        "101": get_ruleset("lac2022_23")["101"],
+        "failing": RuleDefinition(code="failing", func=failing_rule),
+        "missing": RuleDefinition(code="missing", func=failing_rule, tables=["OC2"]),
+    }
+    uploads = [u for u in dummy_uploads if u["name"] != "oc2.csv"]
+    validator = LacValidator(
+        metadata={"collectionYear": "2023", "localAuthority": "E09000027"},
+        files=uploads,
+        registry=registry,
+        profile_memory=True,
+    )
+
+    profile = validator.rule_profile
+    assert profile.columns.tolist() == [
+        "Code",
+        "Status",
+        "WallTime",
+        "CPUTime",
+        "PeakMemory",
+        "RowsTouched",
+    ]
+    assert profile["Code"].tolist() == ["101", "failing", "missing"]
+    assert profile["Status"].tolist() == ["done", "failed", "skipped"]
+    ran = profile.iloc[:2]
+    assert (ran[["WallTime", "CPUTime", "PeakMemory"]] >= 0).all(axis=None)
+    assert ran["RowsTouched"].tolist() == [len(validator.dfs["Header"])] * 2
+    # rules skipped for missing tables aren't run
+    assert profile.iloc[2][["WallTime", "PeakMemory"]].isna().all()
+
+    # memory is only traced if asked for
+    validator = _validate(dummy_uploads, executor="process", max_workers=1)
+    assert validator.rule_profile["PeakMemory"].isna().all()
+    assert (validator.rule_profile["WallTime"] > 0).any()
+
+
+def test_revalidate_changed_children(dummy_uploads):
+    previous = _validate(dummy_uploads)
+
+    episodes = pd.read_csv(
+        io.BytesIO(_upload(dummy_uploads, "episodes.csv")["file_content"]), dtype=str
+    )
+    child = episodes["CHILD"].iloc[0]
+    episodes.loc[episodes["CHILD"] == child, "PLACE"] = "XX"
+    uploads = [
+        dict(u, file_content=episodes.to_csv(index=False).encode())
+        if u["name"] == "episodes.csv" and u["description"] == "This year"
+        else u
+        for u in dummy_uploads
+    ]
+
+    full = _validate(uploads)
+    revalidated = _validate(uploads, previous=previous)
+    assert full.changed_children is None
+    assert revalidated.changed_children.tolist() == [child]
+    assert revalidated.dones == full.dones
+    for table_name, df in full.ds_results.items():
+        if table_name != "metadata":
+            pd.testing.assert_frame_equal(revalidated.ds_results[table_name], df)
+
+    # nothing has changed
+    unchanged = _validate(uploads, previous=revalidated)
+    assert unchanged.changed_children.tolist() == []
+    pd.testing.assert_frame_equal(unchanged.errors.to_frame(), full.errors.to_frame())
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_shards_match_unsharded(dummy_uploads, executor):
+    unsharded = _validate(dummy_uploads)
+    sharded = _validate(dummy_uploads, shards=3, executor=executor, max_workers=2)
+
+    assert sharded.dones == unsharded.dones
+    assert sharded.skips == unsharded.skips
+    assert sharded.fails == unsharded.fails
+    for table_name, df in unsharded.ds_results.items():
+        if table_name != "metadata":
+            pd.testing.assert_frame_equal(sharded.ds_results[table_name], df)
+    assert (
+        sharded.rule_profile["Code"].tolist() == unsharded.rule_profile["Code"].tolist()
+    )
+
+    with pytest.raises(ValueError):
+        _validate(dummy_uploads, shards=0)
+
+
+def test_error_locations():
+    header = pd.DataFrame({"CHILD": ["a", "b", "c"]}, index=[10, 11, 12])
+    data_store = {"Header": header, "Episodes": pd.DataFrame(), "metadata": {}}
+
+    errors = ErrorLocations(data_store)
+    errors.add("Header", "101", [12, 10])
+    errors.add("Header", "103", [])
+    with pytest.raises(KeyError):
+        errors.add("Header", "104", [13])
+
+    expected = header.copy()
+    expected.loc[[12, 10], "ERR_101"] = True
+    expected.loc[[], "ERR_103"] = True
+    ds_results = errors.to_ds_results()
+    pd.testing.assert_frame_equal(ds_results["Header"], expected)
+    assert ds_results["Episodes"].columns.tolist() == []
+
+    pd.testing.assert_frame_equal(
+        errors.to_frame(),
+        pd.DataFrame(
+            {"Table": ["Header", "Header"], "RowID": [12, 10], "Code": ["101", "101"]}
+        ),
+    )
+
+
+def test_create_issue_df():
+    report = pd.DataFrame(
+        {
+            "Table": ["Header", "Header", "Episodes"],
+            "RowID": [0, 1, 0],
+            "CHILD": ["a", "b", "a"],
+            "ERR_101": [np.nan, True, np.nan],
+            "ERR_103": [True, np.nan, True],
+        }
+    )
+    error_report = pd.DataFrame(
+        {
+            "Code": ["101", "103"],
+            "Description": ["First", "Second"],
+            "Fields": [["SEX"], ["DOB", "DECOM"]],
+            "Count": [1, 2],
+        }
+    )
+
+    issue_df = create_issue_df(report, error_report)
+    assert issue_df.to_dict("list") == {
+        "child_id": ["b", "a", "a", "a", "a"],
+        "tables_affected": ["Header", "Header", "Header", "Episodes", "Episodes"],
+        "columns_affected": ["SEX", "DOB", "DECOM", "DOB", "DECOM"],
+        "row_id": [1, 0, 0, 0, 0],
+        "rule_code": ["101", "103", "103", "103", "103"],
+        "rule_description": ["First", "Second", "Second", "Second", "Second"],
+    }
+
+    no_errors = create_issue_df(report[["Table", "RowID", "CHILD"]], error_report)
+    assert no_errors.empty
+    assert no_errors.columns.tolist() == list(issue_df.columns)
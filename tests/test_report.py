@@ -1,10 +1,13 @@
 import json
+from io import BytesIO
 from pathlib import Path
 
 import pandas as pd
 import pytest
+from openpyxl import load_workbook
 
-from lac_validator.report import _create_child_summary
+from lac_validator.report import Report, _create_child_summary
+from lac_validator.rule_engine import RuleDefinition
 
 
 @pytest.fixture(scope="session")
@@ -27,3 +30,83 @@ def test_child_summary(single_test_fixture):
     child_report = pd.DataFrame([single_test_fixture["input"]])
     df = _create_child_summary(child_report)
     assert df.to_dict(orient="records") == [single_test_fixture["output"]]
+
+
+def test_child_summary_groups():
+    child_report = pd.DataFrame(
+        [
+            {
+                "CHILD": child,
+                "Table": "Episodes",
+                "RowID": row_id,
+                "Code": code,
+                "Context": context,
+                "Fields": fields,
+                "Description": "A bad error",
+                "Child Error Count": 1,
+                "Error Type Count": 1,
+            }
+            for child, row_id, code, context, fields in [
+                ("A", 0, "E1", {"F1": 1, "DECOM": "01/01/2021"}, ["F2", "F1"]),
+                ("B", 1, "E1", {"F1": float("nan"), "F2": "V2"}, ["F2", "F1"]),
+                ("C", 2, "E2", {"F1": "V1", "REVIEW": None}, ["F3"]),
+                ("D", 3, "E1", {"F1": 2, "DECOM": "02/01/2021"}, ["F2", "F1"]),
+            ]
+        ]
+    )
+    df = _create_child_summary(child_report)
+    assert df["Affected Values"].tolist() == ["F1: 1", "F2: V2, F1: nan", "", "F1: 2"]
+    assert df["Locator Hints"].tolist() == [
+        "DECOM: 01/01/2021",
+        "",
+        "REVIEW: None",
+        "DECOM: 02/01/2021",
+    ]
+
+
+def _report(errors):
+    episodes = pd.DataFrame(
+        {
+            "CHILD": ["A", "B", "C"],
+            "DECOM": ["01/01/2021", "02/01/2021", "03/01/2021"],
+            "ERR_E1": errors,
+        },
+        dtype=object,
+    )
+    registry = {
+        "E1": RuleDefinition(
+            code="E1", func=lambda dfs: {}, message="A bad error", affected_fields=[]
+        )
+    }
+    return Report({"Episodes": episodes, "metadata": {}}, registry)
+
+
+def test_report_context_only_for_errors():
+    report = _report(errors=[True, float("nan"), float("nan")]).report
+
+    assert report["Context"][0] == {"DECOM": "01/01/2021"}
+    assert report["Context"][1:].isna().all()
+
+
+def test_excel_report_split_sheets():
+    report = _report(errors=[True, True, True])
+
+    file = BytesIO()
+    report.excel_report(file, max_rows_per_sheet=2)
+    file.seek(0)
+    wb = load_workbook(file)
+
+    assert wb.sheetnames == ["Error Summary", "Child Summary", "Child Summary 2"]
+    children = [
+        row[0]
+        for sheet in wb.worksheets[1:]
+        for row in sheet.iter_rows(min_row=2, values_only=True)
+    ]
+    assert children == ["A", "B", "C"]
+    assert [list(sheet.tables) for sheet in wb.worksheets[1:]] == [
+        ["ChildSummary"],
+        ["ChildSummary2"],
+    ]
+
+    with pytest.raises(ValueError):
+        report.excel_report(BytesIO(), max_rows_per_sheet=0)
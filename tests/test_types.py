@@ -1,4 +1,6 @@
-from lac_validator.rule_engine import RuleDefinition
+import pandas as pd
+
+from lac_validator.rule_engine import RuleDefinition, code_list_rule
 
 
 def test_ruledefinition():
@@ -12,3 +14,32 @@ def test_ruledefinition():
     assert rule.code == "203"
     assert rule.message == "Test error"
     assert rule.affected_fields == ["SOME_FIELD"]
+
+
+def test_code_list_rule():
+    validate = code_list_rule(
+        code="999",
+        module=__name__,
+        table="AD1",
+        field="SEX_ADOPTR",
+        codes=["M1", "F1"],
+    )
+    rule = validate.rule
+    assert rule.code == "999"
+    assert rule.tables == ["AD1"]
+    assert rule.affected_fields == ["SEX_ADOPTR"]
+    assert rule.func.__module__ == __name__
+
+    ad1 = pd.DataFrame({"SEX_ADOPTR": ["M1", "MM", pd.NA, "F1"]}, index=[3, 2, 1, 0])
+    assert validate({"AD1": ad1}) == {"AD1": [2, 1]}
+    assert validate({}) == {}
+
+    validate = code_list_rule(
+        code="999",
+        module=__name__,
+        table="AD1",
+        field="SEX_ADOPTR",
+        codes=["M1", "F1"],
+        allow_null=True,
+    )
+    assert validate({"AD1": ad1}) == {"AD1": [2]}
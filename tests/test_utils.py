@@ -1,8 +1,18 @@
+import json
+import pickle
+
 import pandas as pd
 import pytest
 
 from lac_validator.rule_engine import RuleDefinition
-from lac_validator.rules.ruleset_utils import get_year_ruleset
+from lac_validator.rules.ruleset_utils import (
+    MANIFEST_DIR,
+    LazyRuleFunction,
+    build_manifest,
+    get_year_ruleset,
+    load_manifest,
+    write_manifest,
+)
 from lac_validator.utils import (
     add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER,
     add_col_to_tables_CONTINUOUSLY_LOOKED_AFTER,
@@ -18,6 +28,54 @@ def test_get_year_ruleset():
     assert isinstance(list(registry.values())[1], RuleDefinition)
 
 
+@pytest.mark.parametrize("ruleset", ["lac2022_23", "lac2023_24", "lac2024_25"])
+def test_manifest_matches_registry(ruleset):
+    """
+    If this fails, the rules have changed since the manifest was saved.
+    Regenerate it with `python -m lac_validator manifest -r <ruleset>`.
+    """
+    with open(MANIFEST_DIR / f"{ruleset}.json", "rt", encoding="utf-8") as f:
+        saved = json.load(f)
+    expected = build_manifest(ruleset)
+    # covers every field of every rule, and the order of the rules
+    assert saved == expected
+
+    manifest = load_manifest(ruleset)
+    rules = {rule["code"]: rule for rule in expected["rules"]}
+    assert list(manifest) == list(rules)
+    for code, rule in manifest.items():
+        assert rule.message == rules[code]["message"]
+        assert rule.affected_fields == rules[code]["affected_fields"]
+        assert rule.tables == rules[code]["tables"]
+        assert rule.optional_tables == rules[code]["optional_tables"]
+        assert rule.whole_dataset == rules[code]["whole_dataset"]
+        assert rule.func.__module__ == rules[code]["module"]
+
+
+def test_load_manifest(tmp_path):
+    write_manifest("lac2022_23", tmp_path)
+    registry = load_manifest("lac2022_23", tmp_path)
+    rule = registry["101"]
+
+    assert isinstance(rule.func, LazyRuleFunction)
+    assert rule.func.__module__ == "lac_validator.rules.lac2022_23.rule_101"
+    # the rule file is imported when the rule is run
+    header = pd.DataFrame({"SEX": ["1", "2", "3"]})
+    assert rule.func({"Header": header}) == {"Header": [2]}
+    # and again after the rule has been sent to another process
+    assert pickle.loads(pickle.dumps(rule.func))({"Header": header}) == {"Header": [2]}
+
+    # a manifest edited by hand no longer matches its checksum
+    manifest_path = tmp_path / "lac2022_23.json"
+    manifest_path.write_text(
+        manifest_path.read_text().replace(
+            '"whole_dataset": true', '"whole_dataset": false'
+        )
+    )
+    with pytest.raises(ValueError):
+        load_manifest("lac2022_23", tmp_path)
+
+
 def test_add_col_to_episodes_CONTINUOUSLY_LOOKED_AFTER():
     collection_start = "01/04/1980"
     collection_end = "31/03/1981"